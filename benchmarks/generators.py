@@ -0,0 +1,132 @@
+"""
+Synthetic world generators for benchmarks.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Annotated, ClassVar
+
+from pydantic import PrivateAttr
+
+from relative_world.actor import Actor
+from relative_world.event import Event
+from relative_world.location import Location
+from relative_world.world import RelativeWorld
+
+
+class SyntheticEvent(Event):
+    type: str = "SYNTHETIC"
+    value: int = 0
+
+
+class SyntheticActor(Actor):
+    """
+    An actor that emits a `SyntheticEvent` with a fixed probability each tick.
+    """
+
+    event_rate: float = 0.0
+    seed: int = 0
+    emitted: ClassVar[int] = 0
+    _random: Annotated[random.Random | None, PrivateAttr()] = None
+
+    def model_post_init(self, __context):
+        super().model_post_init(__context)
+        self._random = random.Random(self.seed)
+
+    async def act(self):
+        if self._random.random() < self.event_rate:
+            SyntheticActor.emitted += 1
+            yield SyntheticEvent(value=self.seed)
+
+
+class SyntheticListener(SyntheticActor):
+    """
+    A synthetic actor that also consumes every `SyntheticEvent` delivered to it.
+    """
+
+    received: int = 0
+    handled_event_types = (SyntheticEvent,)
+
+    async def handle_event(self, entity, event):
+        self.received += 1
+
+
+@dataclass(frozen=True)
+class WorldShape:
+    """
+    Describes a synthetic world.
+
+    Attributes
+    ----------
+    locations : int
+        The number of top-level locations.
+    degree : int
+        The number of connections from each location to other random locations.
+    actors_per_location : int
+        The number of actors placed in each location.
+    public_ratio : float
+        The fraction of locations whose events bubble up to the world.
+    listener_ratio : float
+        The fraction of actors that handle synthetic events.
+    event_rate : float
+        The probability that an actor emits an event on a given tick.
+    seed : int
+        The seed for every random choice, so equal shapes generate equal worlds.
+    """
+
+    locations: int = 10
+    degree: int = 2
+    actors_per_location: int = 10
+    public_ratio: float = 0.5
+    listener_ratio: float = 0.1
+    event_rate: float = 0.1
+    seed: int = 0
+
+    @property
+    def entity_count(self) -> int:
+        return 1 + self.locations * (1 + self.actors_per_location)
+
+
+def generate_world(shape: WorldShape) -> RelativeWorld:
+    """
+    Builds a world with the given shape.
+
+    Parameters
+    ----------
+    shape : WorldShape
+        The shape to generate.
+
+    Returns
+    -------
+    RelativeWorld
+        The generated world.
+    """
+    rng = random.Random(shape.seed)
+    world = RelativeWorld(name="benchmark")
+    locations = []
+    for index in range(shape.locations):
+        location = Location(
+            name=f"location-{index}", private=rng.random() >= shape.public_ratio
+        )
+        world.add_location(location)
+        locations.append(location)
+        for actor_index in range(shape.actors_per_location):
+            actor_class = (
+                SyntheticListener
+                if rng.random() < shape.listener_ratio
+                else SyntheticActor
+            )
+            location.add_entity(
+                actor_class(
+                    name=f"actor-{index}-{actor_index}",
+                    event_rate=shape.event_rate,
+                    seed=rng.getrandbits(32),
+                )
+            )
+    if len(locations) > 1:
+        for location in locations:
+            for _ in range(shape.degree):
+                other = rng.choice(locations)
+                if other is not location:
+                    world.connect_locations(location.id, other.id)
+    return world
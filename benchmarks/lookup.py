@@ -0,0 +1,70 @@
+"""
+Compares recursive `Entity.find_by_id` against the `RelativeWorld` id index.
+
+Run with ``python -m benchmarks.lookup``.
+"""
+
+import asyncio
+import random
+import time
+
+from relative_world.actor import Actor
+from relative_world.entity import Entity
+from relative_world.location import Location
+from relative_world.world import RelativeWorld
+
+
+def build_world(depth: int, fanout: int, actors_per_leaf: int) -> RelativeWorld:
+    world = RelativeWorld()
+    frontier = [world]
+    for _ in range(depth):
+        next_frontier = []
+        for parent in frontier:
+            for _ in range(fanout):
+                location = Location()
+                if parent is world:
+                    world.add_location(location)
+                else:
+                    parent.add_entity(location)
+                next_frontier.append(location)
+        frontier = next_frontier
+    for leaf in frontier:
+        for _ in range(actors_per_leaf):
+            leaf.add_entity(Actor())
+    return world
+
+
+async def time_lookups(lookup, ids) -> float:
+    start = time.perf_counter()
+    for entity_id in ids:
+        await lookup(entity_id)
+    return (time.perf_counter() - start) / len(ids)
+
+
+async def main():
+    print(f"{'depth':>5} {'entities':>9} {'recursive (us)':>15} {'indexed (us)':>13}")
+    for depth, fanout, actors_per_leaf in [
+        (1, 10, 10),
+        (1, 100, 100),
+        (2, 10, 100),
+        (3, 10, 20),
+        (4, 10, 10),
+    ]:
+        world = build_world(depth, fanout, actors_per_leaf)
+        ids = random.sample(
+            list(world._entity_index), k=min(200, len(world._entity_index))
+        )
+
+        async def recursive(entity_id):
+            return await Entity.find_by_id(world, entity_id)
+
+        recursive_cost = await time_lookups(recursive, ids)
+        indexed_cost = await time_lookups(world.find_by_id, ids)
+        print(
+            f"{depth:>5} {len(world._entity_index):>9} "
+            f"{recursive_cost * 1e6:>15.1f} {indexed_cost * 1e6:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
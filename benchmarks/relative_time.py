@@ -0,0 +1,41 @@
+"""
+Compares scalar and batched relative time formatting.
+
+Run with ``python -m benchmarks.relative_time``. Requires numpy.
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from relative_world.time import time_as_relative_string, times_as_relative_strings
+
+
+def main(size: int = 10_000, seed: int = 0):
+    rng = random.Random(seed)
+    end = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    starts = [
+        end - timedelta(seconds=rng.randint(-3 * 365 * 86400, 3 * 365 * 86400))
+        for _ in range(size)
+    ]
+    epochs = np.array([start.timestamp() for start in starts])
+    end_epoch = end.timestamp()
+    assert times_as_relative_strings(starts, end) == [
+        time_as_relative_string(start, end) for start in starts
+    ]
+
+    cases = {
+        "scalar": lambda: [time_as_relative_string(start, end) for start in starts],
+        "batch datetimes": lambda: times_as_relative_strings(starts, end),
+        "batch epochs": lambda: times_as_relative_strings(epochs, end_epoch),
+    }
+    print(f"{'formatting':<16} {'us/time':>8}")
+    for name, run in cases.items():
+        cost = min(timeit.repeat(run, number=10, repeat=3)) / 10 / size
+        print(f"{name:<16} {cost * 1e6:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
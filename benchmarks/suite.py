@@ -0,0 +1,214 @@
+"""
+Scalability benchmarks for relative_world with regression budgets.
+
+Run with ``python -m benchmarks.suite``. Each scenario generates a synthetic world,
+measures step latency, throughput, event rate, memory and a few hot operations, then
+compares the results with ``benchmarks/baselines.json``. Any metric that is worse than
+its baseline by more than the tolerance is reported as a regression and the process
+exits with status 1. Pass ``--update-baseline`` to record new baselines.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.generators import (
+    SyntheticActor,
+    SyntheticEvent,
+    SyntheticListener,
+    WorldShape,
+    generate_world,
+)
+from relative_world.location import Location
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+SCENARIOS = {
+    "1k": WorldShape(locations=20, actors_per_location=49),
+    "10k": WorldShape(locations=100, actors_per_location=99),
+    "100k": WorldShape(locations=500, actors_per_location=199),
+    "1m": WorldShape(locations=2000, actors_per_location=499),
+}
+
+# Metrics where a larger value is better; every other metric is a cost.
+HIGHER_IS_BETTER = {"steps_per_sec", "events_per_sec"}
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure_steps(shape: WorldShape, steps: int) -> dict[str, float]:
+    world = generate_world(shape)
+    await world.step()
+    SyntheticActor.emitted = 0
+    latencies = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        await world.step()
+        latencies.append(time.perf_counter() - start)
+    total = sum(latencies)
+    return {
+        "step_p50_ms": percentile(latencies, 0.50) * 1e3,
+        "step_p95_ms": percentile(latencies, 0.95) * 1e3,
+        "step_p99_ms": percentile(latencies, 0.99) * 1e3,
+        "step_mean_ms": statistics.fmean(latencies) * 1e3,
+        "steps_per_sec": steps / total,
+        "events_per_sec": SyntheticActor.emitted / total,
+    }
+
+
+async def measure_memory(shape: WorldShape) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        world = generate_world(shape)
+        await world.step()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del world
+    return {"peak_memory_mb": peak / 2**20}
+
+
+async def measure_operations(shape: WorldShape, repeats: int = 200) -> dict[str, float]:
+    population = shape.actors_per_location
+    crowded_a = Location(name="crowded-a")
+    crowded_b = Location(name="crowded-b")
+    start = time.perf_counter()
+    for index in range(population):
+        crowded_a.add_actor(SyntheticActor(name=f"resident-{index}"))
+    add_actor_us = (time.perf_counter() - start) / max(population, 1) * 1e6
+    for index in range(population):
+        crowded_b.add_actor(SyntheticListener(name=f"listener-{index}"))
+
+    mover = SyntheticActor(name="mover")
+    crowded_a.add_actor(mover)
+    start = time.perf_counter()
+    for index in range(repeats):
+        mover.location = crowded_b if index % 2 == 0 else crowded_a
+    move_us = (time.perf_counter() - start) / repeats * 1e6
+
+    event = SyntheticEvent()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        await crowded_b.handle_event(crowded_b, event)
+    handle_event_us = (time.perf_counter() - start) / repeats * 1e6
+
+    return {
+        "add_actor_us": add_actor_us,
+        "actor_move_us": move_us,
+        "handle_event_us": handle_event_us,
+    }
+
+
+async def run_scenario(shape: WorldShape, steps: int, memory: bool) -> dict[str, float]:
+    results = {"entities": shape.entity_count}
+    results.update(await measure_steps(shape, steps))
+    results.update(await measure_operations(shape))
+    if memory:
+        results.update(await measure_memory(shape))
+    return results
+
+
+def compare(
+    name: str,
+    results: dict[str, float],
+    baseline: dict[str, float] | None,
+    tolerance: float,
+) -> list[str]:
+    """
+    Prints a scenario's results next to its baseline and returns the regressed metrics.
+    """
+    regressions = []
+    print(f"\n== {name} ({int(results['entities'])} entities)")
+    print(f"{'metric':<18} {'baseline':>12} {'current':>12} {'change':>9}")
+    for metric, value in results.items():
+        if metric == "entities":
+            continue
+        expected = (baseline or {}).get(metric)
+        if expected is None or expected == 0:
+            print(f"{metric:<18} {'-':>12} {value:>12.3f} {'':>9}")
+            continue
+        change = (value - expected) / expected
+        worse = -change if metric in HIGHER_IS_BETTER else change
+        flag = ""
+        if worse > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(f"{name}.{metric}")
+        print(f"{metric:<18} {expected:>12.3f} {value:>12.3f} {change:>+8.0%}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--scenarios",
+        default="1k,10k",
+        help=f"Comma separated scenarios to run, or 'all'. Available: {', '.join(SCENARIOS)}.",
+    )
+    parser.add_argument(
+        "--steps", type=int, default=10, help="Measured steps per scenario."
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE_PATH,
+        help="Baseline file to compare with.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown before a metric fails.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline.",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the tracemalloc memory pass."
+    )
+    args = parser.parse_args(argv)
+
+    names = list(SCENARIOS) if args.scenarios == "all" else args.scenarios.split(",")
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+
+    baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = []
+    for name in names:
+        results = asyncio.run(
+            run_scenario(SCENARIOS[name], args.steps, memory=not args.no_memory)
+        )
+        regressions += compare(name, results, baselines.get(name), args.tolerance)
+        if args.update_baseline:
+            baselines[name] = results
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaselines written to {args.baseline}")
+        return 0
+    if regressions:
+        print(
+            f"\nPERFORMANCE REGRESSION in {len(regressions)} metric(s): {', '.join(regressions)}"
+        )
+        return 1
+    print("\nAll metrics within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
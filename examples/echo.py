@@ -28,7 +28,8 @@ async def echo_handler(source, event):
 
 async def main():
     # Create the world with the current UTC time as the simulation start time
-    world = RelativeWorld(simulation_start_time=utcnow())
+    # One simulated second passes per wall second
+    world = RelativeWorld(simulation_start_time=utcnow(), time_scale=1.0)
 
     # Create an event producer (OlYeller)
     ol_yeller = OlYeller(name="Ol' Yeller")
@@ -41,12 +42,9 @@ async def main():
     # Set the event handler for StatementEvent
     echo_actor.set_event_handler(StatementEvent, echo_handler)
 
-    # Run the simulation loop
-    while True:
-        # Update the world, which processes events
-        await world.step()
-        # Sleep for 1 second before the next update
-        await asyncio.sleep(1)
+    # Run the simulation, which processes events once per second
+    async for _ in world.run():
+        pass
 
 
 if __name__ == "__main__":
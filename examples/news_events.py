@@ -3,7 +3,7 @@ import random
 import asyncio
 
 from relative_world.actor import Actor
-from relative_world.event import Event
+from relative_world.event import CoalesceRule, Event
 from relative_world.location import Location
 from relative_world.time import utcnow
 from relative_world.world import RelativeWorld
@@ -23,8 +23,10 @@ class NewsEvent(Event):
         type (str): The type of the event, set to "NEWS".
         headline (str): The headline of the news.
         content (str): The content of the news.
+        coalesce (CoalesceRule): Repeats of a story within a tick travel as one event.
     """
 
+    coalesce = CoalesceRule(key=lambda event: (event.headline, event.content))
     type: str = "NEWS"
     headline: str
     content: str
@@ -123,6 +125,7 @@ class NewsReader(Actor):
     """
 
     name: str
+    handled_event_types = (NewsEvent,)
 
     async def handle_event(self, entity, event):
         """
@@ -144,7 +147,7 @@ async def main():
     Main function to set up the world, locations, actors, and run the simulation.
     """
     # Create the world
-    world = RelativeWorld(name="World", simulation_start_time=utcnow())
+    world = RelativeWorld(name="World", simulation_start_time=utcnow(), time_scale=1.0)
     logging.debug("Created RelativeWorld")
 
     # Create locations
@@ -175,14 +178,14 @@ async def main():
     # Create someone to read the news
     informed_citizen = NewsReader(name="Informed Citizen")
     world.add_actor(informed_citizen)
-    informed_citizen.location = oregon  # they won't see the news from Oregon because it doesn't propagate
+    informed_citizen.location = (
+        oregon  # they won't see the news from Oregon because it doesn't propagate
+    )
     logging.debug("Added Informed Citizen to New York")
 
     # Run the simulation
-    while True:
-        logging.debug("Updating world")
-        await world.step()
-        await asyncio.sleep(1)
+    async for source, event in world.run():
+        logging.debug("%s reached the top of the world from %s", event, source.name)
 
 
 if __name__ == "__main__":
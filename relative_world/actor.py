@@ -1,14 +1,30 @@
 import asyncio
 import uuid
-from typing import Annotated, AsyncIterator
+from typing import TYPE_CHECKING, Annotated, AsyncIterator, ClassVar, Iterable
 
-from pydantic import PrivateAttr, computed_field
+from pydantic import PrivateAttr, computed_field, model_serializer
 
+from relative_world.components import ComponentField, component_dtype
 from relative_world.entity import Entity, BoundEvent
 from relative_world.event import Event
 from relative_world.location import Location
 from relative_world.world import RelativeWorld
 
+if TYPE_CHECKING:
+    from relative_world.components import ComponentStore
+
+
+def _set_component_attribute(self: "Actor", name: str, value):
+    store = (
+        self.__pydantic_private__.get("_components")
+        if self.__pydantic_private__
+        else None
+    )
+    if store is not None and name in self.component_fields:
+        store.set(self, name, value)
+    else:
+        Entity.__setattr__(self, name, value)
+
 
 class Actor(Entity):
     """
@@ -20,6 +36,12 @@ class Actor(Entity):
         The world in which the actor exists.
     location_id : uuid.UUID
         The unique identifier for the actor's location.
+    priority : int
+        How important the actor's actions are. Actors below the world's `deferred_priority`
+        skip `act` while it is set.
+    component_fields : tuple[str, ...]
+        Numeric fields kept in the world's `ComponentStore` once components are enabled.
+        Reading and assigning them works the same either way.
 
     Parameters
     ----------
@@ -31,6 +53,32 @@ class Actor(Entity):
 
     _world: Annotated[RelativeWorld | None, PrivateAttr()] = None
     location_id: uuid.UUID | None = None
+    priority: int = 0
+    component_fields: ClassVar[tuple[str, ...]] = ()
+    _acts_in_batches: ClassVar[bool] = False
+    _components: Annotated["ComponentStore | None", PrivateAttr()] = None
+    _in_batch: Annotated[bool, PrivateAttr()] = False
+    _transient_attributes = Entity._transient_attributes | {
+        "_world",
+        "_components",
+        "_in_batch",
+    }
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._acts_in_batches = cls.act_batch.__func__ is not Actor.act_batch.__func__
+        for name in cls.component_fields:
+            field = cls.model_fields.get(name)
+            if field is None:
+                raise TypeError(
+                    f"{cls.__name__}.component_fields names unknown field {name!r}"
+                )
+            component_dtype(field)
+            setattr(cls, name, ComponentField(name, field))
+        if cls.component_fields:
+            # Only classes with component fields pay for routing attribute writes to the store.
+            cls.__setattr__ = _set_component_attribute
 
     def __init__(self, *, world=None, **data):
         """
@@ -46,6 +94,17 @@ class Actor(Entity):
         super().__init__(**data)
         self._world = world
 
+    def __getstate__(self):
+        if self._components is not None:
+            self._components.sync(self)
+        return super().__getstate__()
+
+    @model_serializer(mode="wrap")
+    def _serialize_components(self, handler):
+        if self._components is not None:
+            self._components.sync(self)
+        return handler(self)
+
     @computed_field
     @property
     def world(self) -> RelativeWorld | None:
@@ -94,16 +153,48 @@ class Actor(Entity):
         """
         Sets the location of the actor within the world.
 
+        The actor is detached from its previous parent by `add_entity`.
+
         Parameters
         ----------
         value : Location
             The new location for the actor.
         """
-        if self.location:
-            self.location.remove_entity(self)
         self.location_id = value.id
         value.add_entity(self)
 
+    def _bind_world(self, world):
+        """
+        Records the world the actor was attached to.
+
+        Parameters
+        ----------
+        world : RelativeWorld
+            The world that indexed the actor.
+        """
+        self._world = world
+        if self.component_fields and world._components is not None:
+            world._components.bind(self)
+        if self._acts_in_batches:
+            world._batch_actors.setdefault(self.__class__, {})[self.id] = self
+            self._in_batch = True
+            self._refresh_idle()
+
+    def _is_idle(self) -> bool:
+        if not self._in_batch:
+            return super()._is_idle()
+        if self._propagation_queue or self._child_events:
+            return False
+        return self._dormant or not self._awake
+
+    def _deferred(self) -> bool:
+        world = self._world
+        return (
+            world is not None
+            and world._defer_below is not None
+            and self.priority < world._defer_below
+        )
+
     async def update(self) -> AsyncIterator[BoundEvent]:
         """
         Updates the actor's state and propagates events.
@@ -117,9 +208,15 @@ class Actor(Entity):
         AsyncIterator[BoundEvent]
             An iterator of `BoundEvent` instances representing the events that should be propagated.
         """
-        async for event in aiter(self.act()):
-            if self.should_propagate_event(event):
-                yield self, event
+        if not self._in_batch and not self._dormant and not self._deferred():
+            if not self._acts_in_batches:
+                async for event in aiter(self.act()):
+                    if self.should_propagate_event(event):
+                        yield self, event
+            else:
+                for source, event in await self.act_batch([self]):
+                    if source.should_propagate_event(event):
+                        yield source, event
         async for bound_event in super().update():
             yield bound_event
 
@@ -137,3 +234,28 @@ class Actor(Entity):
         """
         for _ in range(0):
             yield
+
+    @classmethod
+    async def act_batch(cls, actors: list["Actor"]) -> Iterable[tuple["Actor", Event]]:
+        """
+        Performs the actions of many actors of this class at once.
+
+        Override this instead of `act` to handle a whole population in one call, for example
+        with vectorized code. The world calls it once per class per tick with every instance
+        that would act in that tick, and the events are then propagated from their source
+        actors as if each actor had yielded them from `act`. Instances outside a world are
+        passed on their own. By default each actor's `act` is run in turn.
+
+        Parameters
+        ----------
+        actors : list[Actor]
+            The instances to act for.
+
+        Returns
+        -------
+        Iterable[tuple[Actor, Event]]
+            Each produced event with the actor that produced it.
+        """
+        return [
+            (actor, event) for actor in actors async for event in aiter(actor.act())
+        ]
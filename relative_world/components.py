@@ -0,0 +1,333 @@
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from pydantic.fields import FieldInfo
+
+from relative_world.optional import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from relative_world.entity import Entity
+
+DEFAULT_CAPACITY = 1024
+
+_DTYPES = {bool: "bool", int: "int64", float: "float64"}
+
+
+def component_dtype(field: FieldInfo) -> str:
+    """
+    Returns the NumPy dtype a model field is stored as.
+
+    Parameters
+    ----------
+    field : FieldInfo
+        A field annotated as ``bool``, ``int`` or ``float``.
+
+    Returns
+    -------
+    str
+        The dtype name.
+    """
+    dtype = _DTYPES.get(field.annotation)
+    if dtype is None:
+        raise TypeError(
+            f"Component fields must be bool, int or float, not {field.annotation!r}"
+        )
+    return dtype
+
+
+class ComponentField:
+    """
+    A data descriptor that reads and writes a model field in its entity's component store,
+    when the entity is bound to one, and in the model otherwise.
+
+    Accessed on the class, it returns the field's definition, so subclasses inherit the field
+    unchanged.
+    """
+
+    __slots__ = ("name", "field")
+
+    def __init__(self, name: str, field: FieldInfo):
+        self.name = name
+        self.field = field
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.field
+        store = instance.__pydantic_private__.get("_components")
+        if store is None:
+            return instance.__dict__[self.name]
+        return store.get(instance, self.name)
+
+    def __set__(self, instance, value):
+        store = instance.__pydantic_private__.get("_components")
+        if store is None:
+            instance.__dict__[self.name] = value
+        else:
+            store.set(instance, self.name, value)
+
+
+class ComponentStore:
+    """
+    Keeps numeric actor fields in NumPy columns, one row per bound entity.
+
+    Each field name is one column, shared by every entity class that declares it, with a
+    mask of the rows that have it. Rows of entities that leave the store are reused. Systems
+    read and update whole columns at once, for example::
+
+        hunger, fed = store.column("hunger"), store.mask("hunger")
+        hunger[fed] += 1
+
+    Columns are reallocated when the store grows, so systems should fetch them on every call
+    rather than keep them.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initializes an empty store.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The number of rows allocated up front.
+        """
+        self._np = import_numpy("ComponentStore")
+        self._capacity = max(capacity, 1)
+        self._size = 0
+        self._columns: dict[str, "np.ndarray"] = {}
+        self._present: dict[str, "np.ndarray"] = {}
+        self._rows: dict[uuid.UUID, int] = {}
+        self._entities: list["Entity | None"] = []
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, entity: "Entity") -> bool:
+        row = self._rows.get(entity.id)
+        return row is not None and self._entities[row] is entity
+
+    def declare(self, name: str, dtype: str):
+        """
+        Adds a column. Declaring an existing column with the same dtype does nothing.
+
+        Parameters
+        ----------
+        name : str
+            The field name.
+        dtype : str
+            The NumPy dtype of the column.
+        """
+        np = self._np
+        column = self._columns.get(name)
+        if column is not None:
+            if column.dtype != np.dtype(dtype):
+                raise TypeError(
+                    f"Component {name!r} is already stored as {column.dtype}, not {dtype}"
+                )
+            return
+        self._columns[name] = np.zeros(self._capacity, dtype)
+        self._present[name] = np.zeros(self._capacity, bool)
+
+    def _grow(self):
+        np = self._np
+        capacity = self._capacity * 2
+        for columns in (self._columns, self._present):
+            for name, column in columns.items():
+                grown = np.zeros(capacity, column.dtype)
+                grown[: self._capacity] = column
+                columns[name] = grown
+        self._capacity = capacity
+
+    def bind(self, entity: "Entity"):
+        """
+        Moves an entity's component fields into the store. Binding a bound entity does nothing.
+
+        Parameters
+        ----------
+        entity : Entity
+            An entity with `component_fields`.
+        """
+        if entity in self:
+            return
+        fields = entity.__class__.model_fields
+        for name in entity.component_fields:
+            self.declare(name, component_dtype(fields[name]))
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._size == self._capacity:
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._entities.append(None)
+        values = entity.__dict__
+        for name in entity.component_fields:
+            self._columns[name][row] = values[name]
+            self._present[name][row] = True
+        self._rows[entity.id] = row
+        self._entities[row] = entity
+        entity.__pydantic_private__["_components"] = self
+
+    def release(self, entity: "Entity"):
+        """
+        Moves an entity's component fields back into the entity. Releasing an entity that is
+        not bound does nothing.
+
+        Parameters
+        ----------
+        entity : Entity
+            A bound entity.
+        """
+        if entity not in self:
+            return
+        self.sync(entity)
+        row = self._rows.pop(entity.id)
+        for present in self._present.values():
+            present[row] = False
+        self._entities[row] = None
+        self._free.append(row)
+        entity.__pydantic_private__["_components"] = None
+
+    def sync(self, entity: "Entity"):
+        """
+        Copies the stored values of a bound entity into its model, for serialization.
+
+        Parameters
+        ----------
+        entity : Entity
+            A bound entity.
+        """
+        row = self._rows[entity.id]
+        values = entity.__dict__
+        for name in entity.component_fields:
+            values[name] = self._columns[name][row].item()
+
+    def get(self, entity: "Entity", name: str) -> Any:
+        """
+        Reads one stored field.
+
+        Parameters
+        ----------
+        entity : Entity
+            A bound entity.
+        name : str
+            The field name.
+
+        Returns
+        -------
+        Any
+            The value as a Python scalar.
+        """
+        return self._columns[name][self._rows[entity.id]].item()
+
+    def set(self, entity: "Entity", name: str, value: Any):
+        """
+        Writes one stored field.
+
+        Parameters
+        ----------
+        entity : Entity
+            A bound entity.
+        name : str
+            The field name.
+        value : Any
+            The new value, converted to the column's dtype.
+
+        Raises
+        ------
+        ValueError
+            If a float with a fractional part is written to an integer column, which would
+            otherwise be truncated.
+        """
+        column = self._columns[name]
+        if (
+            isinstance(value, float)
+            and column.dtype.kind == "i"
+            and not value.is_integer()
+        ):
+            raise ValueError(
+                f"Cannot store {value!r} in integer component field {name!r}"
+            )
+        column[self._rows[entity.id]] = value
+
+    def row(self, entity: "Entity") -> int:
+        """
+        Returns the row of a bound entity.
+
+        Parameters
+        ----------
+        entity : Entity
+            A bound entity.
+
+        Returns
+        -------
+        int
+            The entity's index into every column.
+        """
+        return self._rows[entity.id]
+
+    def entity(self, row: int) -> "Entity | None":
+        """
+        Returns the entity stored in a row.
+
+        Parameters
+        ----------
+        row : int
+            An index into the columns.
+
+        Returns
+        -------
+        Entity | None
+            The entity, or None if the row is free.
+        """
+        return self._entities[row] if row < self._size else None
+
+    def column(self, name: str) -> "np.ndarray":
+        """
+        Returns a writable view of a column over every row in use.
+
+        Parameters
+        ----------
+        name : str
+            The field name.
+
+        Returns
+        -------
+        np.ndarray
+            The values; rows without the field, see `mask`, hold zeros.
+        """
+        return self._columns[name][: self._size]
+
+    def mask(self, name: str) -> "np.ndarray":
+        """
+        Returns which rows hold a field.
+
+        Parameters
+        ----------
+        name : str
+            The field name.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array aligned with `column`.
+        """
+        return self._present[name][: self._size]
+
+    def has(self, name: str) -> bool:
+        """
+        Whether a column has been declared.
+
+        Parameters
+        ----------
+        name : str
+            The field name.
+
+        Returns
+        -------
+        bool
+            True once an entity with the field has been bound.
+        """
+        return name in self._columns
@@ -1,17 +1,293 @@
-import asyncio
+import copy
 import logging
+import os
 import uuid
-from typing import AsyncIterator, Annotated, Type, Callable
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Annotated,
+    Awaitable,
+    Iterable,
+    Iterator,
+    Type,
+    Callable,
+    ClassVar,
+)
 
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import AfterValidator, BaseModel, Field, PrivateAttr, field_serializer
 
-from relative_world.event import Event
+from relative_world.event import Event, coalesce_events
+from relative_world.queues import OverflowPolicy, QueueLimit
+from relative_world.scheduler import DEFAULT_SCHEDULER, TickScheduler
+
+if TYPE_CHECKING:
+    from relative_world.history import EventHistory
+    from relative_world.instrumentation import Instrumentation
+    from relative_world.journal import EventJournal
+    from relative_world.timers import Timer
 
 logger = logging.getLogger(__name__)
 
 type BoundEvent = tuple[Entity, Event]
 
 
+class ChildList:
+    """
+    The children of an entity, keyed by id and kept in insertion order.
+
+    Membership tests, appends and removals take constant time and compare entities by
+    identity, so they never fall back to pydantic's field-by-field equality. The container
+    supports the list API and entities serialize it as a list. Positional access is served
+    from a list of the children that is rebuilt after each change, and positional inserts and
+    removals take linear time. A child appears at most once: adding a present child again
+    does nothing, and inserting it moves it.
+
+    Once it belongs to an entity, every mutation goes through the entity's `add_entity` and
+    `remove_entity`, so children added or removed either way are linked into the tree the
+    same way.
+    """
+
+    __slots__ = ("_items", "_owner", "_order")
+
+    def __init__(self, children: Iterable["Entity"] = ()):
+        """
+        Initializes the container.
+
+        Args:
+            children (Iterable[Entity]): The initial children, in order.
+        """
+        self._items: dict[uuid.UUID, Entity] = {}
+        self._owner: Entity | None = None
+        self._order: list[Entity] | None = None
+        for child in children:
+            self._add(child)
+
+    def _bind(self, owner: "Entity"):
+        """
+        Makes the container route its mutations through the entity that holds it.
+        """
+        self._owner = owner
+
+    def _add(self, child: "Entity"):
+        """
+        Stores a child without linking it to the owner.
+        """
+        existing = self._items.get(child.id)
+        if existing is None:
+            self._items[child.id] = child
+            self._order = None
+        elif existing is not child:
+            raise ValueError(f"Another entity with id {child.id} is already a child")
+
+    def _discard(self, child: "Entity"):
+        """
+        Forgets a child without unlinking it from the owner.
+        """
+        if self._items.get(child.id) is child:
+            del self._items[child.id]
+            self._order = None
+
+    def _move(self, child: "Entity", index: int):
+        """
+        Moves a present child to a position.
+        """
+        order = [entity for entity in self._items.values() if entity is not child]
+        order.insert(index, child)
+        self._items = {entity.id: entity for entity in order}
+        self._order = order
+
+    def _sequence(self) -> list["Entity"]:
+        """
+        Returns the children as a list, rebuilt only after a change. The list must not be modified.
+        """
+        order = self._order
+        if order is None:
+            order = self._order = list(self._items.values())
+        return order
+
+    def append(self, child: "Entity"):
+        """
+        Adds a child at the end. Appending a child that is already present does nothing.
+
+        Args:
+            child (Entity): The child to add.
+
+        Raises:
+            ValueError: If a different entity with the same id is already present.
+        """
+        existing = self._items.get(child.id)
+        if existing is not None and existing is not child:
+            raise ValueError(f"Another entity with id {child.id} is already a child")
+        if self._owner is None:
+            self._add(child)
+        else:
+            self._owner.add_entity(child)
+
+    def extend(self, children: Iterable["Entity"]):
+        """
+        Adds several children at the end.
+
+        Args:
+            children (Iterable[Entity]): The children to add.
+        """
+        for child in children:
+            self.append(child)
+
+    def insert(self, index: int, child: "Entity"):
+        """
+        Adds a child before a position, or moves it there if it is already present.
+
+        Args:
+            index (int): The position, interpreted like `list.insert`.
+            child (Entity): The child to add.
+
+        Raises:
+            ValueError: If a different entity with the same id is already present.
+        """
+        length = len(self._items)
+        if index < 0:
+            index = max(length + index, 0)
+        index = min(index, length)
+        if child in self:
+            if self._sequence().index(child) < index:
+                index -= 1
+        else:
+            self.append(child)
+        self._move(child, index)
+
+    def pop(self, index: int = -1) -> "Entity":
+        """
+        Removes and returns the child at a position.
+
+        Args:
+            index (int): The position, the last child by default.
+
+        Returns:
+            Entity: The removed child.
+
+        Raises:
+            IndexError: If there is no child at the position.
+        """
+        if not self._items:
+            raise IndexError("pop from empty ChildList")
+        child = self._sequence()[index]
+        self.remove(child)
+        return child
+
+    def index(self, child: "Entity", start: int = 0, stop: int | None = None) -> int:
+        """
+        Returns the position of a child.
+
+        Args:
+            child (Entity): The child to find, compared by identity.
+            start (int): The first position to search.
+            stop (int | None): The position to stop before.
+
+        Returns:
+            int: The position of the child.
+
+        Raises:
+            ValueError: If the child is not present within the range.
+        """
+        if child in self:
+            order = self._sequence()
+            for position in range(*slice(start, stop).indices(len(order))):
+                if order[position] is child:
+                    return position
+        raise ValueError(f"{child} is not a child")
+
+    def remove(self, child: "Entity"):
+        """
+        Removes a child.
+
+        Args:
+            child (Entity): The child to remove.
+
+        Raises:
+            ValueError: If the child is not present.
+        """
+        if child not in self:
+            raise ValueError(f"{child} is not a child")
+        if self._owner is None:
+            self._discard(child)
+        else:
+            self._owner.remove_entity(child)
+
+    def get(self, entity_id: uuid.UUID) -> "Entity | None":
+        """
+        Finds a child by id.
+
+        Args:
+            entity_id (UUID): The id of the child.
+
+        Returns:
+            Entity | None: The child, or None if there is no child with that id.
+        """
+        return self._items.get(entity_id)
+
+    def clear(self):
+        """
+        Removes every child.
+        """
+        for child in list(self._items.values()):
+            self.remove(child)
+
+    def __iadd__(self, children: Iterable["Entity"]) -> "ChildList":
+        self.extend(children)
+        return self
+
+    def __contains__(self, child) -> bool:
+        return isinstance(child, Entity) and self._items.get(child.id) is child
+
+    def __iter__(self) -> Iterator["Entity"]:
+        return iter(self._items.values())
+
+    def __reversed__(self) -> Iterator["Entity"]:
+        return reversed(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._sequence()[index]
+
+    def __setitem__(self, index: int, child: "Entity"):
+        if isinstance(index, slice):
+            raise TypeError("ChildList does not support slice assignment")
+        position = range(len(self._items))[index]
+        replaced = self._sequence()[position]
+        if replaced is child:
+            return
+        existing = self._items.get(child.id)
+        if existing is not None and existing is not replaced:
+            raise ValueError(f"Another entity with id {child.id} is already a child")
+        self.remove(replaced)
+        self.insert(position, child)
+
+    def __delitem__(self, index):
+        removed = self._sequence()[index]
+        for child in removed if isinstance(index, slice) else (removed,):
+            self.remove(child)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ChildList):
+            other = list(other)
+        if isinstance(other, list):
+            return list(self._items.values()) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return ChildList, (list(self._items.values()),)
+
+    def __repr__(self) -> str:
+        return f"ChildList({list(self._items.values())!r})"
+
+
 class Entity(BaseModel):
     """
     Entity is a base class for all entities in the simulation.
@@ -19,18 +295,172 @@ class Entity(BaseModel):
     Attributes:
         name (str | None): The name of the entity.
         id (UUID): The unique identifier for the entity.
-        children (list[Entity]): A list of child entities.
+        children (ChildList): The child entities, in order. Assigning a list converts it.
         _propagation_queue (list[BoundEvent]): A list of events staged for production.
+        _child_events (list[BoundEvent]): Events produced for children outside the update, such
+            as by `Actor.act_batch`, processed in the next update as if the children yielded
+            them.
+        _queue_limit (QueueLimit | None): The bound on `_propagation_queue`, if any.
         _event_handlers (dict[Type[Event], Callable[['Entity', Event], None]]): A dictionary of event handlers.
+        _parent (Entity | None): The entity this entity was added to, if any.
+        _subscriptions (dict[Type[Event] | None, int]): How many entities in this subtree,
+            including this one, handle each event type. The ``None`` key counts entities that
+            handle every event.
+        _dormant (bool): Whether the entity sleeps until one of its wake conditions is met.
+        _wake_types (tuple[Type[Event], ...]): Event types that wake the entity when delivered
+            to it.
+        _wake_at (datetime | None): The simulation time at which the entity wakes.
+        _awake (dict[UUID, Entity]): The children that have work to do, in the order they are
+            updated.
+        _idle (bool): Whether the parent can skip the entity's update.
+        handled_event_types (tuple[Type[Event], ...] | None): Event types handled by an
+            overridden `handle_event` or `handle_event_batch`. Subclasses that override either
+            without declaring them receive every event.
     """
 
+    handled_event_types: ClassVar[tuple[Type[Event], ...] | None] = None
+    _transient_attributes: ClassVar[frozenset[str]] = frozenset(
+        {"_parent", "_receiver_cache", "_awake", "_idle"}
+    )
+
     name: str | None = None
     id: Annotated[uuid.UUID, Field(default_factory=uuid.uuid4)]
-    children: list["Entity"] = []
+    children: Annotated[list["Entity"], AfterValidator(ChildList)] = []
     _propagation_queue: Annotated[list[BoundEvent], PrivateAttr()] = []
+    _child_events: Annotated[list[BoundEvent], PrivateAttr()] = []
+    _queue_limit: Annotated[QueueLimit | None, PrivateAttr()] = None
     _event_handlers: Annotated[
         dict[Type[Event], Callable[["Entity", Event], None]], PrivateAttr()
     ] = {}
+    _parent: Annotated["Entity | None", PrivateAttr()] = None
+    _subscriptions: Annotated[dict[Type[Event] | None, int], PrivateAttr()] = {}
+    _receiver_cache: Annotated[dict[Type[Event], list["Entity"]], PrivateAttr()] = {}
+    _dormant: Annotated[bool, PrivateAttr()] = False
+    _wake_types: Annotated[tuple[Type[Event], ...], PrivateAttr()] = ()
+    _wake_at: Annotated[datetime | None, PrivateAttr()] = None
+    _awake: Annotated[dict[uuid.UUID, "Entity"], PrivateAttr()] = {}
+    _idle: Annotated[bool, PrivateAttr()] = False
+
+    def model_post_init(self, __context):
+        """
+        Seeds the entity's subscriptions and links children passed at construction time.
+        """
+        cls = self.__class__
+        if (
+            cls.handle_event is not Entity.handle_event
+            or cls.handle_event_batch is not Entity.handle_event_batch
+        ):
+            handled = cls.handled_event_types
+            for event_type in (None,) if handled is None else handled:
+                self._subscriptions[event_type] = 1
+        if not isinstance(self.children, ChildList) or self.children._owner is not None:
+            self.__dict__["children"] = ChildList(self.children)
+        self.children._bind(self)
+        for child in self.children:
+            self._attach(child)
+        self._refresh_idle()
+
+    def __setattr__(self, name, value):
+        if name == "children":
+            for child in self.children:
+                self._detach(child)
+            children = ChildList(value)
+            for child in children:
+                if child._parent is not None and child._parent is not self:
+                    child._parent.remove_entity(child)
+            super().__setattr__(name, children)
+            children._bind(self)
+            for child in children:
+                self._attach(child)
+        else:
+            super().__setattr__(name, value)
+
+    def __getstate__(self):
+        """
+        Returns the pickled state of the entity without links back into the surrounding tree.
+
+        Returns:
+            dict: The pickled state.
+        """
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private:
+            transient = self._transient_attributes
+            state["__pydantic_private__"] = {
+                name: value for name, value in private.items() if name not in transient
+            }
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores a pickled entity and relinks its children to it.
+
+        Args:
+            state (dict): The pickled state.
+        """
+        super().__setstate__(state)
+        if self.__pydantic_private__ is not None:
+            for name in self._transient_attributes:
+                if name not in self.__pydantic_private__:
+                    self.__pydantic_private__[name] = self.__private_attributes__[
+                        name
+                    ].get_default()
+        if not isinstance(self.children, ChildList):
+            self.__dict__["children"] = ChildList(self.children)
+        self.children._bind(self)
+        for child in self.children:
+            child._parent = self
+            if not child._idle:
+                self._awake[child.id] = child
+        self._idle = self._is_idle()
+
+    def __copy__(self):
+        """
+        Returns a shallow copy of the entity, detached from the tree.
+
+        The copy lists the same children in a container of its own; they stay attached to this
+        entity until they are added to the copy.
+
+        Returns:
+            Entity: The copy.
+        """
+        copied = super().__copy__()
+        private = copied.__pydantic_private__
+        if private is not None:
+            for name in self._transient_attributes:
+                private[name] = self.__private_attributes__[name].get_default()
+            private["_subscriptions"] = dict(self._subscriptions)
+        copied.__dict__["children"] = children = ChildList(self.children)
+        children._bind(copied)
+        for child in children:
+            if not child._idle:
+                copied._awake[child.id] = child
+        copied._idle = copied._is_idle()
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None):
+        """
+        Returns a deep copy of the entity and its subtree, detached from the tree.
+
+        Like pickling, the copy leaves out the links to the entity's parent and world, so
+        copying one entity never copies its surroundings.
+
+        Args:
+            memo (dict[int, Any] | None): The objects already copied, by id.
+
+        Returns:
+            Entity: The copy, with its copied children linked to it.
+        """
+        memo = {} if memo is None else memo
+        cls = self.__class__
+        copied = cls.__new__(cls)
+        memo[id(self)] = copied
+        copied.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return copied
+
+    @field_serializer("children", mode="wrap")
+    def _serialize_children(self, children: ChildList, handler):
+        return handler(list(children))
 
     def __str__(self):
         """
@@ -73,8 +503,54 @@ class Entity(BaseModel):
             event_handler (Callable[['Entity', Event], None]): The event handler function.
         """
         logger.debug(f"Setting event handler for {event_type}")
+        if event_type not in self._event_handlers:
+            self._change_subscription(event_type, 1)
         self._event_handlers[event_type] = event_handler
 
+    def limit_queue(
+        self,
+        capacity: int | None,
+        overflow: OverflowPolicy = "drop_oldest",
+        directory: str | os.PathLike | None = None,
+    ) -> QueueLimit | None:
+        """
+        Bounds the events the entity stages for propagation, replacing any previous bound.
+
+        At most `capacity` events leave the entity per tick; see `QueueLimit` for the overflow
+        policies. Limiting a location bounds what it passes up from everything inside it.
+
+        Args:
+            capacity (int | None): The most events propagated per tick, or None to remove the
+                limit. Removing a spilling limit puts its spilled events back in the queue.
+            overflow (OverflowPolicy): What happens to events beyond the capacity.
+            directory (str | os.PathLike | None): Where the ``"spill"`` policy writes events.
+
+        Returns:
+            QueueLimit | None: The new limit, whose counters report dropped and spilled events.
+        """
+        previous = self._queue_limit
+        self._queue_limit = (
+            None if capacity is None else QueueLimit(capacity, overflow, directory)
+        )
+        if previous is not None:
+            self._propagation_queue = previous.release() + self._propagation_queue
+        if self._queue_limit is not None and len(self._propagation_queue) > capacity:
+            self._trim_queue()
+        self._refresh_idle()
+        return self._queue_limit
+
+    def _trim_queue(self):
+        """
+        Applies the queue limit to `_propagation_queue` and reports dropped events.
+        """
+        limit = self._queue_limit
+        dropped = limit.dropped
+        self._propagation_queue = limit.trim(self._propagation_queue)
+        if limit.dropped > dropped:
+            instrumentation = self.get_instrumentation()
+            if instrumentation is not None:
+                instrumentation.record_dropped(self, limit.dropped - dropped)
+
     def clear_event_handler(
         self,
         event_type: Type[Event],
@@ -87,6 +563,76 @@ class Entity(BaseModel):
         """
         logger.debug(f"Clearing event handler for {event_type}")
         self._event_handlers.pop(event_type)
+        self._change_subscription(event_type, -1)
+
+    def _change_subscription(self, event_type: Type[Event] | None, delta: int):
+        """
+        Adjusts the subscription count for an event type on the entity and its ancestors.
+
+        Args:
+            event_type (Type[Event] | None): The subscribed event type, or None for every event.
+            delta (int): The change in the number of subscribers.
+        """
+        entity = self
+        while entity is not None:
+            entity._add_subscriptions({event_type: delta})
+            entity = entity._parent
+
+    def _add_subscriptions(
+        self, subscriptions: dict[Type[Event] | None, int], sign: int = 1
+    ):
+        """
+        Merges subscription counts into the entity's own counts.
+
+        Args:
+            subscriptions (dict[Type[Event] | None, int]): The counts to merge.
+            sign (int): 1 to add the counts, -1 to subtract them.
+        """
+        self._receiver_cache.clear()
+        own = self._subscriptions
+        for event_type, count in subscriptions.items():
+            remaining = own.get(event_type, 0) + sign * count
+            if remaining > 0:
+                own[event_type] = remaining
+            else:
+                own.pop(event_type, None)
+
+    def is_subscribed(self, event_type: Type[Event]) -> bool:
+        """
+        Determines if the entity or any of its descendants handles an event type.
+
+        Args:
+            event_type (Type[Event]): The type of event being delivered.
+
+        Returns:
+            bool: True if delivering the event to this subtree can reach a handler.
+        """
+        subscriptions = self._subscriptions
+        if not subscriptions:
+            return False
+        if None in subscriptions:
+            return True
+        return any(cls in subscriptions for cls in event_type.__mro__)
+
+    def get_event_receivers(self, bound_event: BoundEvent) -> list["Entity"]:
+        """
+        Selects the children an event handled by this entity is delivered to.
+
+        Args:
+            bound_event (BoundEvent): A tuple containing the source entity and the event.
+
+        Returns:
+            list[Entity]: The children whose subtree subscribes to the event's type. The list is
+            cached until a subscription below the entity changes and must not be modified.
+        """
+        event_type = bound_event[1].__class__
+        cache = self._receiver_cache
+        receivers = cache.get(event_type)
+        if receivers is None:
+            receivers = cache[event_type] = [
+                child for child in self.children if child.is_subscribed(event_type)
+            ]
+        return receivers
 
     async def handle_event(self, entity, event: Event):
         """
@@ -97,13 +643,66 @@ class Entity(BaseModel):
             event (Event): The event to handle.
         """
         logger.debug(f"%s received event %s", self.id, event)
+        if self._dormant and self._wake_types and isinstance(event, self._wake_types):
+            self.wake()
+        instrumentation = self.get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.record_received(self)
         handler = self._event_handlers.get(event.__class__)
         if handler:
             logger.debug(f"Handling event {event} with handler {handler}")
-            await handler(entity, event)
-        for child in self.children[::]:
+            if instrumentation is None:
+                await handler(entity, event)
+            else:
+                start = perf_counter()
+                await handler(entity, event)
+                instrumentation.record_handler(self, perf_counter() - start)
+        for child in self.get_event_receivers((entity, event)):
             await child.handle_event(entity, event)
 
+    async def handle_event_batch(self, batch: list[BoundEvent]):
+        """
+        Handles a tick's worth of events that have been propagated to the entity.
+
+        Each receiving child gets a single call with the events addressed to it, in order.
+        Entities that override `handle_event` but not this method have it called once per event.
+
+        Args:
+            batch (list[BoundEvent]): The source entities and events to handle.
+        """
+        if self._dormant and self._wake_types:
+            wake_types = self._wake_types
+            if any(isinstance(event, wake_types) for _, event in batch):
+                self.wake()
+        if self.__class__.handle_event is not Entity.handle_event:
+            for entity, event in batch:
+                await self.handle_event(entity, event)
+            return
+        logger.debug(f"%s received %d events", self.id, len(batch))
+        instrumentation = self.get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.record_received(self, len(batch))
+        handlers = self._event_handlers
+        if handlers:
+            for entity, event in batch:
+                handler = handlers.get(event.__class__)
+                if handler:
+                    if instrumentation is None:
+                        await handler(entity, event)
+                    else:
+                        start = perf_counter()
+                        await handler(entity, event)
+                        instrumentation.record_handler(self, perf_counter() - start)
+        receivers: dict[uuid.UUID, tuple[Entity, list[BoundEvent]]] = {}
+        for bound_event in batch:
+            for child in self.get_event_receivers(bound_event):
+                receiver = receivers.get(child.id)
+                if receiver is None:
+                    receiver = receivers[child.id] = (child, [])
+                receiver[1].append(bound_event)
+        for child, child_batch in receivers.values():
+            await child.handle_event_batch(child_batch)
+
     async def find_by_id(self, entity_id: uuid.UUID) -> "Entity":
         """
         Finds an entity by its unique identifier.
@@ -128,34 +727,119 @@ class Entity(BaseModel):
 
     async def update(self) -> AsyncIterator[BoundEvent]:
         logger.debug(f"Updating entity {self.id}")
-        event_producers = self.children[::]
+        if not self._awake and not self._child_events:
+            async for event in self.pop_event_batch_iterator():
+                yield event
+            self._refresh_idle()
+            return
+        async for event in self._update_children(list(self._awake.values())):
+            yield event
+        self._refresh_idle()
+
+    async def _update_children(
+        self,
+        event_producers: list["Entity"],
+        arrivals: Callable[[], Awaitable[list[BoundEvent]]] | None = None,
+        on_delivered: Callable[[list[BoundEvent]], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[BoundEvent]:
+        """
+        Runs the entity's part of a tick: updates the given children, routes the events they
+        produced, delivers the ones the entity handles and pops the ones that propagate.
+
+        Args:
+            event_producers (list[Entity]): The children to update.
+            arrivals (Callable[[], Awaitable[list[BoundEvent]]] | None): Collects events produced
+                below the entity but outside this process, after the children have run. They are
+                routed like events of the entity's own children.
+            on_delivered (Callable[[list[BoundEvent]], Awaitable[None]] | None): Called with the
+                batch the entity handled, after it was delivered.
+
+        Yields:
+            AsyncIterator[BoundEvent]: The events that propagate past the entity.
+        """
+        child_events = self._child_events
+        self._child_events = []
+        handled: list[BoundEvent] = []
+        instrumentation = self.get_instrumentation()
+        journal = self.get_journal()
+        history = self.get_history()
+
+        def accept(producer, event_source, event):
+            logger.debug(f"Child entity {producer.id} produced event {event}")
+            if instrumentation is not None:
+                instrumentation.record_emitted(producer)
+            if journal is not None and event_source is producer:
+                journal.record(event_source, event)
+            if history is not None and event_source is producer:
+                history.record(event_source, event)
+            if self.should_propagate_event((event_source, event)) is not False:
+                self.emit_event(event, source=event_source)
+            else:
+                handled.append((event_source, event))
 
         async def process_producer(producer):
             logger.debug(f"Processing child entity {producer.id}")
             async for event_source, event in producer.update():
-                logger.debug(f"Child entity {producer.id} produced event {event}")
-                if self.should_propagate_event((event_source, event)) is not False:
-                    self.emit_event(event, source=event_source)
-                else:
-                    await self.handle_event(event_source, event)
+                accept(producer, event_source, event)
+
+        async def process_producer_timed(producer):
+            start = perf_counter()
+            await process_producer(producer)
+            instrumentation.record_update(producer, perf_counter() - start)
+
+        for event_source, event in child_events:
+            accept(event_source, event_source, event)
+
+        await self.get_scheduler().run(
+            self,
+            event_producers,
+            process_producer if instrumentation is None else process_producer_timed,
+        )
 
-        await asyncio.gather(*(process_producer(producer) for producer in event_producers))
+        if arrivals is not None:
+            for event_source, event in await arrivals():
+                accept(event_source, event_source, event)
+
+        if handled:
+            handled = coalesce_events(handled)
+            if journal is not None:
+                journal.record_delivery(
+                    self if self._parent is not None else None, handled
+                )
+            await self.handle_event_batch(handled)
+            if on_delivered is not None:
+                await on_delivered(handled)
 
         async for event in self.pop_event_batch_iterator():
             yield event
 
     async def pop_event_batch_iterator(self) -> AsyncIterator[BoundEvent]:
         """
-        Pops the batch of staged events for production.
+        Pops the batch of staged events for production, with duplicates collapsed according
+        to their classes' `Event.coalesce` rules.
 
         Yields:
             AsyncIterator[BoundEvent]: An iterator of tuples containing the entity and the event.
         """
         logger.debug(f"Popping event batch for entity {self.id}")
+        limit = self._queue_limit
+        if limit is not None and self._propagation_queue:
+            self._trim_queue()
+            self._propagation_queue = limit.prioritize(self._propagation_queue)
         staged_events_for_production, self._propagation_queue = (
             self._propagation_queue,
-            [],
+            [] if limit is None else limit.refill(),
         )
+        if staged_events_for_production:
+            instrumentation = self.get_instrumentation()
+            if instrumentation is not None:
+                instrumentation.record_queue_depth(
+                    self, len(staged_events_for_production)
+                )
+            if len(staged_events_for_production) > 1:
+                staged_events_for_production = coalesce_events(
+                    staged_events_for_production
+                )
         for event in staged_events_for_production[::]:
             yield event
 
@@ -169,17 +853,214 @@ class Entity(BaseModel):
         """
         logger.info(f"%s emitted %s", self.id, event)
         self._propagation_queue.append((source or self, event))
+        limit = self._queue_limit
+        if limit is not None and len(self._propagation_queue) >= 2 * limit.capacity:
+            self._trim_queue()
+        if self._idle:
+            self._refresh_idle()
+
+    @property
+    def dormant(self) -> bool:
+        """
+        Whether the entity is sleeping.
+
+        Returns:
+            bool: True between `sleep` and the next wake-up.
+        """
+        return self._dormant
+
+    def sleep(self, until: datetime | None = None, wake_on: Iterable[Type[Event]] = ()):
+        """
+        Stops updating the entity and its descendants until a wake condition is met.
+
+        A sleeping entity still receives the events it subscribes to, and events it emits are
+        still propagated, but its parent skips its `update`, so an actor's `act` is not called.
+        The entity wakes when `wake` is called, when a simulation time deadline passes, or when
+        an event of one of the `wake_on` types is delivered to it.
+
+        Args:
+            until (datetime | None): The simulation time to wake at. Deadlines are only tracked
+                for entities that belong to a world.
+            wake_on (Iterable[Type[Event]]): Event types that wake the entity. The entity subscribes
+                to them while it sleeps.
+        """
+        if self._dormant:
+            self.wake()
+        self._dormant = True
+        self._wake_at = until
+        self._wake_types = tuple(wake_on)
+        for event_type in self._wake_types:
+            self._change_subscription(event_type, 1)
+        if until is not None:
+            self._schedule_wake(self)
+        self._refresh_idle()
+
+    def wake(self):
+        """
+        Resumes updating a sleeping entity from the next tick on.
+        """
+        if not self._dormant:
+            return
+        for event_type in self._wake_types:
+            self._change_subscription(event_type, -1)
+        self._dormant = False
+        self._wake_at = None
+        self._wake_types = ()
+        self._refresh_idle()
+
+    def _is_idle(self) -> bool:
+        """
+        Determines if updating the entity this tick would do nothing.
+
+        Returns:
+            bool: True if the entity sleeps, or if it uses the default `update` and neither it
+            nor any child has work to do, and no staged events are waiting.
+        """
+        if self._propagation_queue or self._child_events:
+            return False
+        if self._dormant:
+            return True
+        return not self._awake and self.__class__.update is Entity.update
+
+    def _refresh_idle(self):
+        """
+        Recomputes whether the entity can be skipped and updates its parent's awake children.
+        """
+        idle = self._is_idle()
+        if idle == self._idle:
+            return
+        self._idle = idle
+        parent = self._parent
+        if parent is not None:
+            if idle:
+                parent._awake.pop(self.id, None)
+            else:
+                parent._awake[self.id] = self
+            parent._refresh_idle()
+
+    def call_later(
+        self, delay: timedelta | int, callback: Callable[..., Any], *args
+    ) -> "Timer":
+        """
+        Calls a function after some simulation time, using the timer wheel of the world
+        the entity belongs to.
+
+        Args:
+            delay (timedelta | int): The simulation time, or the number of ticks, to wait.
+            callback (Callable): The function to call. Coroutine functions are awaited.
+            *args: The arguments to call it with.
+
+        Returns:
+            Timer: A handle whose `cancel` removes the call.
+
+        Raises:
+            RuntimeError: If the entity does not belong to a world.
+        """
+        if self._parent is None:
+            raise RuntimeError(
+                f"{self} must belong to a RelativeWorld to schedule timers"
+            )
+        return self._parent.call_later(delay, callback, *args)
+
+    def schedule_event(self, delay: timedelta | int, event: Event) -> "Timer":
+        """
+        Emits an event from the entity after some simulation time.
+
+        The event enters the normal propagation pipeline in the tick it falls due in.
+
+        Args:
+            delay (timedelta | int): The simulation time, or the number of ticks, to wait.
+            event (Event): The event to emit.
+
+        Returns:
+            Timer: A handle whose `cancel` drops the event.
+        """
+        return self.call_later(delay, self.emit_event, event)
+
+    def _schedule_wake(self, entity: "Entity"):
+        """
+        Asks the root of the tree to wake a sleeping entity at its deadline.
+
+        Args:
+            entity (Entity): The sleeping entity.
+        """
+        if self._parent is not None:
+            self._parent._schedule_wake(entity)
+
+    def get_root(self) -> "Entity":
+        """
+        Returns the top-most ancestor of the entity.
+
+        Returns:
+            Entity: The root of the tree the entity belongs to, or the entity itself if it has no
+            parent.
+        """
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        return root
+
+    def get_scheduler(self) -> TickScheduler:
+        """
+        Returns the scheduler used to update the entity's children.
+
+        Returns:
+            TickScheduler: The scheduler of the nearest ancestor that provides one.
+        """
+        if self._parent is not None:
+            return self._parent.get_scheduler()
+        return DEFAULT_SCHEDULER
+
+    def get_instrumentation(self) -> "Instrumentation | None":
+        """
+        Returns the instrumentation collecting measurements for the entity.
+
+        Returns:
+            Instrumentation | None: The instrumentation of the nearest ancestor that provides
+            one, if any.
+        """
+        if self._parent is not None:
+            return self._parent.get_instrumentation()
+        return None
+
+    def get_journal(self) -> "EventJournal | None":
+        """
+        Returns the journal recording the events produced below the entity.
+
+        Returns:
+            EventJournal | None: The journal of the nearest ancestor that provides one, if any.
+        """
+        if self._parent is not None:
+            return self._parent.get_journal()
+        return None
+
+    def get_history(self) -> "EventHistory | None":
+        """
+        Returns the history store keeping the events produced below the entity.
+
+        Returns:
+            EventHistory | None: The history of the nearest ancestor that provides one, if any.
+        """
+        if self._parent is not None:
+            return self._parent.get_history()
+        return None
 
     def add_entity(self, child: "Entity"):
         """
         Adds a child entity to the entity.
 
+        An entity has at most one parent, so a child that is still attached elsewhere is
+        removed from its previous parent first.
+
         Args:
             child (Entity): The child entity to add.
         """
-        logger.debug(f"Adding child entity {child.id} to entity {self.id}")
+        logger.debug("Adding child entity %s to entity %s", child.id, self.id)
         if child not in self.children:
-            self.children.append(child)
+            if child._parent is not None and child._parent is not self:
+                child._parent.remove_entity(child)
+            self.children._add(child)
+            self._attach(child)
 
     def remove_entity(self, child: "Entity"):
         """
@@ -188,6 +1069,63 @@ class Entity(BaseModel):
         Args:
             child (Entity): The child entity to remove.
         """
-        logger.debug(f"Removing child entity {child.id} from entity {self.id}")
+        logger.debug("Removing child entity %s from entity %s", child.id, self.id)
         if child in self.children:
-            self.children.remove(child)
+            self.children._discard(child)
+            self._detach(child)
+
+    def _attach(self, child: "Entity"):
+        """
+        Links a child that has been placed in `children` to this entity.
+
+        Args:
+            child (Entity): The child entity.
+        """
+        child._parent = self
+        if not child._idle:
+            self._awake[child.id] = child
+        self._register_entity(child)
+        self._refresh_idle()
+
+    def _detach(self, child: "Entity"):
+        """
+        Unlinks a child that has been taken out of `children`.
+
+        Args:
+            child (Entity): The child entity.
+        """
+        if child._parent is self:
+            child._parent = None
+        self._awake.pop(child.id, None)
+        self._unregister_entity(child)
+        self._refresh_idle()
+
+    def _register_entity(self, entity: "Entity"):
+        """
+        Notifies the entity and its ancestors that a subtree has been attached below it.
+
+        Args:
+            entity (Entity): The root of the attached subtree.
+        """
+        self._add_subscriptions(entity._subscriptions)
+        if self._parent is not None:
+            self._parent._register_entity(entity)
+
+    def _unregister_entity(self, entity: "Entity"):
+        """
+        Notifies the entity and its ancestors that a subtree has been detached from below it.
+
+        Args:
+            entity (Entity): The root of the detached subtree.
+        """
+        self._add_subscriptions(entity._subscriptions, sign=-1)
+        if self._parent is not None:
+            self._parent._unregister_entity(entity)
+
+    def _bind_world(self, world):
+        """
+        Called when the entity is indexed by a world.
+
+        Args:
+            world (RelativeWorld): The world the entity now belongs to.
+        """
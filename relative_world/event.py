@@ -1,9 +1,99 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any, Callable, ClassVar, Hashable, Literal
 
 from pydantic import BaseModel, Field
 
-from relative_world.time import utcnow
+from relative_world.time import now
+
+
+@dataclass(frozen=True, slots=True)
+class CoalesceRule:
+    """
+    Describes how duplicate events of one class are collapsed when a batch of staged events is
+    popped, so that only one of them travels further.
+
+    Events are duplicates when they have the same class and the same key. The surviving event
+    takes the place of the first duplicate in the batch.
+
+    Attributes:
+        key (Callable[[Event], Hashable]): Computes the dedupe key of an event.
+        merge (Callable[[Event, Event], Event] | None): Combines the surviving event with a later
+            duplicate. It must return a new event rather than modify either argument. The result
+            is attributed to the later duplicate's source. When None, `keep` picks one of the two.
+        keep (Literal["first", "last"]): Which duplicate survives, with its source, when there is
+            no `merge` function.
+        count_field (str | None): An integer field of the event class that counts how many events
+            were collapsed into the survivor. Counts are added up, so events coalesced again
+            higher up the tree keep an accurate total.
+    """
+
+    key: Callable[["Event"], Hashable]
+    merge: Callable[["Event", "Event"], "Event"] | None = None
+    keep: Literal["first", "last"] = "last"
+    count_field: str | None = None
+
+    def __post_init__(self):
+        if self.keep not in ("first", "last"):
+            raise ValueError(f"keep must be 'first' or 'last', not {self.keep!r}")
+
+    def combine(
+        self, kept: tuple[Any, "Event"], duplicate: tuple[Any, "Event"]
+    ) -> tuple[Any, "Event"]:
+        """
+        Collapses two duplicate events into one.
+
+        Args:
+            kept (tuple[Any, Event]): The surviving event so far, with its source.
+            duplicate (tuple[Any, Event]): A later duplicate, with its source.
+
+        Returns:
+            tuple[Any, Event]: The new surviving event with its source.
+        """
+        if self.merge is not None:
+            source, event = duplicate[0], self.merge(kept[1], duplicate[1])
+        elif self.keep == "first":
+            source, event = kept
+        else:
+            source, event = duplicate
+        if self.count_field is not None:
+            count = getattr(kept[1], self.count_field) + getattr(
+                duplicate[1], self.count_field
+            )
+            event = event.model_copy(update={self.count_field: count})
+        return source, event
+
+
+def coalesce_events[T](
+    bound_events: list[tuple[T, "Event"]],
+) -> list[tuple[T, "Event"]]:
+    """
+    Collapses duplicate events according to the `coalesce` rules of their classes.
+
+    Events without a rule are kept as they are, and the order of the batch is preserved.
+
+    Args:
+        bound_events (list[tuple[T, Event]]): Events with their sources.
+
+    Returns:
+        list[tuple[T, Event]]: The coalesced batch, or the same list if nothing was collapsed.
+    """
+    coalesced: list[tuple[T, Event]] = []
+    positions: dict[tuple[type, Hashable], int] = {}
+    for bound_event in bound_events:
+        event = bound_event[1]
+        rule = event.coalesce
+        if rule is None:
+            coalesced.append(bound_event)
+            continue
+        key = (event.__class__, rule.key(event))
+        index = positions.get(key)
+        if index is None:
+            positions[key] = len(coalesced)
+            coalesced.append(bound_event)
+        else:
+            coalesced[index] = rule.combine(coalesced[index], bound_event)
+    return bound_events if len(coalesced) == len(bound_events) else coalesced
 
 
 class Event(BaseModel):
@@ -12,8 +102,32 @@ class Event(BaseModel):
 
     Attributes:
         type (str): The type of the event.
-        created_at (datetime): The timestamp when the event was created.
+        created_at (datetime): The timestamp when the event was created, taken from the simulation
+            clock when the event is created during a tick.
+        interest_radius (int | None): How many location hops away from its source the event is
+            delivered once it reaches the world. None delivers it everywhere.
+        coalesce (CoalesceRule | None): How duplicates of the event class are collapsed before
+            they propagate from an entity or are delivered. None keeps every event.
+        propagation_priority (int): Which events a bounded queue keeps and propagates first;
+            higher goes first.
     """
 
+    coalesce: ClassVar[CoalesceRule | None] = None
+    propagation_priority: ClassVar[int] = 0
+
     type: str
-    created_at: Annotated[datetime, Field(default_factory=utcnow)]
+    created_at: Annotated[datetime, Field(default_factory=now)]
+    interest_radius: int | None = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        rule = cls.coalesce
+        if (
+            rule is not None
+            and rule.count_field is not None
+            and rule.count_field not in cls.model_fields
+        ):
+            raise TypeError(
+                f"{cls.__name__} has no field {rule.count_field!r} to count coalesced events in"
+            )
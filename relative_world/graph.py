@@ -0,0 +1,341 @@
+from array import array
+from collections.abc import Hashable, Iterable
+
+MAX_CACHED_SEARCHES = 4096
+
+
+class _Search:
+    """
+    A breadth-first search from one node that is expanded one level at a time, on demand.
+
+    Attributes
+    ----------
+    order : array
+        The visited nodes in breadth-first order.
+    level_ends : list[int]
+        For each distance, the number of visited nodes up to and including that distance.
+    parent : dict[int, int]
+        The predecessor of each visited node on a shortest path from the source.
+    complete : bool
+        Whether the whole connected component has been visited.
+    neighbourhoods : dict[int, tuple]
+        The node keys within each queried radius.
+    """
+
+    __slots__ = ("order", "level_ends", "parent", "complete", "neighbourhoods")
+
+    def __init__(self, source: int):
+        self.order = array("i", [source])
+        self.level_ends = [1]
+        self.parent = {source: -1}
+        self.complete = False
+        self.neighbourhoods = {}
+
+    def expand(self, adjacency: list[array]) -> bool:
+        """
+        Visits one more level.
+
+        Returns
+        -------
+        bool
+            True if new nodes were visited.
+        """
+        order, parent = self.order, self.parent
+        start = self.level_ends[-2] if len(self.level_ends) > 1 else 0
+        end = self.level_ends[-1]
+        for position in range(start, end):
+            node = order[position]
+            for neighbour in adjacency[node]:
+                if neighbour not in parent:
+                    parent[neighbour] = node
+                    order.append(neighbour)
+        if len(order) == end:
+            self.complete = True
+            return False
+        self.level_ends.append(len(order))
+        return True
+
+    def depth(self) -> int:
+        return len(self.level_ends) - 1
+
+
+class LocationGraph:
+    """
+    An undirected graph over hashable node keys with memoized shortest path, distance,
+    neighbourhood and connected component queries.
+
+    Nodes are mapped to dense integer indices and adjacency is kept in one `array` of neighbour
+    indices per node. Breadth-first searches are cached per source and expanded only as deep as
+    queries need. Adding an edge only drops the searches that visited one of its ends, and
+    removing a node only drops the searches that visited it, so queries in other parts of the
+    graph stay cached.
+    """
+
+    def __init__(self, edges: dict[Hashable, Iterable[Hashable]] | None = None):
+        """
+        Builds a graph from an adjacency mapping.
+
+        Parameters
+        ----------
+        edges : dict[Hashable, Iterable[Hashable]] | None, optional
+            The neighbours of each node. Every key becomes a node.
+        """
+        self._index: dict[Hashable, int] = {}
+        self._keys: list[Hashable | None] = []
+        self._free: list[int] = []
+        self._adjacency: list[array] = []
+        self._searches: dict[int, _Search] = {}
+        self._components: list[int] | None = None
+        self._members: dict[int, list[int]] = {}
+        for key in edges or ():
+            self.add_node(key)
+        for key, neighbours in (edges or {}).items():
+            for neighbour in neighbours:
+                self.connect(key, neighbour)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add_node(self, key: Hashable):
+        """
+        Adds a node without edges. Adding an existing node does nothing.
+
+        Parameters
+        ----------
+        key : Hashable
+            The node to add.
+        """
+        if key in self._index:
+            return
+        if self._free:
+            node = self._free.pop()
+            self._keys[node] = key
+        else:
+            node = len(self._keys)
+            self._keys.append(key)
+            self._adjacency.append(array("i"))
+            if self._components is not None:
+                self._components.append(-1)
+        self._index[key] = node
+        if self._components is not None:
+            self._components[node] = node
+            self._members[node] = [node]
+
+    def remove_node(self, key: Hashable):
+        """
+        Removes a node and its edges. Removing an unknown node does nothing.
+
+        Parameters
+        ----------
+        key : Hashable
+            The node to remove.
+        """
+        node = self._index.pop(key, None)
+        if node is None:
+            return
+        for neighbour in self._adjacency[node]:
+            self._adjacency[neighbour].remove(node)
+        self._adjacency[node] = array("i")
+        self._keys[node] = None
+        self._free.append(node)
+        self._drop_searches_visiting(node)
+        self._components = None
+        self._members = {}
+
+    def connect(self, key_a: Hashable, key_b: Hashable):
+        """
+        Adds an undirected edge, adding missing nodes. Existing edges are left as they are.
+
+        Parameters
+        ----------
+        key_a, key_b : Hashable
+            The nodes to connect.
+        """
+        self.add_node(key_a)
+        self.add_node(key_b)
+        a, b = self._index[key_a], self._index[key_b]
+        if a == b or b in self._adjacency[a]:
+            return
+        self._adjacency[a].append(b)
+        self._adjacency[b].append(a)
+        self._drop_searches_visiting(a, b)
+        if self._components is not None:
+            label_a, label_b = self._components[a], self._components[b]
+            if label_a != label_b:
+                if len(self._members[label_a]) < len(self._members[label_b]):
+                    label_a, label_b = label_b, label_a
+                moved = self._members.pop(label_b)
+                for node in moved:
+                    self._components[node] = label_a
+                self._members[label_a].extend(moved)
+
+    def _drop_searches_visiting(self, *nodes: int):
+        stale = [
+            source
+            for source, search in self._searches.items()
+            if any(node in search.parent for node in nodes)
+        ]
+        for source in stale:
+            del self._searches[source]
+
+    def _search(self, key: Hashable) -> _Search:
+        node = self._index[key]
+        search = self._searches.get(node)
+        if search is None:
+            if len(self._searches) >= MAX_CACHED_SEARCHES:
+                del self._searches[next(iter(self._searches))]
+            search = self._searches[node] = _Search(node)
+        return search
+
+    def neighbours(self, key: Hashable) -> list[Hashable]:
+        """
+        Lists the nodes directly connected to a node.
+
+        Parameters
+        ----------
+        key : Hashable
+            The node.
+
+        Returns
+        -------
+        list[Hashable]
+            The neighbours in the order they were connected.
+        """
+        keys = self._keys
+        return [keys[node] for node in self._adjacency[self._index[key]]]
+
+    def neighbourhood(self, key: Hashable, radius: int) -> tuple[Hashable, ...]:
+        """
+        Lists the nodes within a number of hops of a node.
+
+        Parameters
+        ----------
+        key : Hashable
+            The node to start from.
+        radius : int
+            The maximum number of hops.
+
+        Returns
+        -------
+        tuple[Hashable, ...]
+            The reachable nodes in breadth-first order, starting with `key`.
+        """
+        search = self._search(key)
+        neighbourhood = search.neighbourhoods.get(radius)
+        if neighbourhood is None:
+            while search.depth() < radius and not search.complete:
+                search.expand(self._adjacency)
+            end = search.level_ends[min(radius, search.depth())]
+            keys = self._keys
+            neighbourhood = search.neighbourhoods[radius] = tuple(
+                keys[node] for node in search.order[:end]
+            )
+        return neighbourhood
+
+    def distance(self, key_a: Hashable, key_b: Hashable) -> int | None:
+        """
+        Counts the hops on a shortest path between two nodes.
+
+        Parameters
+        ----------
+        key_a, key_b : Hashable
+            The nodes.
+
+        Returns
+        -------
+        int | None
+            The number of edges on a shortest path, or None if the nodes are not connected.
+        """
+        path = self.shortest_path(key_a, key_b)
+        return None if path is None else len(path) - 1
+
+    def shortest_path(self, key_a: Hashable, key_b: Hashable) -> list[Hashable] | None:
+        """
+        Finds a shortest path between two nodes.
+
+        Parameters
+        ----------
+        key_a, key_b : Hashable
+            The start and end nodes.
+
+        Returns
+        -------
+        list[Hashable] | None
+            The nodes on the path, including both ends, or None if they are not connected.
+        """
+        target = self._index[key_b]
+        if (
+            self._components is not None
+            and self._components[self._index[key_a]] != self._components[target]
+        ):
+            return None
+        search = self._search(key_a)
+        parent = search.parent
+        while target not in parent:
+            if search.complete or not search.expand(self._adjacency):
+                return None
+        path = []
+        node = target
+        while node != -1:
+            path.append(self._keys[node])
+            node = parent[node]
+        path.reverse()
+        return path
+
+    def _label_components(self):
+        labels = [-1] * len(self._keys)
+        members: dict[int, list[int]] = {}
+        adjacency = self._adjacency
+        for node in self._index.values():
+            if labels[node] != -1:
+                continue
+            labels[node] = node
+            component = [node]
+            for current in component:
+                for neighbour in adjacency[current]:
+                    if labels[neighbour] == -1:
+                        labels[neighbour] = node
+                        component.append(neighbour)
+            members[node] = component
+        self._components = labels
+        self._members = members
+
+    def component_of(self, key: Hashable) -> tuple[Hashable, ...]:
+        """
+        Lists the nodes connected to a node by any path.
+
+        Parameters
+        ----------
+        key : Hashable
+            The node.
+
+        Returns
+        -------
+        tuple[Hashable, ...]
+            The nodes of the node's connected component.
+        """
+        if self._components is None:
+            self._label_components()
+        keys = self._keys
+        return tuple(
+            keys[node] for node in self._members[self._components[self._index[key]]]
+        )
+
+    def components(self) -> list[tuple[Hashable, ...]]:
+        """
+        Splits the graph into connected components.
+
+        Returns
+        -------
+        list[tuple[Hashable, ...]]
+            The nodes of each component.
+        """
+        if self._components is None:
+            self._label_components()
+        keys = self._keys
+        return [
+            tuple(keys[node] for node in members) for members in self._members.values()
+        ]
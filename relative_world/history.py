@@ -0,0 +1,563 @@
+import os
+import pickle
+import tempfile
+import uuid
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Iterator, Literal, Type
+
+from relative_world.event import Event
+from relative_world.journal import event_type_name
+from relative_world.optional import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from relative_world.entity import Entity
+
+CHUNK_ROWS = 65536
+MAX_CHUNKS_IN_MEMORY = 16
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_COLUMNS = {
+    "tick": "q",
+    "timestamp": "q",
+    "source": "i",
+    "location": "i",
+    "type": "i",
+    "offset": "q",
+}
+_GROUP_COLUMNS = ("source", "location", "type")
+
+
+class _Chunk:
+    """
+    Up to `CHUNK_ROWS` consecutive history rows, held as NumPy columns or saved to disk.
+    """
+
+    __slots__ = (
+        "columns",
+        "payload",
+        "path",
+        "rows",
+        "first_tick",
+        "last_tick",
+        "first_time",
+        "last_time",
+    )
+
+    def __init__(self, columns: dict[str, "np.ndarray"], payload: bytes):
+        self.columns = columns
+        self.payload = payload
+        self.path: str | None = None
+        self.rows = len(columns["tick"])
+        self.first_tick = int(columns["tick"][0])
+        self.last_tick = int(columns["tick"][-1])
+        self.first_time = int(columns["timestamp"].min())
+        self.last_time = int(columns["timestamp"].max())
+
+    def evict(self, np, path: str):
+        np.savez(path, payload=np.frombuffer(self.payload, np.uint8), **self.columns)
+        self.path = path
+        self.columns = None
+        self.payload = None
+
+    def load(
+        self, np, names: tuple[str, ...], payload: bool = False
+    ) -> tuple[dict[str, "np.ndarray"], bytes | None]:
+        if self.columns is not None:
+            return self.columns, self.payload
+        with np.load(self.path) as data:
+            columns = {name: data[name] for name in names}
+            return columns, data["payload"].tobytes() if payload else None
+
+
+class EventHistory:
+    """
+    Keeps every event produced in a world in columnar chunks for analytics queries.
+
+    Each event becomes one row of fixed-width columns: the tick, the creation time in
+    microseconds since the epoch, codes for the source, its top-level location and the event
+    class, and the offset of the pickled event in the chunk's payload buffer. Rows are appended
+    to the open chunk and sealed into NumPy arrays every `chunk_rows` rows. Scans skip whole
+    chunks by their tick and time ranges and filter the rest with vectorized masks, and only
+    unpickle the events that are asked for.
+
+    Memory stays bounded: once more than `max_chunks_in_memory` sealed chunks are held, the
+    oldest are saved to `directory` and read back from disk when a query needs them.
+
+    Requires numpy.
+
+    Attributes
+    ----------
+    chunk_rows : int
+        The number of rows per chunk.
+    max_chunks_in_memory : int
+        How many sealed chunks are kept in memory before the oldest are evicted.
+    store_payloads : bool
+        Whether events are pickled so `events` can return them.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike | None = None,
+        chunk_rows: int = CHUNK_ROWS,
+        max_chunks_in_memory: int = MAX_CHUNKS_IN_MEMORY,
+        store_payloads: bool = True,
+        locate: Callable[["Entity"], uuid.UUID | None] | None = None,
+    ):
+        """
+        Initializes an empty history.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike | None, optional
+            Where evicted chunks are saved. Defaults to a temporary directory that is removed
+            by `close`.
+        chunk_rows : int, optional
+            The number of rows per chunk.
+        max_chunks_in_memory : int, optional
+            How many sealed chunks are kept in memory.
+        store_payloads : bool, optional
+            Whether to keep the pickled events, or only their columns.
+        locate : Callable[[Entity], uuid.UUID | None] | None, optional
+            Finds the top-level location of an event source. Without it every row has no location.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        if max_chunks_in_memory < 0:
+            raise ValueError("max_chunks_in_memory must not be negative")
+        self._np = import_numpy("EventHistory")
+        self.chunk_rows = chunk_rows
+        self.max_chunks_in_memory = max_chunks_in_memory
+        self.store_payloads = store_payloads
+        self._locate = locate
+        self._directory = os.fspath(directory) if directory is not None else None
+        self._temporary: tempfile.TemporaryDirectory | None = None
+        self._chunks: list[_Chunk] = []
+        self._evicted = 0
+        self._resident: list[_Chunk] = []
+        self._ids: dict[uuid.UUID, int] = {}
+        self._id_list: list[uuid.UUID] = []
+        self._types: dict[type, int] = {}
+        self._type_names: list[str] = []
+        self._type_codes: dict[str, int] = {}
+        self._pending: list[tuple["Entity", Event]] = []
+        self._open = {name: array(code) for name, code in _COLUMNS.items()}
+        self._open_payload = bytearray()
+
+    def __len__(self) -> int:
+        return sum(chunk.rows for chunk in self._chunks) + len(self._open["tick"])
+
+    def record(self, source: "Entity", event: Event):
+        """
+        Buffers an event until the end of the tick.
+
+        Parameters
+        ----------
+        source : Entity
+            The entity that produced the event.
+        event : Event
+            The produced event.
+        """
+        self._pending.append((source, event))
+
+    def _code(self, entity_id: uuid.UUID | None) -> int:
+        if entity_id is None:
+            return -1
+        code = self._ids.get(entity_id)
+        if code is None:
+            code = self._ids[entity_id] = len(self._id_list)
+            self._id_list.append(entity_id)
+        return code
+
+    def _type_code(self, event_type: type) -> int:
+        code = self._types.get(event_type)
+        if code is None:
+            name = event_type_name(event_type)
+            code = self._type_codes.get(name)
+            if code is None:
+                code = self._type_codes[name] = len(self._type_names)
+                self._type_names.append(name)
+            self._types[event_type] = code
+        return code
+
+    def flush(self, tick: int):
+        """
+        Appends the buffered events as rows of a tick.
+
+        Parameters
+        ----------
+        tick : int
+            The tick the buffered events were produced in.
+        """
+        if not self._pending:
+            return
+        columns = self._open
+        payload = self._open_payload
+        locate = self._locate
+        for source, event in self._pending:
+            columns["tick"].append(tick)
+            columns["timestamp"].append((event.created_at - _EPOCH) // _MICROSECOND)
+            columns["source"].append(self._code(source.id))
+            columns["location"].append(
+                self._code(locate(source)) if locate is not None else -1
+            )
+            columns["type"].append(self._type_code(event.__class__))
+            columns["offset"].append(len(payload))
+            if self.store_payloads:
+                payload += pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(columns["tick"]) >= self.chunk_rows:
+                self._seal()
+                columns = self._open
+                payload = self._open_payload
+        self._pending.clear()
+
+    def _seal(self):
+        np = self._np
+        columns = {name: np.array(values) for name, values in self._open.items()}
+        chunk = _Chunk(columns, bytes(self._open_payload))
+        self._open = {name: array(code) for name, code in _COLUMNS.items()}
+        self._open_payload = bytearray()
+        self._chunks.append(chunk)
+        self._resident.append(chunk)
+        while len(self._resident) > self.max_chunks_in_memory:
+            self._evict(self._resident.pop(0))
+
+    def _evict(self, chunk: _Chunk):
+        directory = self._directory
+        if directory is None:
+            if self._temporary is None:
+                self._temporary = tempfile.TemporaryDirectory(
+                    prefix="relative-world-history-"
+                )
+            directory = self._temporary.name
+        else:
+            os.makedirs(directory, exist_ok=True)
+        chunk.evict(self._np, os.path.join(directory, f"chunk-{self._evicted:08d}.npz"))
+        self._evicted += 1
+
+    def close(self):
+        """
+        Drops every row and removes the temporary directory of evicted chunks, if one was created.
+        """
+        self._chunks.clear()
+        self._resident.clear()
+        self._pending.clear()
+        self._open = {name: array(code) for name, code in _COLUMNS.items()}
+        self._open_payload = bytearray()
+        if self._temporary is not None:
+            self._temporary.cleanup()
+            self._temporary = None
+
+    @property
+    def memory_chunks(self) -> int:
+        """
+        The number of sealed chunks held in memory.
+
+        Returns
+        -------
+        int
+            At most `max_chunks_in_memory`.
+        """
+        return len(self._resident)
+
+    @property
+    def disk_chunks(self) -> int:
+        """
+        The number of chunks that were evicted to disk.
+
+        Returns
+        -------
+        int
+            The chunks read back from disk by queries.
+        """
+        return len(self._chunks) - len(self._resident)
+
+    def _scan(
+        self,
+        names: tuple[str, ...],
+        payload: bool,
+        start_tick: int | None,
+        end_tick: int | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        source_id: uuid.UUID | None,
+        location_id: uuid.UUID | None,
+        event_type: Type[Event] | str | None,
+    ) -> Iterator[tuple[dict[str, "np.ndarray"], bytes | None, "np.ndarray"]]:
+        """
+        Yields the columns, payload and row positions of every chunk that has matching rows.
+        """
+        np = self._np
+        start_us = (
+            (start_time - _EPOCH) // _MICROSECOND if start_time is not None else None
+        )
+        end_us = (end_time - _EPOCH) // _MICROSECOND if end_time is not None else None
+        filters = {}
+        for column, entity_id in (("source", source_id), ("location", location_id)):
+            if entity_id is not None:
+                if entity_id not in self._ids:
+                    return
+                filters[column] = self._ids[entity_id]
+        if event_type is not None:
+            name = (
+                event_type_name(event_type)
+                if isinstance(event_type, type)
+                else event_type
+            )
+            if name not in self._type_codes:
+                return
+            filters["type"] = self._type_codes[name]
+        needed = set(names) | set(filters) | {"tick", "timestamp"}
+        names = tuple(needed | {"offset"}) if payload else tuple(needed)
+
+        open_rows = len(self._open["tick"])
+        sources: list[_Chunk | None] = list(self._chunks) + (
+            [None] if open_rows else []
+        )
+        for chunk in sources:
+            if chunk is not None:
+                if start_tick is not None and chunk.last_tick < start_tick:
+                    continue
+                if end_tick is not None and chunk.first_tick >= end_tick:
+                    continue
+                if start_us is not None and chunk.last_time < start_us:
+                    continue
+                if end_us is not None and chunk.first_time >= end_us:
+                    continue
+                columns, data = chunk.load(np, names, payload)
+            else:
+                columns = {
+                    name: np.frombuffer(self._open[name], self._open[name].typecode)
+                    for name in names
+                }
+                data = bytes(self._open_payload) if payload else None
+            mask = np.ones(len(columns["tick"]), dtype=bool)
+            if start_tick is not None:
+                mask &= columns["tick"] >= start_tick
+            if end_tick is not None:
+                mask &= columns["tick"] < end_tick
+            if start_us is not None:
+                mask &= columns["timestamp"] >= start_us
+            if end_us is not None:
+                mask &= columns["timestamp"] < end_us
+            for column, code in filters.items():
+                mask &= columns[column] == code
+            rows = np.flatnonzero(mask)
+            if len(rows):
+                yield columns, data, rows
+
+    def select(
+        self,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        source_id: uuid.UUID | None = None,
+        location_id: uuid.UUID | None = None,
+        event_type: Type[Event] | str | None = None,
+    ) -> dict[str, "np.ndarray"]:
+        """
+        Returns the columns of the rows that match every given filter.
+
+        Parameters
+        ----------
+        start_tick : int | None, optional
+            The first tick to include.
+        end_tick : int | None, optional
+            The tick to stop before.
+        start_time : datetime | None, optional
+            The earliest creation time to include.
+        end_time : datetime | None, optional
+            The creation time to stop before.
+        source_id : uuid.UUID | None, optional
+            Only include events produced by this entity.
+        location_id : uuid.UUID | None, optional
+            Only include events produced inside this top-level location.
+        event_type : Type[Event] | str | None, optional
+            Only include events of exactly this class, given as a class or a qualified name.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The ``tick``, ``timestamp`` (as ``datetime64[us]``), ``source``, ``location`` and
+            ``type`` columns. Entity and type columns hold codes that `entity_ids` and
+            `type_names` translate.
+        """
+        np = self._np
+        names = ("tick", "timestamp", "source", "location", "type")
+        parts = {name: [] for name in names}
+        for columns, _, rows in self._scan(
+            names,
+            False,
+            start_tick,
+            end_tick,
+            start_time,
+            end_time,
+            source_id,
+            location_id,
+            event_type,
+        ):
+            for name in names:
+                parts[name].append(columns[name][rows])
+        result = {
+            name: np.concatenate(values) if values else np.empty(0, _COLUMNS[name])
+            for name, values in parts.items()
+        }
+        result["timestamp"] = result["timestamp"].astype("datetime64[us]")
+        return result
+
+    def entity_ids(self, codes: "np.ndarray") -> list[uuid.UUID | None]:
+        """
+        Translates the codes of a ``source`` or ``location`` column.
+
+        Parameters
+        ----------
+        codes : np.ndarray
+            Entity codes from `select`.
+
+        Returns
+        -------
+        list[uuid.UUID | None]
+            The entity ids, with None for rows without a location.
+        """
+        ids = self._id_list
+        return [ids[code] if code >= 0 else None for code in codes.tolist()]
+
+    def type_names(self, codes: "np.ndarray") -> list[str]:
+        """
+        Translates the codes of a ``type`` column.
+
+        Parameters
+        ----------
+        codes : np.ndarray
+            Event type codes from `select`.
+
+        Returns
+        -------
+        list[str]
+            The fully qualified event class names.
+        """
+        names = self._type_names
+        return [names[code] for code in codes.tolist()]
+
+    def events(
+        self,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        source_id: uuid.UUID | None = None,
+        location_id: uuid.UUID | None = None,
+        event_type: Type[Event] | str | None = None,
+    ) -> Iterator[tuple[int, uuid.UUID, Event]]:
+        """
+        Iterates the matching events, unpickling only those. Takes the filters of `select`.
+
+        Yields
+        ------
+        tuple[int, uuid.UUID, Event]
+            The tick, the source id and a copy of each event, in recording order.
+        """
+        if not self.store_payloads:
+            raise ValueError("This history does not store event payloads")
+        ids = self._id_list
+        for columns, data, rows in self._scan(
+            ("tick", "source"),
+            True,
+            start_tick,
+            end_tick,
+            start_time,
+            end_time,
+            source_id,
+            location_id,
+            event_type,
+        ):
+            offsets = columns["offset"]
+            ticks = columns["tick"]
+            sources = columns["source"]
+            for row in rows.tolist():
+                end = int(offsets[row + 1]) if row + 1 < len(offsets) else len(data)
+                yield int(ticks[row]), ids[sources[row]], pickle.loads(
+                    data[int(offsets[row]) : end]
+                )
+
+    def count_by(
+        self,
+        by: Literal["source", "location", "type"],
+        interval: timedelta | None = None,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        source_id: uuid.UUID | None = None,
+        location_id: uuid.UUID | None = None,
+        event_type: Type[Event] | str | None = None,
+    ) -> dict:
+        """
+        Counts the matching events per source, location or type, optionally per time interval.
+
+        For example, ``count_by("location", interval=timedelta(hours=1))`` counts the events of
+        each top-level location in each hour of simulation time. Takes the filters of `select`.
+
+        Parameters
+        ----------
+        by : Literal["source", "location", "type"]
+            The column to group by.
+        interval : timedelta | None, optional
+            Also group by creation time, in intervals of this length counted from the epoch.
+
+        Returns
+        -------
+        dict
+            The number of events per entity id or type name, or per ``(key, interval start)``
+            pair when `interval` is given. Events without a location are counted under None.
+        """
+        if by not in _GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {by!r}")
+        np = self._np
+        interval_us = interval // _MICROSECOND if interval is not None else None
+        if interval_us is not None and interval_us <= 0:
+            raise ValueError("interval must be positive")
+        totals: Counter = Counter()
+        for columns, _, rows in self._scan(
+            (by, "timestamp"),
+            False,
+            start_tick,
+            end_tick,
+            start_time,
+            end_time,
+            source_id,
+            location_id,
+            event_type,
+        ):
+            codes = columns[by][rows].astype(np.int64)
+            if interval_us is None:
+                unique, counts = np.unique(codes, return_counts=True)
+                totals.update(dict(zip(unique.tolist(), counts.tolist())))
+                continue
+            buckets = columns["timestamp"][rows] // interval_us
+            first = int(buckets.min())
+            span = int(buckets.max()) - first + 1
+            # Count code and bucket pairs through one packed key, offset to the chunk's buckets.
+            unique, counts = np.unique(
+                (codes + 1) * span + (buckets - first), return_counts=True
+            )
+            for key, count in zip(unique.tolist(), counts.tolist()):
+                code, bucket = divmod(key, span)
+                totals[(code - 1, first + bucket)] += count
+
+        names = self._type_names if by == "type" else self._id_list
+        result = {}
+        for key, count in totals.items():
+            if interval_us is None:
+                result[names[key] if key >= 0 else None] = count
+            else:
+                code, bucket = key
+                result[
+                    (names[code] if code >= 0 else None, _EPOCH + bucket * interval)
+                ] = count
+        return result
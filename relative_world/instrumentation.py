@@ -0,0 +1,263 @@
+import uuid
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Literal
+
+from relative_world.location import Location
+
+if TYPE_CHECKING:
+    from relative_world.entity import Entity
+
+
+@dataclass(slots=True)
+class EntityStats:
+    """
+    Measurements collected for one entity, or aggregated over a group of entities.
+
+    Attributes
+    ----------
+    key : str
+        The entity id, class name or location id the measurements belong to.
+    entity_class : str | None
+        The class name of the entity, when the stats describe a single class.
+    location_id : uuid.UUID | None
+        The nearest enclosing location below the root, if any.
+    update_time : float
+        Wall seconds spent in `update`, including the entity's descendants.
+    update_calls : int
+        How many times `update` ran.
+    handler_time : float
+        Wall seconds spent in the entity's event handlers.
+    handler_calls : int
+        How many times one of the entity's handlers ran.
+    events_emitted : int
+        Events the entity yielded to its parent.
+    events_received : int
+        Events delivered to the entity.
+    queue_high_water : int
+        The largest `_propagation_queue` observed when the entity drained it.
+    events_dropped : int
+        Events discarded because the entity's queue was full.
+    """
+
+    key: str
+    entity_class: str | None = None
+    location_id: uuid.UUID | None = None
+    update_time: float = 0.0
+    update_calls: int = 0
+    handler_time: float = 0.0
+    handler_calls: int = 0
+    events_emitted: int = 0
+    events_received: int = 0
+    queue_high_water: int = 0
+    events_dropped: int = 0
+
+    def merge(self, other: "EntityStats"):
+        """
+        Adds another set of measurements to this one.
+
+        Parameters
+        ----------
+        other : EntityStats
+            The measurements to add.
+        """
+        self.update_time += other.update_time
+        self.update_calls += other.update_calls
+        self.handler_time += other.handler_time
+        self.handler_calls += other.handler_calls
+        self.events_emitted += other.events_emitted
+        self.events_received += other.events_received
+        self.queue_high_water = max(self.queue_high_water, other.queue_high_water)
+        self.events_dropped += other.events_dropped
+
+
+def _enclosing_location_id(entity: "Entity") -> uuid.UUID | None:
+    parent = entity._parent
+    while parent is not None:
+        if isinstance(parent, Location) and parent._parent is not None:
+            return parent.id
+        parent = parent._parent
+    return None
+
+
+class Instrumentation:
+    """
+    Collects per-entity timings, event counts and queue depths during ticks.
+
+    Install it with `RelativeWorld.enable_instrumentation`. When no instrumentation is
+    installed, entities skip every measurement.
+
+    Attributes
+    ----------
+    reset_each_step : bool
+        Whether measurements are cleared at the start of every `RelativeWorld.step`.
+    steps : int
+        How many steps have been measured since the last reset.
+    step_time : float
+        Wall seconds spent in those steps.
+    """
+
+    def __init__(self, reset_each_step: bool = True):
+        """
+        Initializes a new instrumentation collector.
+
+        Parameters
+        ----------
+        reset_each_step : bool, optional
+            Whether each step starts from empty measurements.
+        """
+        self.reset_each_step = reset_each_step
+        self.steps = 0
+        self.step_time = 0.0
+        self._stats: dict[uuid.UUID, EntityStats] = {}
+
+    def reset(self):
+        """
+        Clears every measurement.
+        """
+        self.steps = 0
+        self.step_time = 0.0
+        self._stats.clear()
+
+    def stats_for(self, entity: "Entity") -> EntityStats:
+        """
+        Returns the measurements of an entity, creating them on first use.
+
+        Parameters
+        ----------
+        entity : Entity
+            The measured entity.
+
+        Returns
+        -------
+        EntityStats
+            The entity's measurements.
+        """
+        stats = self._stats.get(entity.id)
+        if stats is None:
+            stats = self._stats[entity.id] = EntityStats(
+                key=str(entity.id),
+                entity_class=entity.__class__.__name__,
+                location_id=_enclosing_location_id(entity),
+            )
+        return stats
+
+    def record_step(self, elapsed: float):
+        """
+        Records the wall time of one world step.
+        """
+        self.steps += 1
+        self.step_time += elapsed
+
+    def record_update(self, entity: "Entity", elapsed: float):
+        """
+        Records the wall time of one `update` of an entity.
+        """
+        stats = self.stats_for(entity)
+        stats.update_time += elapsed
+        stats.update_calls += 1
+
+    def record_handler(self, entity: "Entity", elapsed: float):
+        """
+        Records the wall time of one handler call on an entity.
+        """
+        stats = self.stats_for(entity)
+        stats.handler_time += elapsed
+        stats.handler_calls += 1
+
+    def record_emitted(self, entity: "Entity", count: int = 1):
+        """
+        Records events yielded by an entity to its parent.
+        """
+        self.stats_for(entity).events_emitted += count
+
+    def record_received(self, entity: "Entity", count: int = 1):
+        """
+        Records events delivered to an entity.
+        """
+        self.stats_for(entity).events_received += count
+
+    def record_queue_depth(self, entity: "Entity", depth: int):
+        """
+        Records the size of an entity's propagation queue when it is drained.
+        """
+        stats = self.stats_for(entity)
+        if depth > stats.queue_high_water:
+            stats.queue_high_water = depth
+
+    def record_dropped(self, entity: "Entity", count: int):
+        """
+        Records events discarded by an entity's bounded queue.
+        """
+        self.stats_for(entity).events_dropped += count
+
+    def get_stats(self, entity_id: uuid.UUID) -> EntityStats | None:
+        """
+        Returns the measurements of one entity.
+
+        Parameters
+        ----------
+        entity_id : uuid.UUID
+            The id of the entity.
+
+        Returns
+        -------
+        EntityStats | None
+            The measurements, or None if the entity was not measured.
+        """
+        return self._stats.get(entity_id)
+
+    def aggregate(
+        self, by: Literal["class", "location"] = "class"
+    ) -> dict[str, EntityStats]:
+        """
+        Sums the measurements of all entities by class name or by enclosing location.
+
+        Parameters
+        ----------
+        by : {"class", "location"}, optional
+            The grouping to use.
+
+        Returns
+        -------
+        dict[str, EntityStats]
+            The totals for each group. Entities outside any location are grouped under "".
+        """
+        if by not in ("class", "location"):
+            raise ValueError(f"Cannot aggregate by {by!r}")
+        totals: dict[str, EntityStats] = {}
+        for stats in self._stats.values():
+            if by == "class":
+                key = stats.entity_class
+            else:
+                key = str(stats.location_id) if stats.location_id else ""
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = EntityStats(
+                    key=key, entity_class=stats.entity_class if by == "class" else None
+                )
+            total.merge(stats)
+        return totals
+
+    def slowest(
+        self, count: int = 10, metric: str = "update_time"
+    ) -> list[EntityStats]:
+        """
+        Lists the entities with the highest value for a metric.
+
+        Parameters
+        ----------
+        count : int, optional
+            How many entities to return.
+        metric : str, optional
+            The `EntityStats` attribute to rank by.
+
+        Returns
+        -------
+        list[EntityStats]
+            The measurements, highest first.
+        """
+        if metric not in {field.name for field in fields(EntityStats)}:
+            raise ValueError(f"Unknown metric {metric!r}")
+        return sorted(
+            self._stats.values(), key=lambda stats: getattr(stats, metric), reverse=True
+        )[:count]
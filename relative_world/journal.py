@@ -0,0 +1,463 @@
+import mmap
+import os
+import pickle
+import struct
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import TYPE_CHECKING, Iterator, Type
+
+from relative_world.event import Event
+
+if TYPE_CHECKING:
+    from relative_world.entity import Entity
+    from relative_world.world import RelativeWorld
+
+MAGIC = b"RWJRNL"
+FORMAT_VERSION = 2
+
+# Record length, tick, created_at in POSIX seconds, source id, record kind, scope id and
+# type name length.
+_RECORD_HEADER = struct.Struct("<Iqd16sB16sH")
+_FILE_HEADER = MAGIC + FORMAT_VERSION.to_bytes(2, "little")
+
+_PRODUCED = 0
+_DELIVERED = 1
+_NO_SCOPE = bytes(16)
+
+
+def event_type_name(event_type: Type[Event]) -> str:
+    """
+    Returns the name an event class is journaled under.
+
+    Parameters
+    ----------
+    event_type : Type[Event]
+        The event class.
+
+    Returns
+    -------
+    str
+        The fully qualified class name.
+    """
+    return f"{event_type.__module__}.{event_type.__qualname__}"
+
+
+class EventJournal:
+    """
+    Appends every event produced in a world to a length-prefixed binary file.
+
+    Events are buffered as they are produced and written with a single call at the end of
+    each tick by `flush`. Each record holds the tick, the event's creation time, the id of its
+    source, the event class name and the pickled event.
+
+    The journal also records where events were delivered: every batch an entity handles
+    instead of propagating is written again as delivery records carrying the entity's id, so
+    `replay` can hand each batch to the same entity.
+
+    Attributes
+    ----------
+    path : str | os.PathLike
+        The journal file.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Opens a journal for appending, writing the file header if the file is new.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The journal file.
+        """
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_FILE_HEADER)
+        else:
+            with open(path, "rb") as existing:
+                header = existing.read(len(_FILE_HEADER))
+            if header != _FILE_HEADER:
+                self._file.close()
+                raise ValueError(
+                    f"{path} is not a version {FORMAT_VERSION} event journal"
+                )
+        self._pending: list[tuple[uuid.UUID, int, bytes, Event]] = []
+
+    def record(self, source: "Entity", event: Event):
+        """
+        Buffers an event until the end of the tick.
+
+        Parameters
+        ----------
+        source : Entity
+            The entity that produced the event.
+        event : Event
+            The produced event.
+        """
+        self._pending.append((source.id, _PRODUCED, _NO_SCOPE, event))
+
+    def record_delivery(
+        self, scope: "Entity | None", batch: list[tuple["Entity", Event]]
+    ):
+        """
+        Buffers a batch of events delivered to an entity until the end of the tick.
+
+        Parameters
+        ----------
+        scope : Entity | None
+            The entity that handled the batch, or None for the world.
+        batch : list[BoundEvent]
+            The delivered events with their sources.
+        """
+        scope_bytes = _NO_SCOPE if scope is None else scope.id.bytes
+        self._pending.extend(
+            (source.id, _DELIVERED, scope_bytes, event) for source, event in batch
+        )
+
+    def flush(self, tick: int):
+        """
+        Writes the buffered events as records of a tick.
+
+        Parameters
+        ----------
+        tick : int
+            The tick the buffered events were produced in.
+        """
+        if not self._pending:
+            return
+        chunks = []
+        names: dict[type, bytes] = {}
+        payloads: dict[int, bytes] = {}
+        for source_id, kind, scope, event in self._pending:
+            event_type = event.__class__
+            name = names.get(event_type)
+            if name is None:
+                name = names[event_type] = event_type_name(event_type).encode()
+            # A delivered event was usually journaled when it was produced in the same tick.
+            payload = payloads.get(id(event))
+            if payload is None:
+                payload = payloads[id(event)] = pickle.dumps(
+                    event, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            length = _RECORD_HEADER.size - 4 + len(name) + len(payload)
+            chunks.append(
+                _RECORD_HEADER.pack(
+                    length,
+                    tick,
+                    event.created_at.timestamp(),
+                    source_id.bytes,
+                    kind,
+                    scope,
+                    len(name),
+                )
+            )
+            chunks.append(name)
+            chunks.append(payload)
+        self._pending.clear()
+        self._file.write(b"".join(chunks))
+        self._file.flush()
+
+    def close(self):
+        """
+        Drops unflushed events and closes the file.
+        """
+        self._pending.clear()
+        self._file.close()
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    """
+    One journaled event.
+
+    Attributes
+    ----------
+    tick : int
+        The tick the event was produced in.
+    created_at : datetime
+        The event's creation time.
+    source_id : uuid.UUID
+        The id of the entity that produced the event.
+    event_type : str
+        The fully qualified name of the event class.
+    payload : bytes
+        The pickled event.
+    delivered : bool
+        Whether the record is a delivery rather than the event's production.
+    scope_id : uuid.UUID | None
+        For deliveries, the id of the entity that handled the event, or None for the world.
+    """
+
+    tick: int
+    created_at: datetime
+    source_id: uuid.UUID
+    event_type: str
+    payload: bytes
+    delivered: bool = False
+    scope_id: uuid.UUID | None = None
+
+    @property
+    def event(self) -> Event:
+        """
+        The journaled event, unpickled on access.
+
+        Returns
+        -------
+        Event
+            A copy of the produced event.
+        """
+        return pickle.loads(self.payload)
+
+
+class JournalReader:
+    """
+    Reads a journal through a memory map, decoding only the records that match a query.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Opens a journal for reading.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The journal file.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(_FILE_HEADER):
+            self._file.close()
+            raise ValueError(f"{path} is not an event journal")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_FILE_HEADER)] != _FILE_HEADER:
+            self.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} event journal")
+        self._tick_offsets: dict[int, int] | None = None
+
+    def __enter__(self) -> "JournalReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Releases the memory map and the file.
+        """
+        self._map.close()
+        self._file.close()
+
+    def _scan(
+        self, offset: int
+    ) -> Iterator[tuple[int, int, float, bytes, int, bytes, bytes, int, int]]:
+        """
+        Walks the record headers from an offset.
+
+        Yields the record offset, tick, timestamp, source id bytes, record kind, scope id bytes,
+        type name and the bounds of the payload. A truncated final record, left by an
+        interrupted write, is ignored.
+        """
+        data = self._map
+        end = len(data)
+        header_size = _RECORD_HEADER.size
+        while offset + header_size <= end:
+            length, tick, timestamp, source, kind, scope, name_length = (
+                _RECORD_HEADER.unpack_from(data, offset)
+            )
+            record_end = offset + 4 + length
+            if record_end > end:
+                break
+            name_start = offset + header_size
+            payload_start = name_start + name_length
+            yield offset, tick, timestamp, source, kind, scope, data[
+                name_start:payload_start
+            ], payload_start, record_end
+            offset = record_end
+
+    def tick_offsets(self) -> dict[int, int]:
+        """
+        Maps each journaled tick to the offset of its first record.
+
+        The index is built on first use by scanning the record headers.
+
+        Returns
+        -------
+        dict[int, int]
+            The offset of the first record of each tick.
+        """
+        if self._tick_offsets is None:
+            offsets = {}
+            for offset, tick, *_ in self._scan(len(_FILE_HEADER)):
+                if tick not in offsets:
+                    offsets[tick] = offset
+            self._tick_offsets = offsets
+        return self._tick_offsets
+
+    def entries(
+        self,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+        source_id: uuid.UUID | None = None,
+        event_type: Type[Event] | str | None = None,
+        delivered: bool = False,
+    ) -> Iterator[JournalEntry]:
+        """
+        Iterates the journaled events that match every given filter.
+
+        By default every event is read once, as it was produced. With `delivered`, the delivery
+        records are read instead, once for every entity that handled the event. Ticks need not
+        increase through the file: a world restored to an earlier tick appends that tick again.
+
+        Parameters
+        ----------
+        start_tick : int | None, optional
+            The first tick to include.
+        end_tick : int | None, optional
+            The tick to stop before.
+        source_id : uuid.UUID | None, optional
+            Only include events produced by this entity.
+        event_type : Type[Event] | str | None, optional
+            Only include events of exactly this class, given as a class or a qualified name.
+        delivered : bool, optional
+            Whether to read the delivery records instead of the produced events.
+
+        Yields
+        ------
+        JournalEntry
+            The matching events in the order they were written.
+        """
+        offset = len(_FILE_HEADER)
+        if start_tick is not None:
+            later = [
+                start
+                for tick, start in self.tick_offsets().items()
+                if tick >= start_tick
+            ]
+            if not later:
+                return
+            offset = min(later)
+        source_bytes = source_id.bytes if source_id is not None else None
+        if isinstance(event_type, type):
+            event_type = event_type_name(event_type)
+        type_bytes = event_type.encode() if event_type is not None else None
+        kind = _DELIVERED if delivered else _PRODUCED
+        data = self._map
+        for (
+            _,
+            tick,
+            timestamp,
+            source,
+            record_kind,
+            scope,
+            name,
+            payload_start,
+            record_end,
+        ) in self._scan(offset):
+            if record_kind != kind:
+                continue
+            if start_tick is not None and tick < start_tick:
+                continue
+            if end_tick is not None and tick >= end_tick:
+                continue
+            if source_bytes is not None and source != source_bytes:
+                continue
+            if type_bytes is not None and name != type_bytes:
+                continue
+            yield JournalEntry(
+                tick=tick,
+                created_at=datetime.fromtimestamp(timestamp, timezone.utc),
+                source_id=uuid.UUID(bytes=source),
+                event_type=name.decode(),
+                payload=data[payload_start:record_end],
+                delivered=delivered,
+                scope_id=None if scope == _NO_SCOPE else uuid.UUID(bytes=scope),
+            )
+
+    def iter_ticks(
+        self,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+        delivered: bool = False,
+    ) -> Iterator[tuple[int, list[JournalEntry]]]:
+        """
+        Groups the journaled events by tick.
+
+        Parameters
+        ----------
+        start_tick : int | None, optional
+            The first tick to include.
+        end_tick : int | None, optional
+            The tick to stop before.
+        delivered : bool, optional
+            Whether to group the delivery records instead of the produced events.
+
+        Yields
+        ------
+        tuple[int, list[JournalEntry]]
+            Each tick that produced events, with its events.
+        """
+        current, batch = None, []
+        for entry in self.entries(
+            start_tick=start_tick, end_tick=end_tick, delivered=delivered
+        ):
+            if entry.tick != current and batch:
+                yield current, batch
+                batch = []
+            current = entry.tick
+            batch.append(entry)
+        if batch:
+            yield current, batch
+
+
+async def replay(
+    world: "RelativeWorld",
+    reader: JournalReader,
+    start_tick: int | None = None,
+    end_tick: int | None = None,
+):
+    """
+    Delivers journaled events to a world again, to the entities that handled them.
+
+    Each tick's delivery records are handed, in their original batches and order, to the
+    entity that handled them, so the events reach the same listeners they reached when they
+    were journaled, including inside private locations. Combined with a snapshot taken at
+    `start_tick`, this rebuilds the state handlers derived from the events that followed.
+
+    Batches delivered to the world are delivered to `world`, which may be a different world.
+    Batches delivered to an entity that is no longer part of `world` are skipped. Events whose
+    source is no longer part of the world are delivered from a stand-in entity with the
+    source's id.
+
+    Parameters
+    ----------
+    world : RelativeWorld
+        The world to deliver the events to.
+    reader : JournalReader
+        The journal to replay.
+    start_tick : int | None, optional
+        The first tick to replay.
+    end_tick : int | None, optional
+        The tick to stop before.
+    """
+    from relative_world.entity import Entity
+
+    scopes: dict[uuid.UUID | None, "Entity | None"] = {None: world}
+    for _, entries in reader.iter_ticks(
+        start_tick=start_tick, end_tick=end_tick, delivered=True
+    ):
+        for scope_id, group in groupby(entries, key=lambda entry: entry.scope_id):
+            if scope_id not in scopes:
+                scopes[scope_id] = await world.find_by_id(scope_id)
+            scope = scopes[scope_id]
+            if scope is None:
+                continue
+            batch = []
+            for entry in group:
+                source = await world.find_by_id(entry.source_id) or Entity(
+                    id=entry.source_id
+                )
+                batch.append((source, entry.event))
+            await scope.handle_event_batch(batch)
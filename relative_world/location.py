@@ -56,4 +56,3 @@ class Location(Entity):
             The actor to be added to the location.
         """
         actor.location = self
-        self.children.append(actor)
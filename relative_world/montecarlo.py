@@ -0,0 +1,433 @@
+import asyncio
+import os
+import random
+import sys
+import traceback
+from collections import Counter
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from time import monotonic
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable
+
+from relative_world.processes import default_context
+
+if TYPE_CHECKING:
+    from relative_world.entity import BoundEvent
+    from relative_world.world import RelativeWorld
+
+type WorldFactory = Callable[[int], "RelativeWorld"]
+type Summarizer = Callable[["RelativeWorld", list["BoundEvent"]], Any]
+type Reducer = Callable[["RelativeWorld", list[Any]], Any]
+
+_EXHAUSTED = object()
+
+# Seconds a run may go past its timeout, to stop cooperatively, before its worker is killed.
+_KILL_GRACE = 0.5
+
+_cancelled = None
+
+
+def event_counts(world: "RelativeWorld", events: list["BoundEvent"]) -> dict[str, int]:
+    """
+    Summarizes a tick by how many events of each type reached the top of the world.
+
+    Parameters
+    ----------
+    world : RelativeWorld
+        The world that ran the tick.
+    events : list[BoundEvent]
+        The events returned by the tick.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of events of each `Event.type`.
+    """
+    return dict(Counter(event.type for _, event in events))
+
+
+@dataclass(slots=True)
+class RunResult:
+    """
+    The outcome of one world run by a `MonteCarloRunner`.
+
+    Attributes
+    ----------
+    seed : int
+        The seed the world was built from.
+    value : Any
+        The reducer's output, or the list of per-tick summaries without a reducer. None if the
+        run did not finish.
+    ticks : int
+        How many ticks ran.
+    elapsed : float
+        Wall seconds the run took in its worker.
+    error : str | None
+        The formatted traceback, if the run raised.
+    timed_out : bool
+        Whether the run was stopped for exceeding the runner's timeout.
+    cancelled : bool
+        Whether the run was stopped, or never started, because the runner was cancelled.
+    """
+
+    seed: int
+    value: Any = None
+    ticks: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+    timed_out: bool = False
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the run finished every tick.
+
+        Returns
+        -------
+        bool
+            False if it raised, timed out or was cancelled.
+        """
+        return self.error is None and not self.timed_out and not self.cancelled
+
+
+def _init_worker(cancelled):
+    global _cancelled
+    _cancelled = cancelled
+
+
+def _seed_generators(seed: int):
+    random.seed(seed)
+    numpy = sys.modules.get("numpy")
+    if numpy is not None:
+        numpy.random.seed(seed % 2**32)
+
+
+async def _run_ticks(
+    world: "RelativeWorld", result: RunResult, ticks: int, summarize, timeout
+) -> list[Any]:
+    summaries = []
+    deadline = None if timeout is None else monotonic() + timeout
+    for _ in range(ticks):
+        if _cancelled is not None and _cancelled.is_set():
+            result.cancelled = True
+            break
+        if deadline is None:
+            events = await world.run_tick()
+        else:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                result.timed_out = True
+                break
+            try:
+                events = await asyncio.wait_for(world.run_tick(), remaining)
+            except TimeoutError:
+                result.timed_out = True
+                break
+        result.ticks += 1
+        if summarize is not None:
+            summaries.append(summarize(world, events))
+    return summaries
+
+
+def _run_world(
+    factory: WorldFactory, seed: int, ticks: int, summarize, reduce, timeout
+) -> RunResult:
+    result = RunResult(seed=seed)
+    start = monotonic()
+    try:
+        _seed_generators(seed)
+        world = factory(seed)
+        summaries = asyncio.run(_run_ticks(world, result, ticks, summarize, timeout))
+        if result.ok:
+            result.value = summaries if reduce is None else reduce(world, summaries)
+    except Exception:
+        result.error = traceback.format_exc()
+    result.elapsed = monotonic() - start
+    return result
+
+
+def _serve(connection, cancelled):
+    _init_worker(cancelled)
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        result = _run_world(*task)
+        try:
+            connection.send(result)
+        except Exception:
+            result.value = None
+            result.error = traceback.format_exc()
+            connection.send(result)
+
+
+class _Worker:
+    """
+    A worker process that runs one world at a time, sent to it over a pipe.
+    """
+
+    def __init__(self, context, cancelled):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(
+            target=_serve, args=(child, cancelled), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.seed = None
+        self.started = 0.0
+
+    def submit(self, task: tuple):
+        self.seed = task[1]
+        self.started = monotonic()
+        self.connection.send(task)
+
+    def stop(self, kill: bool):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+            self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        self.connection.close()
+        self.process.close()
+
+
+class MonteCarloRunner:
+    """
+    Runs many independent worlds, built from one factory with different seeds, across a set
+    of worker processes.
+
+    Each run seeds Python's `random`, and NumPy's global generator when NumPy is loaded, with
+    its seed before calling the factory, then runs the world's ticks back to back, ignoring
+    `time_scale`. Only compact results travel back: a summary of every tick, or a reducer's
+    output computed in the worker. Results are yielded as runs complete, so at most
+    `max_workers` worlds exist at a time, and each worker is handed its next run as soon as it
+    reports a result.
+
+    The factory, summarizer and reducer are sent to the workers, so they must be picklable,
+    which in practice means module-level functions.
+
+    Workers check timeouts and cancellation between ticks, so a run that overruns normally
+    stops after its current tick and reports the ticks it finished. The runner also enforces
+    timeouts itself: a run still going half a second past its timeout, because a tick or the
+    factory blocks, has its worker killed and replaced, and is reported as timed out with no
+    ticks. Cancelled runs are only stopped between ticks.
+
+    Attributes
+    ----------
+    factory : WorldFactory
+        Builds a world from a seed.
+    ticks : int
+        The number of ticks each world runs.
+    summarize : Summarizer | None
+        Condenses the events of one tick; called in the worker after every tick.
+    reduce : Reducer | None
+        Condenses a finished world and its tick summaries into the run's value.
+    max_workers : int
+        The number of worker processes.
+    timeout : float | None
+        Wall seconds each run may take.
+    on_result : Callable[[RunResult, int, int], None] | None
+        Called with every result, the number of completed runs and the total.
+    completed : int
+        How many runs of the current or last `run` have completed.
+    total : int
+        How many runs the current or last `run` was given.
+    """
+
+    def __init__(
+        self,
+        factory: WorldFactory,
+        ticks: int,
+        summarize: Summarizer | None = event_counts,
+        reduce: Reducer | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        on_result: Callable[[RunResult, int, int], None] | None = None,
+        mp_context=None,
+    ):
+        """
+        Initializes a runner.
+
+        Parameters
+        ----------
+        factory : WorldFactory
+            Builds a world from a seed.
+        ticks : int
+            The number of ticks each world runs.
+        summarize : Summarizer | None, optional
+            Condenses the events of one tick. Defaults to `event_counts`; None keeps no summaries.
+        reduce : Reducer | None, optional
+            Condenses a finished world and its tick summaries into the run's value. Without one,
+            the value is the list of summaries.
+        max_workers : int | None, optional
+            The number of worker processes. Defaults to the number of CPUs.
+        timeout : float | None, optional
+            Wall seconds each run may take before it is stopped.
+        on_result : Callable[[RunResult, int, int], None] | None, optional
+            Called with every result, the number of completed runs and the total, for progress
+            reporting.
+        mp_context : multiprocessing.context.BaseContext, optional
+            The multiprocessing context used to start workers. Defaults to ``forkserver`` where
+            available and ``spawn`` elsewhere, since forking a process that runs an event loop
+            is unsafe.
+        """
+        if ticks < 0:
+            raise ValueError("ticks must not be negative")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        self.factory = factory
+        self.ticks = ticks
+        self.summarize = summarize
+        self.reduce = reduce
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.on_result = on_result
+        self.completed = 0
+        self.total = 0
+        self._context = mp_context or default_context()
+        self._cancel_event = None
+        self._cancelling = False
+
+    def cancel(self):
+        """
+        Stops the current `run`: runs that have not started are skipped, and running worlds stop
+        after their current tick. Their results are still yielded, marked as cancelled.
+        """
+        self._cancelling = True
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    async def run(self, seeds: Iterable[int]) -> AsyncIterator[RunResult]:
+        """
+        Runs one world per seed and yields the results as runs complete.
+
+        Leaving the loop early cancels the runs still pending.
+
+        Parameters
+        ----------
+        seeds : Iterable[int]
+            The seeds to build worlds from.
+
+        Yields
+        ------
+        RunResult
+            The outcome of each run, in completion order.
+        """
+        seeds = list(seeds)
+        self.completed = 0
+        self.total = len(seeds)
+        self._cancelling = False
+        self._cancel_event = self._context.Event()
+        limit = None if self.timeout is None else self.timeout + _KILL_GRACE
+        pending_seeds = iter(seeds)
+        workers: list[_Worker] = []
+        idle: list[_Worker] = []
+        busy: list[_Worker] = []
+
+        def submit():
+            while not self._cancelling and (idle or len(workers) < self.max_workers):
+                seed = next(pending_seeds, _EXHAUSTED)
+                if seed is _EXHAUSTED:
+                    return
+                if idle:
+                    worker = idle.pop()
+                else:
+                    worker = _Worker(self._context, self._cancel_event)
+                    workers.append(worker)
+                worker.submit(
+                    (
+                        self.factory,
+                        seed,
+                        self.ticks,
+                        self.summarize,
+                        self.reduce,
+                        self.timeout,
+                    )
+                )
+                busy.append(worker)
+
+        def retire(worker: _Worker, kill: bool):
+            busy.remove(worker)
+            workers.remove(worker)
+            worker.stop(kill)
+
+        def collect(ready: set) -> list[RunResult]:
+            results = []
+            current = monotonic()
+            for worker in list(busy):
+                if worker.connection in ready:
+                    try:
+                        result = worker.connection.recv()
+                    except (EOFError, OSError):
+                        result = None
+                    if result is not None:
+                        busy.remove(worker)
+                        idle.append(worker)
+                        results.append(result)
+                        continue
+                if worker.connection in ready or worker.process.sentinel in ready:
+                    exitcode = worker.process.exitcode
+                    retire(worker, kill=True)
+                    results.append(
+                        RunResult(
+                            seed=worker.seed,
+                            elapsed=current - worker.started,
+                            error=f"Worker process exited with code {exitcode}",
+                        )
+                    )
+                elif limit is not None and current - worker.started >= limit:
+                    retire(worker, kill=True)
+                    results.append(
+                        RunResult(
+                            seed=worker.seed,
+                            elapsed=current - worker.started,
+                            timed_out=True,
+                        )
+                    )
+            return results
+
+        try:
+            submit()
+            while busy:
+                wait_timeout = None
+                if limit is not None:
+                    wait_timeout = max(
+                        min(worker.started for worker in busy) + limit - monotonic(),
+                        0.0,
+                    )
+                waitables = [worker.connection for worker in busy] + [
+                    worker.process.sentinel for worker in busy
+                ]
+                ready = set(await asyncio.to_thread(wait, waitables, wait_timeout))
+                for result in collect(ready):
+                    self.completed += 1
+                    if self.on_result is not None:
+                        self.on_result(result, self.completed, self.total)
+                    yield result
+                submit()
+            if self._cancelling:
+                for seed in pending_seeds:
+                    self.completed += 1
+                    result = RunResult(seed=seed, cancelled=True)
+                    if self.on_result is not None:
+                        self.on_result(result, self.completed, self.total)
+                    yield result
+        finally:
+            self._cancel_event.set()
+
+            def shutdown():
+                for worker in workers:
+                    worker.stop(kill=worker in busy)
+
+            await asyncio.to_thread(shutdown)
+            self._cancel_event = None
@@ -0,0 +1,26 @@
+def import_numpy(feature: str):
+    """
+    Imports NumPy for a feature that needs it.
+
+    Parameters
+    ----------
+    feature : str
+        The name of the feature, used in the error message.
+
+    Returns
+    -------
+    module
+        The ``numpy`` module.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            f"{feature} requires numpy; install it with `pip install relative-world[numpy]`"
+        ) from error
+    return numpy
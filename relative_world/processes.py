@@ -0,0 +1,18 @@
+import multiprocessing
+
+
+def default_context():
+    """
+    Returns the multiprocessing context used to start worker processes.
+
+    Forking a process that runs an event loop, and possibly threads, can deadlock the child,
+    so workers are started with ``forkserver`` where available and ``spawn`` elsewhere.
+
+    Returns
+    -------
+    multiprocessing.context.BaseContext
+        The context to start workers with.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
@@ -0,0 +1,322 @@
+import os
+import pickle
+import tempfile
+import uuid
+from typing import TYPE_CHECKING, Literal
+
+from relative_world.event import coalesce_events
+
+if TYPE_CHECKING:
+    from relative_world.entity import BoundEvent, Entity
+    from relative_world.event import Event
+
+type OverflowPolicy = Literal["drop_oldest", "drop_newest", "coalesce", "spill"]
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "coalesce", "spill")
+
+
+def _priority(bound_event: "BoundEvent") -> int:
+    return bound_event[1].propagation_priority
+
+
+class SpillFile:
+    """
+    Keeps events that did not fit in a bounded queue in a temporary file, in order.
+
+    The events are pickled; their sources stay in memory, since they are live entities.
+    The file is deleted when it is closed or garbage collected.
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None):
+        """
+        Creates an empty spill file.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike | None, optional
+            Where to create the file. Defaults to the system's temporary directory.
+        """
+        self.directory = directory
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._read_offset = 0
+        self._count = 0
+        self._sources: dict[uuid.UUID, "Entity"] = {}
+        self._unindexed: list["Entity"] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getstate__(self):
+        sources = [*self._sources.values(), *self._unindexed]
+        return {
+            "directory": self.directory,
+            "records": self._records(),
+            "sources": sources,
+        }
+
+    def __setstate__(self, state):
+        # The sources may still be under construction while the file is unpickled, so they are
+        # only indexed by id when the file is next used.
+        self.__init__(state["directory"])
+        self._append(state["records"])
+        self._unindexed = state["sources"]
+
+    def _index_sources(self):
+        if self._unindexed:
+            self._sources.update((source.id, source) for source in self._unindexed)
+            self._unindexed = []
+
+    def write(self, bound_events: list["BoundEvent"]):
+        """
+        Appends events to the end of the file.
+
+        Parameters
+        ----------
+        bound_events : list[BoundEvent]
+            The events with their sources.
+        """
+        self._index_sources()
+        for source, _ in bound_events:
+            self._sources[source.id] = source
+        self._append([(source.id, event) for source, event in bound_events])
+
+    def _append(self, records: list[tuple[uuid.UUID, "Event"]]):
+        if not records:
+            return
+        self._file.seek(0, os.SEEK_END)
+        for record in records:
+            pickle.dump(record, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._count += len(records)
+
+    def read(self, count: int) -> list["BoundEvent"]:
+        """
+        Removes and returns the oldest events.
+
+        Parameters
+        ----------
+        count : int
+            The most events to read.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The events with their sources, oldest first.
+        """
+        count = min(count, self._count)
+        if not count:
+            return []
+        self._index_sources()
+        bound_events = [
+            (self._sources[source_id], event) for source_id, event in self._load(count)
+        ]
+        self._read_offset = self._file.tell()
+        self._count -= count
+        if not self._count:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_offset = 0
+            self._sources.clear()
+        return bound_events
+
+    def _load(self, count: int) -> list[tuple[uuid.UUID, "Event"]]:
+        self._file.seek(self._read_offset)
+        return [pickle.load(self._file) for _ in range(count)]
+
+    def _records(self) -> list[tuple[uuid.UUID, "Event"]]:
+        return self._load(self._count)
+
+    def close(self):
+        """
+        Drops every spilled event and deletes the file.
+        """
+        self._file.close()
+        self._count = 0
+        self._sources.clear()
+
+
+class QueueLimit:
+    """
+    Bounds an entity's propagation queue.
+
+    The queue is trimmed back to `capacity` whenever it reaches twice that size and before it
+    is popped, so at most `capacity` events leave the entity per tick. Trimming keeps the
+    events with the highest `Event.propagation_priority`; among events of equal priority, the
+    overflow policy decides:
+
+    ``"drop_oldest"``
+        Keeps the newest events.
+    ``"drop_newest"``
+        Keeps the oldest events.
+    ``"coalesce"``
+        Collapses duplicates by their classes' `Event.coalesce` rules first, then keeps the
+        newest events.
+    ``"spill"``
+        Keeps the oldest events and writes the rest to a temporary file. Spilled events return
+        to the queue, oldest first, as room frees up in later ticks, so none are lost.
+
+    Popped batches are ordered by priority, highest first, and otherwise keep their order.
+
+    Attributes
+    ----------
+    capacity : int
+        The most events the queue holds after a trim.
+    overflow : OverflowPolicy
+        What happens to events beyond the capacity.
+    directory : str | os.PathLike | None
+        Where the spill file is created.
+    dropped : int
+        Events discarded so far.
+    coalesced : int
+        Events collapsed into duplicates so far.
+    spilled : int
+        Events written to disk so far.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        overflow: OverflowPolicy = "drop_oldest",
+        directory: str | os.PathLike | None = None,
+    ):
+        """
+        Initializes a queue limit.
+
+        Parameters
+        ----------
+        capacity : int
+            The most events the queue holds after a trim. Must be at least 1.
+        overflow : OverflowPolicy, optional
+            What happens to events beyond the capacity.
+        directory : str | os.PathLike | None, optional
+            Where the spill file is created, with the ``"spill"`` policy.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.directory = directory
+        self.dropped = 0
+        self.coalesced = 0
+        self.spilled = 0
+        self._spill: SpillFile | None = None
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of spilled events waiting to return to the queue.
+
+        Returns
+        -------
+        int
+            0 unless the policy is ``"spill"``.
+        """
+        return len(self._spill) if self._spill is not None else 0
+
+    def trim(self, queue: list["BoundEvent"]) -> list["BoundEvent"]:
+        """
+        Applies the overflow policy to a queue that may be over capacity.
+
+        Parameters
+        ----------
+        queue : list[BoundEvent]
+            The staged events, oldest first.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The events that stay queued, in their original order.
+        """
+        if self.overflow == "coalesce" and len(queue) > self.capacity:
+            size = len(queue)
+            queue = coalesce_events(queue)
+            self.coalesced += size - len(queue)
+        excess = len(queue) - self.capacity
+        if excess <= 0:
+            return queue
+        keep_oldest = self.overflow in ("drop_newest", "spill")
+        priorities = [_priority(bound_event) for bound_event in queue]
+        if min(priorities) == max(priorities):
+            if keep_oldest:
+                kept, evicted = queue[: self.capacity], queue[self.capacity :]
+            else:
+                kept, evicted = queue[excess:], queue[:excess]
+        else:
+            # Highest priority first; among equals, the events the policy prefers to keep.
+            ranked = sorted(
+                range(len(queue)),
+                key=lambda index: (
+                    -priorities[index],
+                    index if keep_oldest else -index,
+                ),
+            )
+            kept_indices = set(ranked[: self.capacity])
+            kept = [
+                bound_event
+                for index, bound_event in enumerate(queue)
+                if index in kept_indices
+            ]
+            evicted = [
+                bound_event
+                for index, bound_event in enumerate(queue)
+                if index not in kept_indices
+            ]
+        if self.overflow == "spill":
+            if self._spill is None:
+                self._spill = SpillFile(self.directory)
+            self._spill.write(evicted)
+            self.spilled += len(evicted)
+        else:
+            self.dropped += len(evicted)
+        return kept
+
+    @staticmethod
+    def prioritize(batch: list["BoundEvent"]) -> list["BoundEvent"]:
+        """
+        Orders a popped batch by priority, highest first, keeping the order of equals.
+
+        Parameters
+        ----------
+        batch : list[BoundEvent]
+            The trimmed events.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The events in propagation order.
+        """
+        return (
+            sorted(batch, key=lambda bound_event: -_priority(bound_event))
+            if len(batch) > 1
+            else batch
+        )
+
+    def refill(self) -> list["BoundEvent"]:
+        """
+        Takes spilled events back, oldest first, up to the capacity.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The events that start the next tick's queue.
+        """
+        if self._spill is None:
+            return []
+        return self._spill.read(self.capacity)
+
+    def release(self) -> list["BoundEvent"]:
+        """
+        Takes every spilled event back and deletes the spill file.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The spilled events, oldest first.
+        """
+        if self._spill is None:
+            return []
+        bound_events = self._spill.read(len(self._spill))
+        self._spill.close()
+        self._spill = None
+        return bound_events
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from relative_world.world import RelativeWorld
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TickReport:
+    """
+    The timing of one tick run by a `RealtimeRunner`.
+
+    Attributes
+    ----------
+    tick : int
+        The tick number.
+    jitter : float
+        Wall seconds between the tick's scheduled start and its actual start.
+    duration : float
+        Wall seconds the tick took.
+    overrun : bool
+        Whether the tick took longer than the tick interval.
+    catch_up : bool
+        Whether the tick ran back to back with the previous one to make up for lost time.
+    dropped : int
+        How many ticks were skipped just before this one because the runner fell too far behind.
+    deferred_priority : int | None
+        The priority below which actors were deferred during the tick, if any.
+    """
+
+    tick: int
+    jitter: float
+    duration: float
+    overrun: bool
+    catch_up: bool
+    dropped: int
+    deferred_priority: int | None
+
+
+@dataclass(slots=True)
+class RealtimeStats:
+    """
+    Totals over the ticks run by a `RealtimeRunner`.
+
+    Attributes
+    ----------
+    ticks : int
+        How many ticks ran.
+    overruns : int
+        How many ticks took longer than the tick interval.
+    catch_up_ticks : int
+        How many ticks ran back to back to make up for lost time.
+    dropped_ticks : int
+        How many ticks were skipped to get back on schedule.
+    deferred_ticks : int
+        How many ticks ran with low-priority actors deferred.
+    total_jitter : float
+        The sum of every tick's jitter.
+    max_jitter : float
+        The largest jitter of a tick.
+    """
+
+    ticks: int = 0
+    overruns: int = 0
+    catch_up_ticks: int = 0
+    dropped_ticks: int = 0
+    deferred_ticks: int = 0
+    total_jitter: float = 0.0
+    max_jitter: float = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        """
+        The average jitter of a tick.
+
+        Returns
+        -------
+        float
+            Wall seconds, or 0 before the first tick.
+        """
+        return self.total_jitter / self.ticks if self.ticks else 0.0
+
+    def record(self, report: TickReport):
+        """
+        Adds one tick to the totals.
+
+        Parameters
+        ----------
+        report : TickReport
+            The tick's timing.
+        """
+        self.ticks += 1
+        self.overruns += report.overrun
+        self.catch_up_ticks += report.catch_up
+        self.dropped_ticks += report.dropped
+        self.deferred_ticks += report.deferred_priority is not None
+        self.total_jitter += report.jitter
+        if report.jitter > self.max_jitter:
+            self.max_jitter = report.jitter
+
+
+class RealtimeRunner:
+    """
+    Runs a world at a fixed tick rate against the wall clock.
+
+    Tick start times are laid out on a fixed grid, one interval apart, so a late tick does not
+    push back the ones that follow. When a tick overruns, the next ticks start immediately until
+    the runner is back on schedule, but never more than `max_catch_up` of them in a row; ticks
+    beyond that are dropped and the grid moves forward, so the simulation falls behind wall
+    time instead of spiralling. With `defer_below` set, actors whose priority is lower skip
+    `act` while the runner is over budget. A deferral set with `RelativeWorld.defer_actors`
+    before the run stays in effect throughout and is restored when the run ends.
+
+    Attributes
+    ----------
+    world : RelativeWorld
+        The world being run.
+    interval : float
+        Wall seconds between the starts of consecutive ticks.
+    max_catch_up : int
+        How many ticks may run back to back after falling behind.
+    defer_below : int | None
+        The actor priority below which actors are deferred while over budget.
+    on_tick : Callable[[TickReport], None] | None
+        Called with the timing of every tick.
+    stats : RealtimeStats
+        Totals over every tick run so far.
+    """
+
+    def __init__(
+        self,
+        world: "RelativeWorld",
+        tick_rate: float | None = None,
+        max_catch_up: int = 4,
+        defer_below: int | None = None,
+        on_tick: Callable[[TickReport], None] | None = None,
+    ):
+        """
+        Initializes a runner.
+
+        Parameters
+        ----------
+        world : RelativeWorld
+            The world to run. Its own `time_scale` pacing is bypassed.
+        tick_rate : float | None, optional
+            Ticks per wall second. Defaults to the rate implied by the world's `tick_duration`
+            and `time_scale`, or real time if the world has no `time_scale`.
+        max_catch_up : int, optional
+            How many ticks may run back to back after falling behind.
+        defer_below : int | None, optional
+            Defer actors with a lower priority while ticks overrun or the runner catches up.
+        on_tick : Callable[[TickReport], None] | None, optional
+            Called with the timing of every tick.
+        """
+        if tick_rate is None:
+            interval = world.tick_duration.total_seconds() / (world.time_scale or 1.0)
+        elif tick_rate > 0:
+            interval = 1.0 / tick_rate
+        else:
+            raise ValueError("tick_rate must be positive")
+        if interval <= 0:
+            raise ValueError("The tick interval must be positive")
+        if max_catch_up < 0:
+            raise ValueError("max_catch_up must not be negative")
+        self.world = world
+        self.interval = interval
+        self.max_catch_up = max_catch_up
+        self.defer_below = defer_below
+        self.on_tick = on_tick
+        self.stats = RealtimeStats()
+        self._stopping = False
+
+    def stop(self):
+        """
+        Makes `run` return after the tick in progress.
+        """
+        self._stopping = True
+
+    async def run(self, ticks: int | None = None):
+        """
+        Runs ticks on schedule until stopped.
+
+        Parameters
+        ----------
+        ticks : int | None, optional
+            The number of ticks to run, or None to run until `stop` is called.
+        """
+        world = self.world
+        interval = self.interval
+        self._stopping = False
+        deadline = monotonic()
+        over_budget = False
+        count = 0
+        previous = world.deferred_priority
+        try:
+            while not self._stopping and (ticks is None or count < ticks):
+                current = monotonic()
+                if current < deadline:
+                    await asyncio.sleep(deadline - current)
+                    current = monotonic()
+                behind = int((current - deadline) // interval)
+                dropped = max(behind - self.max_catch_up, 0)
+                if dropped:
+                    deadline += dropped * interval
+                    behind -= dropped
+                catch_up = behind > 0
+                deferred = previous
+                if (over_budget or catch_up) and self.defer_below is not None:
+                    deferred = (
+                        self.defer_below
+                        if previous is None
+                        else max(previous, self.defer_below)
+                    )
+                world.defer_actors(deferred)
+
+                tick = world.previous_iterations
+                await world.run_tick()
+                duration = monotonic() - current
+                overrun = duration > interval
+                over_budget = overrun
+                report = TickReport(
+                    tick=tick,
+                    jitter=current - deadline,
+                    duration=duration,
+                    overrun=overrun,
+                    catch_up=catch_up,
+                    dropped=dropped,
+                    deferred_priority=deferred,
+                )
+                self.stats.record(report)
+                if overrun:
+                    logger.warning(
+                        "Tick %d took %.4fs, over its %.4fs budget",
+                        tick,
+                        duration,
+                        interval,
+                    )
+                if dropped:
+                    logger.warning("Dropped %d ticks to get back on schedule", dropped)
+                if self.on_tick is not None:
+                    self.on_tick(report)
+                deadline += interval
+                count += 1
+        finally:
+            world.defer_actors(previous)
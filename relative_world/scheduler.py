@@ -0,0 +1,125 @@
+import asyncio
+from typing import TYPE_CHECKING, Awaitable, Callable, Sequence
+
+if TYPE_CHECKING:
+    from relative_world.entity import Entity
+
+
+class TickScheduler:
+    """
+    Runs the child updates of an entity during a tick.
+
+    Without limits every child is updated concurrently, as with `asyncio.gather`. With limits,
+    each parent updates its children through a fixed pool of worker coroutines that take
+    children in order, so the number of live tasks stays bounded however large the world is.
+
+    Attributes
+    ----------
+    max_concurrency : int | None
+        The maximum number of leaf entities (entities without children) updating at once
+        across the whole tree. Entities with children never hold a slot, so nested updates
+        cannot deadlock waiting on their own descendants.
+    per_location_limit : int | None
+        The maximum number of children of a single entity updating at once. The root of the
+        tree, usually the world, is exempt so its locations still advance side by side.
+    """
+
+    def __init__(
+        self, max_concurrency: int | None = None, per_location_limit: int | None = None
+    ):
+        """
+        Initializes a new scheduler.
+
+        Parameters
+        ----------
+        max_concurrency : int | None, optional
+            The global limit on concurrently updating leaf entities.
+        per_location_limit : int | None, optional
+            The limit on concurrently updating children of one entity.
+        """
+        for limit in (max_concurrency, per_location_limit):
+            if limit is not None and limit < 1:
+                raise ValueError("Concurrency limits must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.per_location_limit = per_location_limit
+        self._slots = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    @property
+    def bounded(self) -> bool:
+        """
+        Whether the scheduler applies any limit.
+
+        Returns
+        -------
+        bool
+            True if a global or per-location limit is set.
+        """
+        return self.max_concurrency is not None or self.per_location_limit is not None
+
+    def worker_count(self, parent: "Entity", producer_count: int) -> int:
+        """
+        Computes how many worker coroutines a parent uses for its children.
+
+        Parameters
+        ----------
+        parent : Entity
+            The entity whose children are being updated.
+        producer_count : int
+            The number of children to update.
+
+        Returns
+        -------
+        int
+            The size of the worker pool.
+        """
+        workers = producer_count
+        per_location_limit = (
+            self.per_location_limit if parent._parent is not None else None
+        )
+        for limit in (self.max_concurrency, per_location_limit):
+            if limit is not None:
+                workers = min(workers, limit)
+        return workers
+
+    async def run(
+        self,
+        parent: "Entity",
+        producers: Sequence["Entity"],
+        process: Callable[["Entity"], Awaitable[None]],
+    ):
+        """
+        Processes every producer of a parent entity.
+
+        Parameters
+        ----------
+        parent : Entity
+            The entity whose children are being updated.
+        producers : Sequence[Entity]
+            The children to update, in the order they should be started.
+        process : Callable[[Entity], Awaitable[None]]
+            Drives one child's update.
+        """
+        if not producers:
+            return
+        if not self.bounded:
+            await asyncio.gather(*(process(producer) for producer in producers))
+            return
+
+        pending = iter(producers)
+
+        async def worker():
+            for producer in pending:
+                if self._slots is not None and not producer.children:
+                    async with self._slots:
+                        await process(producer)
+                else:
+                    await process(producer)
+
+        workers = self.worker_count(parent, len(producers))
+        if workers == 1:
+            await worker()
+        else:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+DEFAULT_SCHEDULER = TickScheduler()
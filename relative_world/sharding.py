@@ -0,0 +1,406 @@
+import asyncio
+import math
+import os
+import pickle
+import traceback
+import uuid
+from typing import Annotated, Iterable
+
+from pydantic import PrivateAttr
+
+from relative_world.entity import BoundEvent, Entity
+from relative_world.processes import default_context
+from relative_world.time import simulation_time
+from relative_world.world import RelativeWorld
+
+type EventRecord = tuple[uuid.UUID, str | None, uuid.UUID | None, object]
+
+
+class ShardError(RuntimeError):
+    """
+    Raised in the main process when a shard worker fails.
+    """
+
+
+def _subtree_size(entity: Entity) -> int:
+    size = 0
+    pending = [entity]
+    while pending:
+        current = pending.pop()
+        size += 1
+        pending.extend(current.children)
+    return size
+
+
+def partition_locations(
+    world: RelativeWorld, shard_count: int
+) -> list[list[uuid.UUID]]:
+    """
+    Splits the world's top-level locations into shards of similar size.
+
+    Connected locations are kept in the same shard where possible: whole connected
+    components are packed onto the least loaded shard, and only components larger than
+    a shard's fair share are cut, along breadth-first order so neighbours stay together.
+
+    Parameters
+    ----------
+    world : RelativeWorld
+        The world to partition.
+    shard_count : int
+        The number of shards to produce.
+
+    Returns
+    -------
+    list[list[uuid.UUID]]
+        The location ids of each shard. Some shards may be empty.
+    """
+    if shard_count < 1:
+        raise ValueError("shard_count must be at least 1")
+    location_ids = [
+        child.id for child in world.children if child.id in world._locations
+    ]
+    weights = {
+        location_id: _subtree_size(world._locations[location_id])
+        for location_id in location_ids
+    }
+    target = math.ceil(sum(weights.values()) / shard_count) if weights else 0
+
+    units: list[tuple[int, list[uuid.UUID]]] = []
+    seen: set[uuid.UUID] = set()
+    for start in location_ids:
+        if start in seen:
+            continue
+        seen.add(start)
+        component = [start]
+        for current in component:
+            for neighbour_id in world._connections.get(current, ()):
+                if neighbour_id not in seen and neighbour_id in weights:
+                    seen.add(neighbour_id)
+                    component.append(neighbour_id)
+        chunk, chunk_weight = [], 0
+        for location_id in component:
+            if chunk and chunk_weight + weights[location_id] > target:
+                units.append((chunk_weight, chunk))
+                chunk, chunk_weight = [], 0
+            chunk.append(location_id)
+            chunk_weight += weights[location_id]
+        units.append((chunk_weight, chunk))
+
+    shards: list[list[uuid.UUID]] = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+    for weight, unit in sorted(units, key=lambda item: item[0], reverse=True):
+        lightest = loads.index(min(loads))
+        shards[lightest].extend(unit)
+        loads[lightest] += weight
+    return shards
+
+
+def _encode(records: list[EventRecord]) -> bytes:
+    return pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(payload: bytes) -> list[EventRecord]:
+    return pickle.loads(payload)
+
+
+def _to_records(
+    world: RelativeWorld, bound_events: Iterable[BoundEvent]
+) -> list[EventRecord]:
+    return [
+        (source.id, source.name, world.get_origin_location_id(source), event)
+        for source, event in bound_events
+    ]
+
+
+class _ShardWorld(RelativeWorld):
+    """
+    Stands in for the real world inside a shard worker.
+
+    Holds the shard's locations and the full connection graph. Sources of events produced
+    in other shards are represented by plain entities carrying the source's id and name.
+    """
+
+    _remote_origins: Annotated[dict[uuid.UUID, uuid.UUID | None], PrivateAttr()] = {}
+
+    def get_origin_location_id(self, entity: Entity) -> uuid.UUID | None:
+        if entity.id in self._remote_origins:
+            return self._remote_origins[entity.id]
+        return super().get_origin_location_id(entity)
+
+    async def update_shard(self) -> bytes:
+        produced: list[BoundEvent] = []
+
+        async def process_producer(producer):
+            async for bound_event in producer.update():
+                produced.append(bound_event)
+
+        await self._fire_timers(self.previous_iterations)
+        await self._act_in_batches()
+        await self.get_scheduler().run(
+            self, list(self._awake.values()), process_producer
+        )
+        return _encode(_to_records(self, produced))
+
+    async def deliver(self, payload: bytes):
+        batch = []
+        for source_id, source_name, origin_id, event in _decode(payload):
+            source = self._entity_index.get(source_id)
+            if source is None:
+                source = Entity(id=source_id, name=source_name)
+                self._remote_origins[source_id] = origin_id
+            batch.append((source, event))
+        try:
+            await self.handle_event_batch(batch)
+        finally:
+            self._remote_origins.clear()
+
+
+def _run_shard(
+    connection, world_id: uuid.UUID, clock: dict, connections: dict, payload: bytes
+):
+    world = _ShardWorld(id=world_id, **clock)
+    for location in pickle.loads(payload):
+        world.add_location(location)
+    world._connections = connections
+    world._graph = None
+    world._neighbour_cache.clear()
+    loop = asyncio.new_event_loop()
+    moment = None
+    try:
+        while True:
+            command, data = connection.recv()
+            try:
+                if command == "update":
+                    world.previous_iterations, moment = data
+                    with simulation_time(moment):
+                        result = loop.run_until_complete(world.update_shard())
+                elif command == "deliver":
+                    with simulation_time(moment):
+                        result = loop.run_until_complete(world.deliver(data))
+                elif command == "collect":
+                    result = pickle.dumps(
+                        list(world.iter_locations()), protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                elif command == "stop":
+                    connection.send(("ok", None))
+                    break
+                else:
+                    raise ValueError(f"Unknown shard command {command!r}")
+            except Exception:
+                connection.send(("error", traceback.format_exc()))
+            else:
+                connection.send(("ok", result))
+    finally:
+        loop.close()
+        connection.close()
+
+
+class _Shard:
+    def __init__(self, process, connection, location_ids: list[uuid.UUID]):
+        self.process = process
+        self.connection = connection
+        self.location_ids = location_ids
+
+    def send(self, command: str, data=None):
+        try:
+            self.connection.send((command, data))
+        except (BrokenPipeError, EOFError, OSError) as error:
+            raise ShardError(f"Shard worker {self.process.pid} is gone") from error
+
+    async def receive(self):
+        try:
+            status, result = await asyncio.to_thread(self.connection.recv)
+        except (BrokenPipeError, EOFError, OSError) as error:
+            raise ShardError(f"Shard worker {self.process.pid} died") from error
+        if status == "error":
+            raise ShardError(f"Shard worker {self.process.pid} failed:\n{result}")
+        return result
+
+
+class ShardedExecutor:
+    """
+    Runs a world's top-level locations in worker processes.
+
+    Each worker owns a shard of locations and runs their updates on its own event loop.
+    At every tick the events that reach the world are sent back to the main process, which
+    applies the world's own propagation rules and handlers, then broadcasts the handled
+    events to every shard for delivery. This keeps the tick semantics of `RelativeWorld.step`:
+    events reaching the world are delivered within the tick that produced them.
+
+    Entities other than locations added directly to the world keep running in the main process.
+    Everything shipped to a worker must be picklable, which includes event handlers set with
+    `set_event_handler`. While sharding is active the main process only holds stale copies of
+    the shipped locations; `stop` brings the workers' state back. Timers scheduled by entities in
+    a shard run in that shard's worker.
+
+    Attributes
+    ----------
+    world : RelativeWorld
+        The world being executed.
+    shard_count : int
+        The number of worker processes to use.
+    """
+
+    def __init__(
+        self, world: RelativeWorld, shard_count: int | None = None, mp_context=None
+    ):
+        """
+        Initializes a new executor.
+
+        Parameters
+        ----------
+        world : RelativeWorld
+            The world to execute.
+        shard_count : int | None, optional
+            The number of worker processes. Defaults to the number of CPUs.
+        mp_context : multiprocessing.context.BaseContext, optional
+            The multiprocessing context used to start workers. Defaults to ``forkserver`` where
+            available and ``spawn`` elsewhere, since forking a process that runs an event loop
+            is unsafe.
+        """
+        self.world = world
+        self.shard_count = shard_count or os.cpu_count() or 1
+        self._context = mp_context or default_context()
+        self._shards: list[_Shard] = []
+        self._remote_ids: set[uuid.UUID] = set()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether worker processes are currently running.
+
+        Returns
+        -------
+        bool
+            True between `start` and `stop`.
+        """
+        return bool(self._shards)
+
+    def is_remote(self, entity_id: uuid.UUID) -> bool:
+        """
+        Determines if a top-level location is executed by a worker.
+
+        Parameters
+        ----------
+        entity_id : uuid.UUID
+            The id of a child of the world.
+
+        Returns
+        -------
+        bool
+            True if the entity lives in a shard worker.
+        """
+        return entity_id in self._remote_ids
+
+    def start(self):
+        """
+        Partitions the world and starts one worker per non-empty shard.
+        """
+        if self.running:
+            raise RuntimeError("The executor is already running")
+        world = self.world
+        connections = {
+            location_id: set(ids) for location_id, ids in world._connections.items()
+        }
+        clock = {
+            "simulation_start_time": world.simulation_start_time,
+            "tick_duration": world.tick_duration,
+            "previous_iterations": world.previous_iterations,
+        }
+        for location_ids in partition_locations(world, self.shard_count):
+            if not location_ids:
+                continue
+            payload = pickle.dumps(
+                [world._locations[location_id] for location_id in location_ids],
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            parent_connection, child_connection = self._context.Pipe()
+            process = self._context.Process(
+                target=_run_shard,
+                args=(child_connection, world.id, clock, connections, payload),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            self._shards.append(_Shard(process, parent_connection, location_ids))
+            self._remote_ids.update(location_ids)
+        world._executor = self
+
+    async def _broadcast(self, command: str, data=None) -> list:
+        for shard in self._shards:
+            shard.send(command, data)
+        return await asyncio.gather(*(shard.receive() for shard in self._shards))
+
+    async def step(self) -> list[BoundEvent]:
+        """
+        Advances every shard and the main process by one tick.
+
+        The world's own part of the tick runs as in `Entity.update`, with the events returned by
+        the shards routed like those of its local children. Workers keep no journal or history,
+        so the events they return are recorded when they arrive.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The events that propagated to the top of the world.
+        """
+        world = self.world
+        for shard in self._shards:
+            shard.send("update", (world.previous_iterations, world.now))
+
+        async def arrivals() -> list[BoundEvent]:
+            produced = []
+            for payload in await asyncio.gather(
+                *(shard.receive() for shard in self._shards)
+            ):
+                for source_id, source_name, _, event in _decode(payload):
+                    source = world._entity_index.get(source_id) or Entity(
+                        id=source_id, name=source_name
+                    )
+                    produced.append((source, event))
+            return produced
+
+        async def deliver(handled: list[BoundEvent]):
+            await self._broadcast("deliver", _encode(_to_records(world, handled)))
+
+        local_producers = [
+            child for child in world._awake.values() if child.id not in self._remote_ids
+        ]
+        return [
+            bound_event
+            async for bound_event in world._update_children(
+                local_producers, arrivals, deliver
+            )
+        ]
+
+    async def stop(self, collect: bool = True):
+        """
+        Stops the workers, optionally bringing their locations back into the world.
+
+        Parameters
+        ----------
+        collect : bool, optional
+            Whether to replace the world's stale locations with the workers' current state.
+        """
+        world = self.world
+        try:
+            if collect and self._shards:
+                replacements = {}
+                for payload in await self._broadcast("collect"):
+                    for location in pickle.loads(payload):
+                        replacements[location.id] = location
+                world.children = [
+                    replacements.get(child.id, child) for child in world.children
+                ]
+                world._locations.update(replacements)
+            await self._broadcast("stop")
+        finally:
+            for shard in self._shards:
+                shard.connection.close()
+                shard.process.join(timeout=5)
+                if shard.process.is_alive():
+                    shard.process.terminate()
+            self._shards = []
+            self._remote_ids = set()
+            if world._executor is self:
+                world._executor = None
@@ -0,0 +1,193 @@
+import os
+import pickle
+import uuid
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+from relative_world.entity import Entity
+
+MAGIC = b"RWSNAP"
+FORMAT_VERSION = 1
+RECORDS_PER_CHUNK = 1024
+
+type SnapshotTarget = str | os.PathLike | IO[bytes]
+
+
+class SnapshotError(ValueError):
+    """
+    Raised when a snapshot cannot be written or read.
+    """
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickles references to the entities of the written tree as their ids, so each of them is
+    stored exactly once. Entities outside the tree are pickled inline.
+    """
+
+    def __init__(self, file: IO[bytes], entities: dict[uuid.UUID, Entity], **kwargs):
+        super().__init__(file, **kwargs)
+        self.entities = entities
+
+    def persistent_id(self, obj):
+        if isinstance(obj, Entity) and self.entities.get(obj.id) is obj:
+            return obj.id
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Resolves entity ids written by `_SnapshotPickler` to the restored entities.
+    """
+
+    def __init__(self, file: IO[bytes], entities: dict[uuid.UUID, Entity]):
+        super().__init__(file)
+        self.entities = entities
+
+    def persistent_load(self, pid):
+        try:
+            return self.entities[pid]
+        except KeyError:
+            raise SnapshotError(f"Snapshot references unknown entity {pid}") from None
+
+
+class _RecordWriter:
+    """
+    Pickles records in chunks that share a memo, so repeated classes and values are written
+    once per chunk while the memo never holds more than one chunk of records alive.
+    """
+
+    def __init__(
+        self, file: IO[bytes], records_per_chunk: int, entities: dict[uuid.UUID, Entity]
+    ):
+        self.file = file
+        self.records_per_chunk = records_per_chunk
+        self.entities = entities
+        self.count = 0
+        self.pickler = None
+
+    def dump(self, record):
+        if self.count % self.records_per_chunk == 0:
+            self.pickler = _SnapshotPickler(
+                self.file, self.entities, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        self.pickler.dump(record)
+        self.count += 1
+
+
+class _RecordReader:
+    """
+    Reads the records written by `_RecordWriter`.
+    """
+
+    def __init__(
+        self, file: IO[bytes], records_per_chunk: int, entities: dict[uuid.UUID, Entity]
+    ):
+        self.file = file
+        self.records_per_chunk = records_per_chunk
+        self.entities = entities
+        self.count = 0
+        self.unpickler = None
+
+    def load(self):
+        if self.count % self.records_per_chunk == 0:
+            self.unpickler = _SnapshotUnpickler(self.file, self.entities)
+        self.count += 1
+        return self.unpickler.load()
+
+
+@contextmanager
+def _open(target: SnapshotTarget, mode: str) -> Iterator[IO[bytes]]:
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, mode) as file:
+            yield file
+    else:
+        yield target
+
+
+def _post_order(root: Entity) -> Iterator[Entity]:
+    """
+    Yields every entity of a tree with children before their parents, without recursion.
+    """
+    pending = [(root, False)]
+    while pending:
+        entity, expanded = pending.pop()
+        if expanded:
+            yield entity
+        else:
+            pending.append((entity, True))
+            pending.extend((child, False) for child in reversed(entity.children))
+
+
+def write_snapshot(root: Entity, target: SnapshotTarget):
+    """
+    Writes an entity tree, usually a `RelativeWorld`, to a binary snapshot.
+
+    Each entity is written once as a flat record holding its fields and non-transient private
+    attributes. References to other entities, including children, a world's `_locations` and
+    the sources of queued events, are stored as ids. Entities outside the tree, such as the
+    source of an event still queued after its source was removed, are stored inline in the
+    records that reference them. Records are streamed one at a time, so the snapshot is never
+    held in memory as a whole. Event handlers must be picklable.
+
+    Parameters
+    ----------
+    root : Entity
+        The root of the tree to write.
+    target : str | os.PathLike | IO[bytes]
+        A path, or a binary file opened for writing.
+    """
+    if getattr(root, "_executor", None) is not None:
+        raise SnapshotError("Stop sharding before writing a snapshot")
+    with _open(target, "wb") as file:
+        file.write(
+            MAGIC
+            + FORMAT_VERSION.to_bytes(2, "little")
+            + RECORDS_PER_CHUNK.to_bytes(4, "little")
+        )
+        entities = {entity.id: entity for entity in _post_order(root)}
+        writer = _RecordWriter(file, RECORDS_PER_CHUNK, entities)
+        # Skeleton: every entity's class and id, so states can reference any entity.
+        for entity in entities.values():
+            writer.dump((entity.__class__, entity.id))
+        writer.dump(None)
+        # States, children first, so each parent relinks fully restored children.
+        for entity in entities.values():
+            writer.dump(entity.__getstate__())
+
+
+def read_snapshot(source: SnapshotTarget) -> Entity:
+    """
+    Restores an entity tree written by `write_snapshot`.
+
+    Parameters
+    ----------
+    source : str | os.PathLike | IO[bytes]
+        A path, or a binary file opened for reading.
+
+    Returns
+    -------
+    Entity
+        The restored root entity.
+    """
+    with _open(source, "rb") as file:
+        header = file.read(len(MAGIC) + 6)
+        if header[: len(MAGIC)] != MAGIC:
+            raise SnapshotError("Not a relative_world snapshot")
+        version = int.from_bytes(header[len(MAGIC) : len(MAGIC) + 2], "little")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+        records_per_chunk = int.from_bytes(header[len(MAGIC) + 2 :], "little")
+
+        entities: dict[uuid.UUID, Entity] = {}
+        reader = _RecordReader(file, records_per_chunk, entities)
+        order = []
+        while (record := reader.load()) is not None:
+            cls, entity_id = record
+            entity = entities[entity_id] = cls.__new__(cls)
+            order.append(entity)
+        for entity in order:
+            entity.__setstate__(reader.load())
+    if not order:
+        raise SnapshotError("Snapshot contains no entities")
+    return order[-1]
@@ -1,4 +1,17 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+
+from relative_world.optional import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_simulation_time: ContextVar[datetime | None] = ContextVar(
+    "simulation_time", default=None
+)
 
 
 def utcnow():
@@ -13,7 +26,50 @@ def utcnow():
     return datetime.now(timezone.utc)
 
 
-def time_as_relative_string(start: datetime, end: datetime) -> str:
+def now() -> datetime:
+    """
+    Get the current simulation time, or the current UTC time outside a simulation tick.
+
+    During `RelativeWorld.step` this returns the world's clock for the tick being run,
+    which costs a context variable lookup instead of a system call.
+
+    Returns
+    -------
+    datetime
+        The current time.
+    """
+    current = _simulation_time.get()
+    if current is None:
+        return datetime.now(timezone.utc)
+    return current
+
+
+@contextmanager
+def simulation_time(moment: datetime) -> Iterator[datetime]:
+    """
+    Makes `now` return a fixed simulation time within a block.
+
+    The value is held in a context variable, so concurrent tasks started inside the block
+    see it too, while other worlds running in separate tasks keep their own time.
+
+    Parameters
+    ----------
+    moment : datetime
+        The simulation time to report.
+
+    Yields
+    ------
+    datetime
+        The simulation time.
+    """
+    token = _simulation_time.set(moment)
+    try:
+        yield moment
+    finally:
+        _simulation_time.reset(token)
+
+
+def time_as_relative_string(start: datetime, end: datetime | None = None) -> str:
     """
     Returns the delta time from start to end as a string relative to the present.
 
@@ -25,14 +81,17 @@ def time_as_relative_string(start: datetime, end: datetime) -> str:
     ----------
     start : datetime
         The start time.
-    end : datetime
-        The end time.
+    end : datetime, optional
+        The end time. Defaults to `now`, so within a tick times are relative to the simulation
+        clock.
 
     Returns
     -------
     str
         The relative time as a string.
     """
+    if end is None:
+        end = now()
     delta = end - start
     if start > end:
         delta = -delta
@@ -81,3 +140,150 @@ def time_as_relative_string(start: datetime, end: datetime) -> str:
             return "a year ago"
         else:
             return f"{delta.days // 365} years ago"
+
+
+_MICROSECOND = timedelta(microseconds=1)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_SECOND_US = 1_000_000
+_MINUTE_US = 60 * _SECOND_US
+_HOUR_US = 60 * _MINUTE_US
+_DAY_US = 24 * _HOUR_US
+
+# Upper bounds of the buckets of `time_as_relative_string` in microseconds; the last bucket
+# is open ended. Each template is filled in with the delta counted in its unit, where a unit
+# of 0 marks a template without a count.
+_BUCKET_BOUNDS = (
+    _MINUTE_US,
+    2 * _MINUTE_US,
+    _HOUR_US,
+    2 * _HOUR_US,
+    _DAY_US,
+    2 * _DAY_US,
+    7 * _DAY_US,
+    30 * _DAY_US,
+    365 * _DAY_US,
+    2 * 365 * _DAY_US,
+)
+_FUTURE_UNITS = (0, 0, _MINUTE_US, 0, _HOUR_US, 0, _DAY_US, 0, 0, 0, 365 * _DAY_US)
+_PAST_UNITS = (0, 0, _MINUTE_US, 0, 0, 0, _DAY_US, 0, 0, 0, 365 * _DAY_US)
+_FUTURE_TEMPLATES = (
+    "in a few seconds",
+    "in a minute",
+    "in {} minutes",
+    "in an hour",
+    "in {} hours",
+    "tomorrow",
+    "in {} days",
+    "next week",
+    "later this year",
+    "next year",
+    "in {} years",
+)
+_PAST_TEMPLATES = (
+    "just now",
+    "a minute ago",
+    "{} minutes ago",
+    "an hour ago",
+    "earlier today",
+    "yesterday",
+    "{} days ago",
+    "last week",
+    "this year",
+    "a year ago",
+    "{} years ago",
+)
+
+
+@lru_cache(maxsize=4096)
+def _relative_string(future: bool, bucket: int, count: int) -> str:
+    return (_FUTURE_TEMPLATES if future else _PAST_TEMPLATES)[bucket].format(count)
+
+
+def _as_microseconds(np, values: Any) -> "np.ndarray":
+    """
+    Converts datetimes, `datetime64` values or POSIX timestamps in seconds to integer
+    microseconds since the epoch. Naive datetimes and `datetime64` values are read as UTC.
+    """
+    if isinstance(values, datetime):
+        values = [values]
+    array = values if isinstance(values, np.ndarray) else np.asarray(values)
+    kind = array.dtype.kind
+    if kind == "M":
+        return array.astype("datetime64[us]").astype(np.int64)
+    if kind in "iu":
+        return array.astype(np.int64) * _SECOND_US
+    if kind == "f":
+        return np.rint(array * _SECOND_US).astype(np.int64)
+    if kind == "O":
+        items = array.ravel()
+        if len(items) and items[0].tzinfo is None:
+            converted = np.fromiter(
+                ((item - _NAIVE_EPOCH) // _MICROSECOND for item in items),
+                np.int64,
+                len(items),
+            )
+        else:
+            converted = np.fromiter(
+                ((item - _EPOCH) // _MICROSECOND for item in items),
+                np.int64,
+                len(items),
+            )
+        return converted.reshape(array.shape)
+    raise TypeError(f"Cannot interpret {array.dtype} values as times")
+
+
+def times_as_relative_strings(
+    starts: "Sequence[datetime] | np.ndarray",
+    ends: "datetime | Sequence[datetime] | np.ndarray | None" = None,
+) -> list[str]:
+    """
+    Formats many time deltas at once, with the same results as `time_as_relative_string`.
+
+    The deltas are computed and bucketed with NumPy, and each distinct bucket and count is
+    formatted once, so large batches mostly cost a few array operations. Requires numpy.
+
+    Parameters
+    ----------
+    starts : Sequence[datetime] | np.ndarray
+        The start times, as datetimes, `datetime64` values or POSIX timestamps in seconds.
+        Naive datetimes and `datetime64` values are read as UTC when mixed with other kinds.
+    ends : datetime | Sequence[datetime] | np.ndarray | None, optional
+        The end times, in any of the same forms, or a single time for every start.
+        Defaults to `now`.
+
+    Returns
+    -------
+    list[str]
+        The relative time of each start, flattened in order.
+    """
+    np = import_numpy("times_as_relative_strings")
+    if ends is None:
+        ends = now()
+    start_us = _as_microseconds(np, starts).ravel()
+    end_us = _as_microseconds(np, ends).ravel()
+    if not len(start_us):
+        return []
+    delta = end_us - start_us
+    future = delta < 0
+    magnitude = np.abs(delta)
+    buckets = np.searchsorted(
+        np.array(_BUCKET_BOUNDS, np.int64), magnitude, side="right"
+    )
+    units = np.where(
+        future,
+        np.array(_FUTURE_UNITS, np.int64)[buckets],
+        np.array(_PAST_UNITS, np.int64)[buckets],
+    )
+    counts = np.where(units > 0, magnitude // np.maximum(units, 1), 0)
+    # Pack direction, bucket and count into one key so each distinct string is formatted once.
+    keys = (counts << 5) | (buckets.astype(np.int64) << 1) | future
+    unique, inverse = np.unique(keys, return_inverse=True)
+    strings = np.array(
+        [
+            _relative_string(bool(key & 1), (key >> 1) & 15, key >> 5)
+            for key in unique.tolist()
+        ],
+        dtype=object,
+    )
+    return strings[inverse].tolist()
@@ -0,0 +1,194 @@
+from typing import Any, Callable
+
+SLOT_BITS = 8
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+LEVELS = 4
+
+
+class Timer:
+    """
+    A callback scheduled on a `TimerWheel`.
+
+    Attributes
+    ----------
+    due : int
+        The tick the timer fires on.
+    callback : Callable
+        The function called when the timer fires.
+    args : tuple
+        The positional arguments passed to the callback.
+    """
+
+    __slots__ = ("due", "callback", "args", "sequence", "_wheel", "_slot")
+
+    def __init__(
+        self,
+        due: int,
+        callback: Callable[..., Any],
+        args: tuple,
+        sequence: int,
+        wheel: "TimerWheel",
+    ):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.sequence = sequence
+        self._wheel = wheel
+        self._slot: dict["Timer", None] | None = None
+
+    @property
+    def pending(self) -> bool:
+        """
+        Whether the timer has neither fired nor been cancelled.
+
+        Returns
+        -------
+        bool
+            True while the timer is waiting in its wheel.
+        """
+        return self._slot is not None
+
+    def cancel(self):
+        """
+        Removes the timer from its wheel in constant time. Cancelling twice does nothing.
+        """
+        if self._slot is not None:
+            del self._slot[self]
+            self._slot = None
+            self._wheel._count -= 1
+
+    def __repr__(self):
+        return f"Timer(due={self.due}, callback={self.callback!r})"
+
+
+class TimerWheel:
+    """
+    A hierarchical timer wheel keyed by simulation tick.
+
+    Timers are hashed into one of `LEVELS` wheels of `SLOTS` slots each. The first wheel holds
+    timers due within `SLOTS` ticks, one slot per tick; each further wheel covers `SLOTS` times
+    the range of the previous one, and its slots are cascaded into the finer wheels when the
+    current tick reaches them. Timers further away than the last wheel wait in an overflow slot.
+    Scheduling and cancelling are O(1), and advancing by a tick only touches the due slot plus
+    an occasional cascade.
+
+    Attributes
+    ----------
+    tick : int
+        The next tick that has not been processed yet.
+    """
+
+    def __init__(self, tick: int = 0):
+        """
+        Initializes an empty wheel.
+
+        Parameters
+        ----------
+        tick : int, optional
+            The first tick to process.
+        """
+        self.tick = tick
+        self._wheels: list[list[dict[Timer, None]]] = [
+            [{} for _ in range(SLOTS)] for _ in range(LEVELS)
+        ]
+        self._overflow: dict[Timer, None] = {}
+        self._count = 0
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, due: int, callback: Callable[..., Any], *args) -> Timer:
+        """
+        Schedules a callback for a tick.
+
+        Parameters
+        ----------
+        due : int
+            The tick to fire on. Ticks that were already processed fire on the next one.
+        callback : Callable
+            The function to call.
+        *args
+            The arguments to call it with.
+
+        Returns
+        -------
+        Timer
+            A handle that can cancel the timer.
+        """
+        self._sequence += 1
+        timer = Timer(max(due, self.tick), callback, args, self._sequence, self)
+        self._insert(timer)
+        self._count += 1
+        return timer
+
+    def _insert(self, timer: Timer):
+        due = timer.due
+        distance = due - self.tick
+        for level in range(LEVELS):
+            if distance < 1 << (SLOT_BITS * (level + 1)):
+                slot = self._wheels[level][(due >> (SLOT_BITS * level)) & SLOT_MASK]
+                break
+        else:
+            slot = self._overflow
+        slot[timer] = None
+        timer._slot = slot
+
+    def _cascade(self, level: int) -> int:
+        """
+        Moves the timers of the current slot of a coarse wheel into the finer wheels.
+
+        Returns
+        -------
+        int
+            The index of the slot that was cascaded.
+        """
+        index = (self.tick >> (SLOT_BITS * level)) & SLOT_MASK
+        slot = self._wheels[level][index]
+        if slot:
+            self._wheels[level][index] = {}
+            for timer in slot:
+                self._insert(timer)
+        return index
+
+    def advance(self, tick: int) -> list[Timer]:
+        """
+        Processes every tick up to and including `tick`.
+
+        Parameters
+        ----------
+        tick : int
+            The last tick to process.
+
+        Returns
+        -------
+        list[Timer]
+            The timers that fell due, ordered by tick and then by scheduling order. They are
+            no longer pending when returned.
+        """
+        due: list[Timer] = []
+        while self.tick <= tick:
+            if not self._count:
+                self.tick = tick + 1
+                break
+            current = self.tick
+            if current & SLOT_MASK == 0:
+                level = 1
+                while level < LEVELS and self._cascade(level) == 0:
+                    level += 1
+                if level == LEVELS:
+                    overflow, self._overflow = self._overflow, {}
+                    for timer in overflow:
+                        self._insert(timer)
+            index = current & SLOT_MASK
+            slot = self._wheels[0][index]
+            if slot:
+                self._wheels[0][index] = {}
+                fired = sorted(slot, key=lambda timer: timer.sequence)
+                for timer in fired:
+                    timer._slot = None
+                self._count -= len(fired)
+                due.extend(fired)
+            self.tick = current + 1
+        return due
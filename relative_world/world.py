@@ -1,32 +1,664 @@
+import asyncio
+import inspect
 import uuid
-from typing import AsyncIterator, Annotated, Iterator
+from datetime import datetime, timedelta
+from time import monotonic, perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Annotated,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+)
 
 from pydantic import PrivateAttr
 
-from relative_world.entity import BoundEvent
+from relative_world.entity import BoundEvent, Entity
+from relative_world.graph import LocationGraph
+from relative_world.instrumentation import Instrumentation
 from relative_world.location import Location
+from relative_world.scheduler import TickScheduler
+from relative_world.time import simulation_time, utcnow
+from relative_world.timers import Timer, TimerWheel
+
+if TYPE_CHECKING:
+    from relative_world.components import ComponentStore
+    from relative_world.history import EventHistory
+    from relative_world.journal import EventJournal
+    from relative_world.sharding import ShardedExecutor
+    from relative_world.snapshot import SnapshotTarget
 
 
 class RelativeWorld(Location):
+    """
+    The root of a simulation, owning its locations, their connections and the simulation clock.
+
+    The clock starts at `simulation_start_time` and advances by `tick_duration` on every tick,
+    independently of wall time. Events created during a tick are stamped with the tick's
+    simulation time. By default ticks run as fast as possible; set `time_scale` to pace them
+    against the wall clock.
+
+    Attributes
+    ----------
+    previous_iterations : int
+        How many ticks have run.
+    simulation_start_time : datetime | None
+        The simulation time of the first tick. Defaults to the current UTC time.
+    tick_duration : timedelta
+        The simulation time that passes in one tick.
+    time_scale : float | None
+        Simulated seconds per wall second when pacing `step`, or None to run as fast as possible.
+    """
+
     previous_iterations: int = 0
+    simulation_start_time: datetime | None = None
+    tick_duration: timedelta = timedelta(seconds=1)
+    time_scale: float | None = None
     _locations: Annotated[dict[uuid.UUID, Location], PrivateAttr()] = {}
     _connections: Annotated[dict[uuid.UUID, set[uuid.UUID]], PrivateAttr()] = {}
+    _entity_index: Annotated[dict[uuid.UUID, Entity], PrivateAttr()] = {}
+    _graph: Annotated[LocationGraph | None, PrivateAttr()] = None
+    _neighbour_cache: Annotated[
+        dict[uuid.UUID, tuple[Location, ...]], PrivateAttr()
+    ] = {}
+    _unplaced_receivers: Annotated[
+        dict[type, tuple[list[Entity], list[Entity]]], PrivateAttr()
+    ] = {}
+    _scheduler: Annotated[TickScheduler | None, PrivateAttr()] = None
+    _executor: Annotated["ShardedExecutor | None", PrivateAttr()] = None
+    _instrumentation: Annotated[Instrumentation | None, PrivateAttr()] = None
+    _next_tick_at: Annotated[float | None, PrivateAttr()] = None
+    _journal: Annotated["EventJournal | None", PrivateAttr()] = None
+    _history: Annotated["EventHistory | None", PrivateAttr()] = None
+    _timers: Annotated[TimerWheel | None, PrivateAttr()] = None
+    _arrivals: Annotated[list[BoundEvent] | None, PrivateAttr()] = None
+    _defer_below: Annotated[int | None, PrivateAttr()] = None
+    _components: Annotated["ComponentStore | None", PrivateAttr()] = None
+    _systems: Annotated[dict[str, list[Callable[..., Any]]], PrivateAttr()] = {
+        "before": [],
+        "after": [],
+    }
+    _batch_actors: Annotated[dict[type, dict[uuid.UUID, Entity]], PrivateAttr()] = {}
+    _transient_attributes = Location._transient_attributes | {
+        "_entity_index",
+        "_graph",
+        "_neighbour_cache",
+        "_unplaced_receivers",
+        "_scheduler",
+        "_executor",
+        "_instrumentation",
+        "_next_tick_at",
+        "_journal",
+        "_history",
+        "_arrivals",
+        "_defer_below",
+        "_components",
+        "_systems",
+        "_batch_actors",
+    }
+
+    def model_post_init(self, __context):
+        if self.simulation_start_time is None:
+            self.simulation_start_time = utcnow()
+        self._entity_index[self.id] = self
+        self._timers = TimerWheel(self.previous_iterations)
+        super().model_post_init(__context)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._entity_index[self.id] = self
+        for child in self.children:
+            self._index_subtree(child, schedule_wakes=False)
+
+    def _index_subtree(self, entity: Entity, schedule_wakes: bool = True):
+        """
+        Adds an entity and its descendants to the id index.
+
+        Parameters
+        ----------
+        entity : Entity
+            The root of the subtree to index.
+        schedule_wakes : bool, optional
+            Whether to schedule the deadlines of sleeping entities. Restored worlds already
+            hold them in their timer wheel.
+        """
+        pending = [entity]
+        while pending:
+            current = pending.pop()
+            self._entity_index[current.id] = current
+            current._bind_world(self)
+            if schedule_wakes and current._dormant and current._wake_at is not None:
+                self._schedule_wake(current)
+            pending.extend(current.children)
+
+    def _register_entity(self, entity: Entity):
+        """
+        Indexes an attached subtree by id.
+
+        Parameters
+        ----------
+        entity : Entity
+            The root of the subtree that was attached somewhere below the world.
+        """
+        self._index_subtree(entity)
+        super()._register_entity(entity)
+
+    def _unregister_entity(self, entity: Entity):
+        """
+        Drops a detached subtree from the id index.
+
+        Parameters
+        ----------
+        entity : Entity
+            The root of the subtree that was detached from below the world.
+        """
+        store = self._components
+        pending = [entity]
+        while pending:
+            current = pending.pop()
+            if self._entity_index.get(current.id) is current:
+                del self._entity_index[current.id]
+            if store is not None:
+                store.release(current)
+            batch = self._batch_actors.get(current.__class__)
+            if batch is not None and batch.get(current.id) is current:
+                del batch[current.id]
+                current._in_batch = False
+                current._refresh_idle()
+            pending.extend(current.children)
+        super()._unregister_entity(entity)
+
+    def _schedule_wake(self, entity: Entity):
+        """
+        Schedules a sleeping entity to wake at its deadline.
+
+        Parameters
+        ----------
+        entity : Entity
+            The sleeping entity, whose `_wake_at` is set.
+        """
+        self.call_at(entity._wake_at, self._wake_entity, entity.id, entity._wake_at)
+
+    def _wake_entity(self, entity_id: uuid.UUID, deadline: datetime):
+        """
+        Wakes an entity whose deadline passed, unless it woke early, went back to sleep
+        with another deadline or left the world.
+        """
+        entity = self._entity_index.get(entity_id)
+        if entity is not None and entity._dormant and entity._wake_at == deadline:
+            entity.wake()
+
+    def tick_at(self, when: datetime) -> int:
+        """
+        Converts a simulation time to the first tick that runs at or after it.
+
+        Parameters
+        ----------
+        when : datetime
+            The simulation time.
+
+        Returns
+        -------
+        int
+            The tick number.
+        """
+        return -((self.simulation_start_time - when) // self.tick_duration)
+
+    def call_at(
+        self, when: datetime | int, callback: Callable[..., Any], *args
+    ) -> Timer:
+        """
+        Calls a function at the start of the tick that reaches a simulation time.
+
+        Callbacks run inside the tick, before any entity is updated, so events they emit
+        propagate within that tick. Coroutine functions are awaited. Callbacks and their
+        arguments must be picklable for the world to be snapshotted.
+
+        Parameters
+        ----------
+        when : datetime | int
+            The simulation time, or the tick number, to call the function at. Times that
+            have passed fire on the next tick.
+        callback : Callable
+            The function to call.
+        *args
+            The arguments to call it with.
+
+        Returns
+        -------
+        Timer
+            A handle whose `cancel` removes the call.
+        """
+        tick = when if isinstance(when, int) else self.tick_at(when)
+        return self._timers.schedule(tick, callback, *args)
+
+    def call_later(
+        self, delay: timedelta | int, callback: Callable[..., Any], *args
+    ) -> Timer:
+        """
+        Calls a function after some simulation time. See `call_at`.
+
+        Parameters
+        ----------
+        delay : timedelta | int
+            The simulation time, or the number of ticks, to wait.
+        callback : Callable
+            The function to call.
+        *args
+            The arguments to call it with.
+
+        Returns
+        -------
+        Timer
+            A handle whose `cancel` removes the call.
+        """
+        if isinstance(delay, int):
+            return self._timers.schedule(
+                self.previous_iterations + delay, callback, *args
+            )
+        return self.call_at(self.now + delay, callback, *args)
+
+    async def _fire_timers(self, tick: int):
+        """
+        Runs the callbacks that fall due up to a tick.
+
+        Parameters
+        ----------
+        tick : int
+            The tick about to run.
+        """
+        for timer in self._timers.advance(tick):
+            result = timer.callback(*timer.args)
+            if inspect.isawaitable(result):
+                await result
+
+    async def handle_event_batch(self, batch: list[BoundEvent]):
+        """
+        Handles the events that reached the world, noting them for the result of `step`.
+
+        Parameters
+        ----------
+        batch : list[BoundEvent]
+            The source entities and events to handle.
+        """
+        if self._arrivals is not None:
+            self._arrivals.extend(batch)
+        await super().handle_event_batch(batch)
+
+    def get_scheduler(self) -> TickScheduler:
+        """
+        Returns the scheduler used for every update in the world.
+
+        Returns
+        -------
+        TickScheduler
+            The world's tick scheduler, or the inherited one if none was set.
+        """
+        if self._scheduler is None:
+            return super().get_scheduler()
+        return self._scheduler
+
+    def set_scheduler(self, scheduler: TickScheduler | None):
+        """
+        Replaces the scheduler used for every update in the world.
+
+        Parameters
+        ----------
+        scheduler : TickScheduler | None
+            The scheduler to use from the next tick on, or None to inherit the default.
+        """
+        self._scheduler = scheduler
+
+    def get_instrumentation(self) -> Instrumentation | None:
+        """
+        Returns the instrumentation collecting measurements for the world.
+
+        Returns
+        -------
+        Instrumentation | None
+            The installed instrumentation, or the inherited one if none was installed.
+        """
+        if self._instrumentation is None:
+            return super().get_instrumentation()
+        return self._instrumentation
+
+    def enable_instrumentation(self, reset_each_step: bool = True) -> Instrumentation:
+        """
+        Starts collecting timings, event counts and queue depths for every entity.
+
+        Parameters
+        ----------
+        reset_each_step : bool, optional
+            Whether each `step` starts from empty measurements.
+
+        Returns
+        -------
+        Instrumentation
+            The collector, which can be queried after each step.
+        """
+        self._instrumentation = Instrumentation(reset_each_step=reset_each_step)
+        return self._instrumentation
+
+    def disable_instrumentation(self):
+        """
+        Stops collecting measurements.
+        """
+        self._instrumentation = None
+
+    @property
+    def deferred_priority(self) -> int | None:
+        """
+        The priority below which actors currently skip `act`.
+
+        Returns
+        -------
+        int | None
+            The threshold set by `defer_actors`, or None if no actor is deferred.
+        """
+        return self._defer_below
+
+    def defer_actors(self, below: int | None):
+        """
+        Makes actors with a low priority skip `act` until further notice.
+
+        Deferred actors still receive events and update their children. Actors running in
+        shard workers are not deferred.
+
+        Parameters
+        ----------
+        below : int | None
+            Actors whose `priority` is lower than this are deferred. None resumes every actor.
+        """
+        self._defer_below = below
+
+    def get_journal(self) -> "EventJournal | None":
+        """
+        Returns the journal recording the events produced in the world.
+
+        Returns
+        -------
+        EventJournal | None
+            The installed journal, or the inherited one if none was installed.
+        """
+        if self._journal is None:
+            return super().get_journal()
+        return self._journal
+
+    def enable_journal(self, path) -> "EventJournal":
+        """
+        Starts appending every produced event to a journal file.
+
+        Events are recorded where they are produced, once each, and written at the end of
+        every `step`. Events produced inside shard workers are journaled when they reach the
+        main process; those handled within a worker are not journaled.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The journal file. Existing journals are appended to.
+
+        Returns
+        -------
+        EventJournal
+            The journal.
+        """
+        from relative_world.journal import EventJournal
+
+        self.disable_journal()
+        self._journal = EventJournal(path)
+        return self._journal
+
+    def disable_journal(self):
+        """
+        Stops journaling and closes the journal file.
+        """
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def get_history(self) -> "EventHistory | None":
+        """
+        Returns the history store keeping the events produced in the world.
+
+        Returns
+        -------
+        EventHistory | None
+            The installed history, or the inherited one if none was installed.
+        """
+        if self._history is None:
+            return super().get_history()
+        return self._history
+
+    def enable_history(self, directory=None, **options) -> "EventHistory":
+        """
+        Starts keeping every produced event in a columnar history for analytics queries.
+
+        Events are recorded where they are produced, once each, and appended at the end of
+        every `step` together with the top-level location of their source. Events produced
+        inside shard workers are recorded when they reach the main process; those handled
+        within a worker are not. Requires numpy.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike | None, optional
+            Where chunks evicted from memory are saved. Defaults to a temporary directory.
+        **options
+            Further arguments for `EventHistory`, such as `chunk_rows` and `max_chunks_in_memory`.
+
+        Returns
+        -------
+        EventHistory
+            The history.
+        """
+        from relative_world.history import EventHistory
+
+        self.disable_history()
+        self._history = EventHistory(
+            directory, locate=self.get_origin_location_id, **options
+        )
+        return self._history
+
+    def disable_history(self):
+        """
+        Stops recording history and drops the rows kept so far.
+        """
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+
+    def get_components(self) -> "ComponentStore | None":
+        """
+        Returns the store holding the actors' component fields.
+
+        Returns
+        -------
+        ComponentStore | None
+            The store installed by `enable_components`, if any.
+        """
+        return self._components
+
+    def enable_components(self, capacity: int | None = None) -> "ComponentStore":
+        """
+        Moves the `component_fields` of every actor in the world into NumPy columns.
+
+        Actors added later are bound as they join and released, with their current values,
+        as they leave. Actors running in shard workers are not bound. Components and systems
+        are not kept in snapshots and must be enabled again after loading. Requires numpy.
+
+        Parameters
+        ----------
+        capacity : int | None, optional
+            The number of rows allocated up front. Defaults to the number of indexed entities.
+
+        Returns
+        -------
+        ComponentStore
+            The store, which systems receive on every tick.
+        """
+        from relative_world.components import ComponentStore
+
+        if self._components is None:
+            self._components = ComponentStore(capacity or len(self._entity_index))
+            for entity in list(self._entity_index.values()):
+                entity._bind_world(self)
+        return self._components
+
+    def disable_components(self):
+        """
+        Moves every component field back into its actor and drops the store.
+        """
+        store, self._components = self._components, None
+        if store is not None:
+            for entity in self._entity_index.values():
+                store.release(entity)
+
+    def add_system(
+        self, system: Callable[..., Any], phase: Literal["before", "after"] = "before"
+    ):
+        """
+        Registers a function that updates whole component columns once per tick.
+
+        Systems are called with the world's `ComponentStore` and the world, in registration
+        order, either before or after the entities are updated. Coroutine functions are awaited.
+
+        Parameters
+        ----------
+        system : Callable[[ComponentStore, RelativeWorld], Any]
+            The function to call.
+        phase : Literal["before", "after"], optional
+            Whether to run before or after the update traversal.
+        """
+        if phase not in self._systems:
+            raise ValueError(f"Unknown system phase {phase!r}")
+        self._systems[phase].append(system)
+
+    def remove_system(self, system: Callable[..., Any]):
+        """
+        Unregisters a system from every phase.
+
+        Parameters
+        ----------
+        system : Callable[[ComponentStore, RelativeWorld], Any]
+            The function to remove.
+        """
+        for systems in self._systems.values():
+            while system in systems:
+                systems.remove(system)
+
+    async def _run_systems(self, phase: str):
+        store = self._components
+        if store is None:
+            return
+        for system in self._systems[phase]:
+            result = system(store, self)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _act_in_batches(self):
+        """
+        Calls `act_batch` once per actor class that overrides it, with every instance that
+        would act in this tick, and hands the events to the actors' parents to process as if the
+        actors had yielded them. Those actors are skipped by the update traversal unless they
+        have children or staged events of their own.
+        """
+        below = self._defer_below
+        local: dict[uuid.UUID, bool] = {}
+        for cls, members in self._batch_actors.items():
+            actors = []
+            for actor in members.values():
+                if actor._dormant or (below is not None and actor.priority < below):
+                    continue
+                parent = actor._parent
+                if parent is None:
+                    continue
+                if parent.id not in local:
+                    local[parent.id] = parent is self or self._runs_locally(parent)
+                if local[parent.id]:
+                    actors.append(actor)
+            if not actors:
+                continue
+            for source, event in await cls.act_batch(actors):
+                if not source.should_propagate_event(event):
+                    continue
+                parent = source._parent
+                if parent is None:
+                    source.emit_event(event)
+                    continue
+                parent._child_events.append((source, event))
+                if parent._idle:
+                    parent._refresh_idle()
+
+    def _runs_locally(self, entity: Entity) -> bool:
+        """
+        Whether an entity is updated in this process this tick: neither it nor any of its
+        ancestors sleeps, and it is not inside a location run by a shard worker.
+        """
+        current = entity
+        while current._parent is not self:
+            if current._dormant or current._parent is None:
+                return False
+            current = current._parent
+        if current._dormant:
+            return False
+        return self._executor is None or not self._executor.is_remote(current.id)
+
+    async def find_by_id(self, entity_id: uuid.UUID) -> Entity | None:
+        """
+        Finds an entity anywhere in the world by its unique identifier.
+
+        Parameters
+        ----------
+        entity_id : uuid.UUID
+            The unique identifier of the entity to find.
+
+        Returns
+        -------
+        Entity | None
+            The entity with the given identifier, or None if it is not part of the world.
+        """
+        return self._entity_index.get(entity_id)
+
+    async def find_many(self, entity_ids: Iterable[uuid.UUID]) -> list[Entity | None]:
+        """
+        Finds several entities by their unique identifiers.
+
+        Parameters
+        ----------
+        entity_ids : Iterable[uuid.UUID]
+            The identifiers to resolve.
+
+        Returns
+        -------
+        list[Entity | None]
+            The entities in the same order as `entity_ids`, with None for unknown identifiers.
+        """
+        index = self._entity_index
+        return [index.get(entity_id) for entity_id in entity_ids]
 
     def add_location(self, location: Location):
         self._locations[location.id] = location
         if location.id not in self._connections:
             self._connections[location.id] = set()
+            if self._graph is not None:
+                self._graph.add_node(location.id)
         self.add_entity(location)
 
     def remove_location(self, location: Location):
         if location.id in self._locations:
             del self._locations[location.id]
+        self._neighbour_cache.pop(location.id, None)
+        for neighbour_id in self._connections.pop(location.id, ()):
+            self._connections[neighbour_id].discard(location.id)
+            self._neighbour_cache.pop(neighbour_id, None)
+        if self._graph is not None:
+            self._graph.remove_node(location.id)
         self.remove_entity(location)
 
     def get_location(self, location_id: uuid.UUID) -> Location:
-        if location_id is self.id:
-            return self
-        return self._locations[location_id]
+        return self._entity_index[location_id]
 
     def connect_locations(self, location_a: uuid.UUID, location_b: uuid.UUID) -> None:
         if location_a not in self._locations or location_b not in self._locations:
@@ -34,11 +666,198 @@ class RelativeWorld(Location):
 
         self._connections[location_a].add(location_b)
         self._connections[location_b].add(location_a)
+        self._neighbour_cache.pop(location_a, None)
+        self._neighbour_cache.pop(location_b, None)
+        if self._graph is not None:
+            self._graph.connect(location_a, location_b)
+
+    def get_location_graph(self) -> LocationGraph:
+        """
+        Returns the query layer over the world's location connections.
+
+        The graph is built from `_connections` on first use and then kept up to date by
+        `add_location`, `connect_locations` and `remove_location`.
+
+        Returns
+        -------
+        LocationGraph
+            The connection graph, keyed by location id.
+        """
+        if self._graph is None:
+            self._graph = LocationGraph(self._connections)
+        return self._graph
 
     def get_connected_locations(self, location_id: uuid.UUID) -> list[Location]:
-        if location_id not in self._connections:
-            return []
-        return [self._locations[loc_id] for loc_id in self._connections[location_id]]
+        neighbours = self._neighbour_cache.get(location_id)
+        if neighbours is None:
+            if location_id not in self._connections:
+                return []
+            graph = self.get_location_graph()
+            neighbours = self._neighbour_cache[location_id] = tuple(
+                self._locations[neighbour_id]
+                for neighbour_id in graph.neighbours(location_id)
+            )
+        return list(neighbours)
+
+    def get_reachable_locations(
+        self, location_id: uuid.UUID, radius: int
+    ) -> tuple[uuid.UUID, ...]:
+        """
+        Lists the locations within a number of connection hops of a location.
+
+        Parameters
+        ----------
+        location_id : uuid.UUID
+            The location to start from.
+        radius : int
+            The maximum number of hops.
+
+        Returns
+        -------
+        tuple[uuid.UUID, ...]
+            The reachable location ids in breadth-first order, starting with `location_id`.
+        """
+        graph = self.get_location_graph()
+        if location_id not in graph:
+            return (location_id,)
+        return graph.neighbourhood(location_id, radius)
+
+    def get_shortest_path(
+        self, location_a: uuid.UUID, location_b: uuid.UUID
+    ) -> list[uuid.UUID] | None:
+        """
+        Finds a shortest route between two locations.
+
+        Parameters
+        ----------
+        location_a : uuid.UUID
+            The location to start from.
+        location_b : uuid.UUID
+            The location to reach.
+
+        Returns
+        -------
+        list[uuid.UUID] | None
+            The location ids along the route, including both ends, or None if there is no route.
+        """
+        return self.get_location_graph().shortest_path(location_a, location_b)
+
+    def get_distance(self, location_a: uuid.UUID, location_b: uuid.UUID) -> int | None:
+        """
+        Counts the connections on a shortest route between two locations.
+
+        Parameters
+        ----------
+        location_a : uuid.UUID
+            The location to start from.
+        location_b : uuid.UUID
+            The location to reach.
+
+        Returns
+        -------
+        int | None
+            The number of hops, or None if there is no route.
+        """
+        return self.get_location_graph().distance(location_a, location_b)
+
+    def get_connected_components(self) -> list[tuple[uuid.UUID, ...]]:
+        """
+        Groups the locations that can reach each other through connections.
+
+        Returns
+        -------
+        list[tuple[uuid.UUID, ...]]
+            The location ids of each connected group.
+        """
+        return self.get_location_graph().components()
+
+    def get_top_level_location(self, entity: Entity) -> Location | None:
+        """
+        Finds the location registered with `add_location` that contains an entity.
+
+        Parameters
+        ----------
+        entity : Entity
+            The entity to locate.
+
+        Returns
+        -------
+        Location | None
+            The containing location, or None if the entity is not inside one.
+        """
+        current = entity
+        while current._parent is not None and current._parent is not self:
+            current = current._parent
+        if current._parent is self:
+            return self._locations.get(current.id)
+        return None
+
+    def get_origin_location_id(self, entity: Entity) -> uuid.UUID | None:
+        """
+        Finds the id of the top-level location an event source sits in.
+
+        Parameters
+        ----------
+        entity : Entity
+            The source of an event.
+
+        Returns
+        -------
+        uuid.UUID | None
+            The id of the containing location, or None if the source is not inside one.
+        """
+        origin = self.get_top_level_location(entity)
+        return origin.id if origin is not None else None
+
+    def get_event_receivers(self, bound_event: BoundEvent) -> list[Entity]:
+        """
+        Restricts events with an interest radius to locations near their source.
+
+        Entities added directly to the world, rather than to a location, have no position and
+        receive such events regardless of the radius.
+
+        Parameters
+        ----------
+        bound_event : BoundEvent
+            A tuple containing the source entity and the event.
+
+        Returns
+        -------
+        list[Entity]
+            The subscribed children that should receive the event.
+        """
+        source, event = bound_event
+        radius = event.interest_radius
+        origin_id = self.get_origin_location_id(source) if radius is not None else None
+        if origin_id is None:
+            receivers = super().get_event_receivers(bound_event)
+        else:
+            event_type = event.__class__
+            receivers = []
+            for location_id in self.get_reachable_locations(origin_id, radius):
+                location = self._locations.get(location_id)
+                if location is not None and location.is_subscribed(event_type):
+                    receivers.append(location)
+            receivers.extend(self._get_unplaced_receivers(bound_event))
+        if self._executor is not None:
+            receivers = [
+                receiver
+                for receiver in receivers
+                if not self._executor.is_remote(receiver.id)
+            ]
+        return receivers
+
+    def _get_unplaced_receivers(self, bound_event: BoundEvent) -> list[Entity]:
+        # Kept alongside the entity's receiver cache, and rebuilt whenever that list is replaced.
+        subscribed = super().get_event_receivers(bound_event)
+        event_type = bound_event[1].__class__
+        cached = self._unplaced_receivers.get(event_type)
+        if cached is None or cached[0] is not subscribed:
+            unplaced = [
+                child for child in subscribed if child.id not in self._locations
+            ]
+            cached = self._unplaced_receivers[event_type] = (subscribed, unplaced)
+        return cached[1]
 
     def iter_locations(self) -> Iterator[Location]:
         for location in self.children:
@@ -50,6 +869,254 @@ class RelativeWorld(Location):
             if isinstance(location, Location):
                 yield location
 
-    async def step(self):
-        async for _ in self.update():
-            pass
+    def start_sharding(
+        self, shard_count: int | None = None, mp_context=None
+    ) -> "ShardedExecutor":
+        """
+        Starts running the world's top-level locations in worker processes.
+
+        Subsequent calls to `step` advance the shards in parallel. See `ShardedExecutor`
+        for the requirements on shipped entities.
+
+        Parameters
+        ----------
+        shard_count : int | None, optional
+            The number of worker processes. Defaults to the number of CPUs.
+        mp_context : multiprocessing.context.BaseContext, optional
+            The multiprocessing context used to start workers.
+
+        Returns
+        -------
+        ShardedExecutor
+            The running executor.
+        """
+        from relative_world.sharding import ShardedExecutor
+
+        executor = ShardedExecutor(self, shard_count=shard_count, mp_context=mp_context)
+        executor.start()
+        return executor
+
+    async def stop_sharding(self, collect: bool = True):
+        """
+        Stops the worker processes started by `start_sharding`.
+
+        Parameters
+        ----------
+        collect : bool, optional
+            Whether to bring the workers' locations back into the world.
+        """
+        if self._executor is not None:
+            await self._executor.stop(collect=collect)
+
+    def save_snapshot(self, target: "SnapshotTarget"):
+        """
+        Writes the world to a binary snapshot. See `relative_world.snapshot.write_snapshot`.
+
+        Parameters
+        ----------
+        target : str | os.PathLike | IO[bytes]
+            A path, or a binary file opened for writing.
+        """
+        from relative_world.snapshot import write_snapshot
+
+        write_snapshot(self, target)
+
+    @classmethod
+    def load_snapshot(cls, source: "SnapshotTarget") -> "RelativeWorld":
+        """
+        Restores a world written by `save_snapshot`.
+
+        Parameters
+        ----------
+        source : str | os.PathLike | IO[bytes]
+            A path, or a binary file opened for reading.
+
+        Returns
+        -------
+        RelativeWorld
+            The restored world.
+        """
+        from relative_world.snapshot import SnapshotError, read_snapshot
+
+        world = read_snapshot(source)
+        if not isinstance(world, cls):
+            raise SnapshotError(
+                f"Snapshot contains a {world.__class__.__name__}, not a {cls.__name__}"
+            )
+        return world
+
+    @property
+    def now(self) -> datetime:
+        """
+        The simulation time of the current tick.
+
+        Returns
+        -------
+        datetime
+            `simulation_start_time` advanced by `tick_duration` for every completed tick.
+        """
+        return (
+            self.simulation_start_time + self.previous_iterations * self.tick_duration
+        )
+
+    async def update(self) -> AsyncIterator[BoundEvent]:
+        async for bound_event in super().update():
+            yield bound_event
+        self.previous_iterations += 1
+
+    async def _wait_for_tick(self):
+        """
+        Sleeps until the wall time of the next tick when `time_scale` is set.
+
+        A tick that starts late is not made up for; the following tick is scheduled one
+        interval after it.
+        """
+        interval = self.tick_duration.total_seconds() / self.time_scale
+        current = monotonic()
+        deadline = self._next_tick_at
+        if deadline is not None and deadline > current:
+            await asyncio.sleep(deadline - current)
+            current = deadline
+        self._next_tick_at = current + interval
+
+    async def step(self) -> list[BoundEvent]:
+        """
+        Runs one tick of the simulation and advances the clock.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The events that reached the top of the world during the tick, whether the world
+            handled them or propagated them.
+        """
+        if self.time_scale is not None:
+            await self._wait_for_tick()
+        return await self.run_tick()
+
+    async def run_tick(self) -> list[BoundEvent]:
+        """
+        Runs one tick immediately, ignoring `time_scale`.
+
+        This is `step` without pacing, for drivers that schedule ticks themselves, such as
+        `RealtimeRunner` and `MonteCarloRunner`.
+
+        Returns
+        -------
+        list[BoundEvent]
+            The events that reached the top of the world during the tick.
+        """
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            if instrumentation.reset_each_step:
+                instrumentation.reset()
+            start = perf_counter()
+        tick = self.previous_iterations
+        journal = self._journal
+        history = self._history
+        produced = self._arrivals = []
+        try:
+            with simulation_time(self.now):
+                await self._fire_timers(tick)
+                await self._run_systems("before")
+                await self._act_in_batches()
+                if self._executor is not None:
+                    popped = await self._executor.step()
+                    self.previous_iterations += 1
+                else:
+                    popped = [bound_event async for bound_event in self.update()]
+                for source, event in popped:
+                    if source is self:
+                        if journal is not None:
+                            journal.record(source, event)
+                        if history is not None:
+                            history.record(source, event)
+                    produced.append((source, event))
+                await self._run_systems("after")
+        finally:
+            self._arrivals = None
+        if journal is not None:
+            journal.flush(tick)
+        if history is not None:
+            history.flush(tick)
+        if instrumentation is not None:
+            elapsed = perf_counter() - start
+            instrumentation.record_step(elapsed)
+            instrumentation.record_update(self, elapsed)
+        return produced
+
+    async def run(
+        self,
+        ticks: int | None = None,
+        until: Callable[["RelativeWorld"], bool] | None = None,
+        batch: bool = False,
+        max_pending_ticks: int = 1,
+    ) -> AsyncIterator[BoundEvent | tuple[int, list[BoundEvent]]]:
+        """
+        Steps the world in a background task and streams the events returned by `step`.
+
+        Ticks are handed over through a queue holding at most `max_pending_ticks` ticks, so a
+        slow consumer pauses the simulation rather than losing events or letting them pile up.
+        Closing the generator early, for example by breaking out of an ``async for`` loop,
+        stops the simulation after the tick in progress. Errors raised while stepping are
+        re-raised in the consumer.
+
+        Parameters
+        ----------
+        ticks : int | None, optional
+            The number of ticks to run, or None to run until stopped.
+        until : Callable[[RelativeWorld], bool] | None, optional
+            Checked after every tick; the run ends once it returns True.
+        batch : bool, optional
+            Whether to yield one ``(tick, events)`` pair per tick, including ticks that
+            produced nothing, instead of each event on its own.
+        max_pending_ticks : int, optional
+            How many ticks the simulation may run ahead of the consumer.
+
+        Yields
+        ------
+        BoundEvent | tuple[int, list[BoundEvent]]
+            Each event that reached the world, or each tick's number and events when `batch`
+            is set.
+        """
+        if max_pending_ticks < 1:
+            raise ValueError("max_pending_ticks must be at least 1")
+        queue: asyncio.Queue[tuple[int, list[BoundEvent]] | BaseException | None] = (
+            asyncio.Queue(max_pending_ticks)
+        )
+
+        stopping = False
+
+        async def produce():
+            remaining = ticks
+            try:
+                while not stopping and (remaining is None or remaining > 0):
+                    tick = self.previous_iterations
+                    await queue.put((tick, await self.step()))
+                    if remaining is not None:
+                        remaining -= 1
+                    if until is not None and until(self):
+                        break
+            except Exception as error:
+                if not stopping:
+                    await queue.put(error)
+                    return
+                raise
+            if not stopping:
+                await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                if batch:
+                    yield item
+                else:
+                    for bound_event in item[1]:
+                        yield bound_event
+        finally:
+            # Let the tick in progress finish rather than cancelling it halfway through.
+            stopping = True
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
@@ -31,7 +31,9 @@ async def test_set_world():
     actor = Actor(world=world)
     actor.world = new_world
     assert actor.world == new_world, "Actor's world should be updated"
-    assert actor.location_id == new_world.id, "Actor's location_id should be the new world"
+    assert (
+        actor.location_id == new_world.id
+    ), "Actor's location_id should be the new world"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -41,7 +43,9 @@ async def test_set_location():
     actor = Actor(world=world)
     world.add_location(location)
     actor.location = location
-    assert actor.location_id == location.id, "Actor's location_id should be set correctly"
+    assert (
+        actor.location_id == location.id
+    ), "Actor's location_id should be set correctly"
     assert actor.location == location, "Actor's location should be set correctly"
 
 
@@ -146,4 +150,69 @@ async def test_event_handler_registration_and_calling():
 
     event = Event(type="SAY_ALOUD", context={})
     await actor.handle_event(actor, event)
-    assert handler_called, "Event handler should be called when event is handled"
\ No newline at end of file
+    assert handler_called, "Event handler should be called when event is handled"
+
+
+class Starling(Actor):
+    calls: list[int] = []
+
+    @classmethod
+    async def act_batch(cls, actors):
+        cls.calls.append(len(actors))
+        return [
+            (actor, Event(type="MURMUR")) for actor in actors if actor.name != "quiet"
+        ]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_act_batch_runs_once_per_class():
+    Starling.calls = []
+    world = RelativeWorld()
+    flock = Location(name="flock", private=False)
+    world.add_location(flock)
+    birds = [Starling(name=f"bird-{index}") for index in range(5)] + [
+        Starling(name="quiet")
+    ]
+    for bird in birds:
+        flock.add_entity(bird)
+    birds[0].sleep()
+
+    events = await world.step()
+    assert Starling.calls == [
+        5
+    ], "act_batch should be called once with every awake instance"
+    assert [source for source, _ in events] == birds[
+        1:5
+    ], "Events should be attributed to their source actors"
+
+    flock.remove_entity(birds[1])
+    await world.step()
+    assert Starling.calls == [5, 4], "Removed actors should leave the batch"
+
+    flock.sleep()
+    await world.step()
+    assert Starling.calls == [5, 4], "Actors inside sleeping locations should not act"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_act_batch_without_world_acts_alone():
+    Starling.calls = []
+    bird = Starling(name="stray")
+    events = [bound_event async for bound_event in bird.update()]
+    assert (
+        Starling.calls == [1] and events[0][0] is bird
+    ), "Actors outside a world should act on their own"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_default_act_batch_runs_act():
+    class Chatter(Actor):
+        async def act(self):
+            yield Event(type="CHAT")
+
+    chatters = [Chatter(), Chatter()]
+    produced = await Actor.act_batch(chatters)
+    assert [(source, event.type) for source, event in produced] == [
+        (chatters[0], "CHAT"),
+        (chatters[1], "CHAT"),
+    ], "The default batch should run each act"
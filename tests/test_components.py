@@ -0,0 +1,127 @@
+import io
+
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.location import Location
+from relative_world.world import RelativeWorld
+
+np = pytest.importorskip("numpy")
+
+
+class Grazer(Actor):
+    hunger: float = 0.0
+    herd: int = 1
+    component_fields = ("hunger", "herd")
+
+    async def act(self):
+        if self.hunger > 2:
+            self.hunger = 0.0
+        for _ in range(0):
+            yield
+
+
+class Lamb(Grazer):
+    bleats: bool = False
+
+
+def build_world() -> tuple[RelativeWorld, Location, Grazer, Lamb]:
+    world = RelativeWorld()
+    field = Location(name="field")
+    world.add_location(field)
+    grazer, lamb = Grazer(hunger=1.0), Lamb()
+    field.add_entity(grazer)
+    field.add_entity(lamb)
+    return world, field, grazer, lamb
+
+
+def get_hungry(store, world):
+    hunger = store.column("hunger")
+    hunger[store.mask("hunger")] += 1.5
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_component_fields_stay_transparent():
+    world, field, grazer, lamb = build_world()
+    store = world.enable_components()
+    assert len(store) == 2 and grazer in store, "Existing actors should be bound"
+    assert (
+        store.column("hunger")[store.row(grazer)] == 1.0
+    ), "Field values should move into the store"
+    grazer.hunger = 4.0
+    assert grazer.hunger == 4.0 and isinstance(
+        grazer.herd, int
+    ), "Reads and writes should go through the store"
+    assert (
+        grazer.model_dump()["hunger"] == 4.0
+    ), "Serialization should see stored values"
+    assert (
+        Lamb.model_fields["hunger"].default == 0.0
+    ), "Subclasses should inherit component fields unchanged"
+
+    field.remove_entity(grazer)
+    assert (
+        grazer not in store and grazer.hunger == 4.0
+    ), "Released actors should keep their stored values"
+    world.disable_components()
+    assert lamb._components is None, "Disabling should release every actor"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_integer_component_fields_reject_fractions():
+    world, _, grazer, _ = build_world()
+    world.enable_components()
+    grazer.herd = 3.0
+    assert grazer.herd == 3, "Integral floats should be stored"
+    with pytest.raises(ValueError):
+        grazer.herd = 2.7
+    assert grazer.herd == 3, "Rejected writes should leave the value unchanged"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_systems_update_columns_around_the_traversal():
+    world, field, grazer, lamb = build_world()
+    store = world.enable_components(capacity=1)
+    world.add_system(get_hungry)
+    seen = []
+    world.add_system(
+        lambda store, world: seen.append(store.column("hunger").tolist()), phase="after"
+    )
+
+    await world.step()
+    assert seen == [
+        [0.0, 1.5]
+    ], "Actors should act on values updated before the traversal"
+    await world.step()
+    assert (grazer.hunger, lamb.hunger) == (
+        1.5,
+        0.0,
+    ), "Systems and act should update the same values"
+
+    late = Grazer(hunger=9.0)
+    field.add_entity(late)
+    assert store.column("hunger").tolist() == [
+        1.5,
+        0.0,
+        9.0,
+    ], "Actors added later should be bound"
+    world.remove_system(get_hungry)
+    await world.step()
+    assert (
+        late.hunger == 0.0 and grazer.hunger == 1.5
+    ), "Removed systems should stop running"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_component_values_survive_snapshots():
+    world, field, grazer, _ = build_world()
+    world.enable_components()
+    grazer.hunger = 2.5
+    buffer = io.BytesIO()
+    world.save_snapshot(buffer)
+    buffer.seek(0)
+    restored = RelativeWorld.load_snapshot(buffer)
+    restored_grazer = await restored.find_by_id(grazer.id)
+    assert (
+        restored_grazer.hunger == 2.5 and restored.get_components() is None
+    ), "Snapshots should keep stored values"
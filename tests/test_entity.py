@@ -1,7 +1,7 @@
 import pytest
 import asyncio
 
-from relative_world.entity import Entity, BoundEvent
+from relative_world.entity import Entity, BoundEvent, ChildList
 from relative_world.event import Event
 from relative_world.location import Location
 
@@ -206,3 +206,311 @@ async def test_propagate_event_false():
         child.should_propagate_event((parent, event)) is False
         for child in parent.children
     ), "propagate_event should return False for the child entity"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_subscriptions_follow_handlers_and_tree():
+    class OtherEvent(Event):
+        type: str = "OTHER"
+
+    root = Entity()
+    parent = Entity()
+    child = Entity()
+    root.add_entity(parent)
+    parent.add_entity(child)
+
+    async def handler(entity, event):
+        pass
+
+    child.set_event_handler(OtherEvent, handler)
+    assert root.is_subscribed(
+        OtherEvent
+    ), "Ancestors should see descendant subscriptions"
+    assert not root.is_subscribed(
+        Event
+    ), "Unrelated event types should not be subscribed"
+
+    parent.remove_entity(child)
+    assert not root.is_subscribed(
+        OtherEvent
+    ), "Removing a subtree should drop its subscriptions"
+
+    parent.add_entity(child)
+    child.clear_event_handler(OtherEvent)
+    assert not root.is_subscribed(
+        OtherEvent
+    ), "Clearing a handler should drop its subscription"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_handle_event_skips_unsubscribed_subtrees():
+    received = []
+
+    class CountingEntity(Entity):
+        handled_event_types = (Event,)
+
+        async def handle_event(self, entity, event):
+            received.append(self)
+
+    class QuietEntity(Entity):
+        handled_event_types = ()
+
+        async def handle_event(self, entity, event):
+            raise AssertionError(
+                "Entities declaring no event types should not be visited"
+            )
+
+    listener = CountingEntity()
+    quiet = QuietEntity()
+    parent = Entity(children=[listener, quiet, Entity(children=[Entity()])])
+
+    await parent.handle_event(parent, Event(type="SAY_ALOUD"))
+    assert received == [listener], "Only subscribed entities should receive the event"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_overridden_handle_event_receives_everything():
+    received = []
+
+    class Listener(Entity):
+        async def handle_event(self, entity, event):
+            received.append(event)
+
+    listener = Listener()
+    parent = Entity()
+    parent.children = [listener]
+
+    event = Event(type="SAY_ALOUD")
+    await parent.handle_event(parent, event)
+    assert received == [
+        event
+    ], "handle_event overrides without declared types should receive every event"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_update_delivers_handled_events_as_one_batch():
+    batches = []
+
+    class Chatty(Entity):
+        async def update(self):
+            for index in range(3):
+                yield self, Event(type=f"SAY_{index}")
+
+    class Aggregator(Entity):
+        handled_event_types = (Event,)
+
+        async def handle_event_batch(self, batch):
+            batches.append([event.type for _, event in batch])
+
+    location = Location(private=True)
+    location.add_entity(Chatty())
+    location.add_entity(Aggregator())
+
+    events = [event async for event in location.update()]
+    assert events == [], "Private locations should not yield handled events"
+    assert batches == [
+        ["SAY_0", "SAY_1", "SAY_2"]
+    ], "Receivers should get one batch per tick"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_handle_event_batch_falls_back_to_handle_event():
+    received = []
+
+    class Listener(Entity):
+        async def handle_event(self, entity, event):
+            received.append(event)
+
+    async def handler(entity, event):
+        received.append(entity)
+
+    parent = Entity()
+    listener = Listener()
+    parent.add_entity(listener)
+    parent.set_event_handler(Event, handler)
+
+    first, second = Event(type="FIRST"), Event(type="SECOND")
+    await parent.handle_event_batch([(parent, first), (parent, second)])
+    assert received == [
+        parent,
+        parent,
+        first,
+        second,
+    ], "Handlers run before children receive their batch"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_event_receivers_cache_follows_subscriptions():
+    parent = Entity()
+    child = Entity()
+    parent.add_entity(child)
+    event = Event(type="SAY_ALOUD")
+    assert (
+        parent.get_event_receivers((parent, event)) == []
+    ), "Unsubscribed children should not receive"
+
+    async def handler(entity, event):
+        pass
+
+    child.set_event_handler(Event, handler)
+    assert parent.get_event_receivers((parent, event)) == [
+        child
+    ], "New subscriptions should refresh the cache"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_sleeping_entities_are_not_updated():
+    from relative_world.actor import Actor
+
+    class Worker(Actor):
+        acted: int = 0
+
+        async def act(self):
+            self.acted += 1
+            yield Event(type="WORK")
+
+    root = ExampleCancellingEntity()
+    location = Location()
+    worker = Worker()
+    location.add_entity(worker)
+    root.add_entity(location)
+
+    async for _ in root.update():
+        pass
+    assert worker.acted == 1, "Awake actors should act"
+
+    worker.sleep()
+    assert worker.dormant, "Sleeping entities should report it"
+    assert (
+        location.id not in root._awake
+    ), "A subtree with only sleeping entities should be skipped"
+    async for _ in root.update():
+        pass
+    assert worker.acted == 1, "Sleeping actors should not act"
+
+    worker.wake()
+    assert location.id in root._awake, "Waking an entity should wake its ancestors"
+    async for _ in root.update():
+        pass
+    assert worker.acted == 2, "Woken actors should act again"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_sleeping_entities_wake_on_events():
+    class Alarm(Event):
+        type: str = "ALARM"
+
+    parent = Entity()
+    sleeper = Entity()
+    parent.add_entity(sleeper)
+    sleeper.sleep(wake_on=[Alarm])
+    assert parent.is_subscribed(
+        Alarm
+    ), "Sleeping on an event type should subscribe to it"
+
+    await parent.handle_event_batch([(parent, Event(type="OTHER"))])
+    assert sleeper.dormant, "Other events should not wake the entity"
+    await parent.handle_event_batch([(parent, Alarm())])
+    assert not sleeper.dormant, "A wake event should wake the entity"
+    assert not parent.is_subscribed(Alarm), "Waking should drop the wake subscriptions"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_children_are_keyed_by_id():
+    parent = Entity(name="parent", children=[Entity(name="first")])
+    assert isinstance(
+        parent.children, ChildList
+    ), "Children should be stored in a ChildList"
+    child = Entity(name="second")
+    parent.add_entity(child)
+    assert (
+        child in parent.children and parent.children.get(child.id) is child
+    ), "Children should be found by id"
+    assert (
+        Entity(name="second", id=child.id) not in parent.children
+    ), "Membership should compare identity"
+    with pytest.raises(ValueError):
+        parent.children.append(Entity(name="impostor", id=child.id))
+    parent.remove_entity(child)
+    assert (
+        child not in parent.children and child._parent is None
+    ), "Removal should detach the child"
+    assert (
+        parent.model_dump()["children"][0]["name"] == "first"
+    ), "Children should serialize as a list"
+    parent.children = [child]
+    assert (
+        isinstance(parent.children, ChildList) and parent.children[0] is child
+    ), "Assigned lists should be wrapped"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_child_list_mutators_link_children():
+    parent = Entity(name="parent")
+    first, second = Entity(name="first"), Entity(name="second")
+    parent.children.extend([first, second])
+    assert (
+        first._parent is parent and second._parent is parent
+    ), "Extending should attach the children"
+    assert set(parent._awake) == set(), "Idle children should not be scheduled"
+
+    other = Entity(name="other")
+    other.children.append(first)
+    assert (
+        first not in parent.children and first._parent is other
+    ), "Appending should move a child between parents"
+
+    parent.children.clear()
+    assert (
+        len(parent.children) == 0 and second._parent is None
+    ), "Clearing should detach every child"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_child_list_positional_mutators_link_children():
+    parent = Entity(name="parent")
+    first, second, third = (
+        Entity(name="first"),
+        Entity(name="second"),
+        Entity(name="third"),
+    )
+    parent.children.extend([first, second])
+    parent.children.insert(0, third)
+    assert [child.name for child in parent.children] == [
+        "third",
+        "first",
+        "second",
+    ], "Insert should place the child"
+    assert third._parent is parent, "Inserted children should be attached"
+    assert parent.children.index(second) == 2 and parent.children[-1] is second
+
+    replacement = Entity(name="replacement")
+    parent.children[1] = replacement
+    assert (
+        first._parent is None and replacement._parent is parent
+    ), "Assigning an item should swap the children"
+    assert (
+        parent.children.pop() is second and second._parent is None
+    ), "Popping should detach the child"
+    del parent.children[0]
+    assert (
+        list(parent.children) == [replacement] and third._parent is None
+    ), "Deleting should detach the child"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_deep_copies_link_their_own_children():
+    child = Entity(name="child")
+    parent = Entity(name="parent", children=[child])
+    copied = parent.model_copy(deep=True)
+    [copied_child] = copied.children
+    assert (
+        copied_child is not child and copied_child._parent is copied
+    ), "Copied children should belong to the copy"
+    assert child._parent is parent, "The original should keep its children"
+
+    added = Entity(name="added")
+    copied.children.append(added)
+    assert (
+        added._parent is copied and added not in parent.children
+    ), "The copy's children should route to the copy"
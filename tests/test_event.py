@@ -0,0 +1,76 @@
+import pytest
+
+from relative_world.entity import Entity
+from relative_world.event import CoalesceRule, Event, coalesce_events
+
+
+class Headline(Event):
+    type: str = "HEADLINE"
+    headline: str
+    count: int = 1
+    coalesce = CoalesceRule(key=lambda event: event.headline, count_field="count")
+
+
+class Tally(Event):
+    type: str = "TALLY"
+    total: int
+    coalesce = CoalesceRule(
+        key=lambda event: event.type,
+        merge=lambda kept, later: Tally(total=kept.total + later.total),
+    )
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_coalesce_events_collapses_duplicates():
+    first, second = Entity(name="first"), Entity(name="second")
+    plain = Event(type="PLAIN")
+    batch = [
+        (first, Headline(headline="Rain")),
+        (first, plain),
+        (second, Headline(headline="Rain")),
+        (second, Headline(headline="Sun")),
+        (first, plain),
+    ]
+    coalesced = coalesce_events(batch)
+    assert [(source.name, event.type) for source, event in coalesced] == [
+        ("second", "HEADLINE"),
+        ("first", "PLAIN"),
+        ("second", "HEADLINE"),
+        ("first", "PLAIN"),
+    ], "Duplicates should collapse into the first one's place, attributed to the last source"
+    assert [event.count for _, event in coalesced if isinstance(event, Headline)] == [
+        2,
+        1,
+    ], "Counts should add up"
+    assert batch[0][1].count == 1, "Coalescing should not modify the original events"
+
+    again = coalesce_events([coalesced[0], (first, Headline(headline="Rain", count=3))])
+    assert again[0][1].count == 5, "Counts should accumulate across levels"
+
+    merged = coalesce_events([(first, Tally(total=2)), (second, Tally(total=3))])
+    assert [(source, event.total) for source, event in merged] == [
+        (second, 5)
+    ], "Merge functions should combine events"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_coalesce_rule_validation():
+    with pytest.raises(ValueError):
+        CoalesceRule(key=lambda event: event.type, keep="middle")
+    with pytest.raises(TypeError):
+
+        class Broken(Event):
+            coalesce = CoalesceRule(key=lambda event: event.type, count_field="missing")
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_popped_batches_are_coalesced():
+    entity = Entity()
+    for _ in range(3):
+        entity.emit_event(Headline(headline="Rain"))
+    entity.emit_event(Headline(headline="Sun"))
+    popped = [event async for _, event in entity.pop_event_batch_iterator()]
+    assert [(event.headline, event.count) for event in popped] == [
+        ("Rain", 3),
+        ("Sun", 1),
+    ], "Staged duplicates should be collapsed"
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from relative_world.graph import LocationGraph
+
+
+def naive_distance(edges: dict[int, set[int]], start: int, end: int) -> int | None:
+    seen = {start: 0}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for node in frontier:
+            for neighbour in edges[node]:
+                if neighbour not in seen:
+                    seen[neighbour] = seen[node] + 1
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    return seen.get(end)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_graph_queries_on_a_chain():
+    graph = LocationGraph({"a": {"b"}, "b": {"a", "c"}, "c": {"b"}, "d": set()})
+    assert graph.shortest_path("a", "c") == [
+        "a",
+        "b",
+        "c",
+    ], "Paths should include both ends"
+    assert graph.distance("a", "c") == 2 and graph.distance("a", "a") == 0
+    assert (
+        graph.distance("a", "d") is None and graph.shortest_path("a", "d") is None
+    ), "Unconnected nodes have no path"
+    assert graph.neighbourhood("a", 1) == (
+        "a",
+        "b",
+    ), "Neighbourhoods should stop at the radius"
+    assert graph.neighbourhood("a", 5) == (
+        "a",
+        "b",
+        "c",
+    ), "Neighbourhoods should stop at the component"
+    assert sorted(map(sorted, graph.components())) == [["a", "b", "c"], ["d"]]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_graph_updates_incrementally():
+    graph = LocationGraph({"a": {"b"}, "b": {"a"}, "c": {"d"}, "d": {"c"}})
+    assert graph.neighbourhood("a", 3) == ("a", "b")
+    graph.neighbourhood("c", 3)
+    unrelated = graph._searches[graph._index["c"]]
+    graph.connect("b", "e")
+    assert (
+        graph._searches[graph._index["c"]] is unrelated
+    ), "Searches in other components should stay cached"
+    assert graph.neighbourhood("a", 3) == (
+        "a",
+        "b",
+        "e",
+    ), "Connecting should refresh affected searches"
+    graph.components()
+    graph.connect("e", "c")
+    assert graph.component_of("a") == graph.component_of(
+        "d"
+    ), "Components should merge incrementally"
+    assert graph.distance("a", "d") == 4
+    graph.remove_node("e")
+    assert (
+        graph.distance("a", "d") is None
+    ), "Removing a node should split paths through it"
+    assert "e" not in graph and len(graph) == 4
+    graph.add_node("f")
+    assert graph.component_of("f") == (
+        "f",
+    ), "Removed slots should be reused for new nodes"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_graph_distances_match_breadth_first_search():
+    rng = random.Random(3)
+    edges = {node: set() for node in range(200)}
+    graph = LocationGraph(edges)
+    for _ in range(300):
+        a, b = rng.randrange(200), rng.randrange(200)
+        if a != b:
+            edges[a].add(b)
+            edges[b].add(a)
+            graph.connect(a, b)
+        start, end = rng.randrange(200), rng.randrange(200)
+        assert graph.distance(start, end) == naive_distance(
+            edges, start, end
+        ), "Cached distances should stay exact"
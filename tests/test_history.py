@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from relative_world.actor import Actor
+from relative_world.event import Event
+from relative_world.history import EventHistory
+from relative_world.location import Location
+from relative_world.world import RelativeWorld
+
+START = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+class CallEvent(Event):
+    type: str = "CALL"
+    volume: int
+
+
+class QuietEvent(Event):
+    type: str = "QUIET"
+
+
+class Caller(Actor):
+    async def act(self):
+        yield CallEvent(volume=len(self.name))
+
+
+def build_world(**options) -> tuple[RelativeWorld, Location, Location, Caller, Caller]:
+    world = RelativeWorld(
+        simulation_start_time=START, tick_duration=timedelta(minutes=20)
+    )
+    meadow, marsh = Location(name="meadow"), Location(name="marsh")
+    world.add_location(meadow)
+    world.add_location(marsh)
+    lark, heron = Caller(name="lark"), Caller(name="heron")
+    meadow.add_entity(lark)
+    marsh.add_entity(heron)
+    world.enable_history(**options)
+    return world, meadow, marsh, lark, heron
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_history_records_columns():
+    world, meadow, marsh, lark, heron = build_world()
+    marsh.emit_event(QuietEvent())
+    for _ in range(3):
+        await world.step()
+    history = world.get_history()
+
+    assert len(history) == 7, "Every produced event should be recorded once"
+    columns = history.select(start_tick=1)
+    assert columns["tick"].tolist() == [1, 1, 2, 2], "Rows should filter by tick"
+    assert set(history.entity_ids(columns["location"])) == {
+        meadow.id,
+        marsh.id,
+    }, "Rows should record the source's location"
+    assert columns["timestamp"][0] == columns["timestamp"].dtype.type(
+        START.replace(tzinfo=None) + timedelta(minutes=20)
+    ), "Rows should record simulation time"
+    quiet = history.select(event_type=QuietEvent)
+    assert history.entity_ids(quiet["source"]) == [
+        marsh.id
+    ], "Rows should filter by type"
+    assert [event.volume for _, _, event in history.events(source_id=lark.id)] == [
+        4,
+        4,
+        4,
+    ], "Events should be restorable"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_history_counts_per_location_per_hour():
+    world, meadow, marsh, *_ = build_world()
+    for _ in range(6):
+        await world.step()
+    counts = world.get_history().count_by(
+        "location", interval=timedelta(hours=1), event_type=CallEvent
+    )
+    assert counts == {
+        (meadow.id, START): 3,
+        (meadow.id, START + timedelta(hours=1)): 3,
+        (marsh.id, START): 3,
+        (marsh.id, START + timedelta(hours=1)): 3,
+    }, "Events should be counted per location and hour"
+    assert world.get_history().count_by("type") == {
+        "tests.test_history.CallEvent": 12
+    }, "Events should be counted per type"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_history_evicts_chunks_to_disk(tmp_path):
+    world, meadow, marsh, lark, heron = build_world(
+        directory=tmp_path, chunk_rows=4, max_chunks_in_memory=1
+    )
+    for _ in range(10):
+        await world.step()
+    history = world.get_history()
+    assert (
+        history.memory_chunks == 1 and history.disk_chunks == 4
+    ), "Old chunks should be evicted"
+    assert (
+        len(list(tmp_path.iterdir())) == 4
+    ), "Evicted chunks should be written to the directory"
+    assert history.select(source_id=heron.id)["tick"].tolist() == list(
+        range(10)
+    ), "Scans should read evicted chunks"
+    assert [tick for tick, _, _ in history.events(start_tick=8)] == [
+        8,
+        8,
+        9,
+        9,
+    ], "Events should be read from every chunk"
+    assert history.count_by("source") == {
+        lark.id: 10,
+        heron.id: 10,
+    }, "Aggregations should span every chunk"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_history_without_payloads():
+    history = EventHistory(store_payloads=False)
+    assert len(history.select()["tick"]) == 0, "An empty history should select no rows"
+    with pytest.raises(ValueError):
+        next(history.events())
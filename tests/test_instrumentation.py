@@ -0,0 +1,83 @@
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.event import Event
+from relative_world.location import Location
+from relative_world.world import RelativeWorld
+
+
+class Talker(Actor):
+    async def act(self):
+        yield Event(type="HELLO")
+        yield Event(type="WORLD")
+
+
+def build_world() -> tuple[RelativeWorld, Location, Talker, Actor]:
+    world = RelativeWorld()
+    location = Location(name="square")
+    world.add_location(location)
+    talker = Talker()
+    listener = Actor()
+    location.add_entity(talker)
+    location.add_entity(listener)
+    return world, location, talker, listener
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_disabled_by_default():
+    world, location, talker, _ = build_world()
+    assert talker.get_instrumentation() is None, "Instrumentation should be opt-in"
+    await world.step()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_step_records_per_entity_stats():
+    world, location, talker, listener = build_world()
+    handled = []
+
+    async def handler(entity, event):
+        handled.append(event)
+
+    listener.set_event_handler(Event, handler)
+    instrumentation = world.enable_instrumentation()
+    await world.step()
+
+    talker_stats = instrumentation.get_stats(talker.id)
+    assert talker_stats.update_calls == 1, "Each update should be timed"
+    assert (
+        talker_stats.events_emitted == 2
+    ), "Events yielded by the actor should be counted"
+    assert (
+        talker_stats.location_id == location.id
+    ), "Actors should be attributed to their location"
+
+    listener_stats = instrumentation.get_stats(listener.id)
+    assert listener_stats.events_received == 2, "Delivered events should be counted"
+    assert listener_stats.handler_calls == 2, "Handler calls should be timed"
+    assert instrumentation.steps == 1
+
+    by_class = instrumentation.aggregate("class")
+    assert by_class["Talker"].events_emitted == 2
+    by_location = instrumentation.aggregate("location")
+    assert by_location[str(location.id)].events_received == 2
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_queue_high_water_and_reset():
+    world, location, talker, _ = build_world()
+    location.private = False
+    instrumentation = world.enable_instrumentation(reset_each_step=False)
+    await world.step()
+    await world.step()
+    assert (
+        instrumentation.get_stats(location.id).queue_high_water == 2
+    ), "Queue depth should be tracked"
+    assert (
+        instrumentation.get_stats(talker.id).update_calls == 2
+    ), "Stats should accumulate across steps"
+    assert instrumentation.slowest(1)[0].key == str(
+        world.id
+    ), "The world's step should be the slowest update"
+
+    world.disable_instrumentation()
+    assert talker.get_instrumentation() is None
@@ -0,0 +1,208 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.event import Event
+from relative_world.journal import JournalReader, replay
+from relative_world.location import Location
+from relative_world.world import RelativeWorld
+
+
+class ChirpEvent(Event):
+    type: str = "CHIRP"
+    count: int
+
+
+class WhisperEvent(Event):
+    type: str = "WHISPER"
+
+
+class Bird(Actor):
+    chirps: int = 0
+
+    async def act(self):
+        self.chirps += 1
+        yield ChirpEvent(count=self.chirps)
+
+
+class Counter(Actor):
+    heard: int = 0
+    handled_event_types = (ChirpEvent,)
+
+    async def handle_event(self, entity, event):
+        self.heard += 1
+
+
+def build_world() -> tuple[RelativeWorld, Location, Bird]:
+    world = RelativeWorld(
+        simulation_start_time=datetime(2000, 1, 1, tzinfo=timezone.utc)
+    )
+    forest = Location(name="forest", private=False)
+    world.add_location(forest)
+    bird = Bird(name="bird")
+    forest.add_entity(bird)
+    return world, forest, bird
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_journal_records_each_event_once(tmp_path):
+    world, forest, bird = build_world()
+    path = tmp_path / "events.journal"
+    world.enable_journal(path)
+    forest.emit_event(WhisperEvent())
+    for _ in range(3):
+        await world.step()
+    world.disable_journal()
+
+    with JournalReader(path) as reader:
+        entries = list(reader.entries())
+        assert [
+            (entry.tick, entry.event_type.rsplit(".", 1)[-1]) for entry in entries
+        ] == [
+            (0, "ChirpEvent"),
+            (0, "WhisperEvent"),
+            (1, "ChirpEvent"),
+            (2, "ChirpEvent"),
+        ], "Every produced event should be journaled once, in tick order"
+        assert (
+            entries[0].source_id == bird.id and entries[1].source_id == forest.id
+        ), "Sources should be recorded"
+        assert entries[2].created_at == datetime(
+            2000, 1, 1, 0, 0, 1, tzinfo=timezone.utc
+        ), "Simulation time should be recorded"
+        assert (
+            entries[3].event.count == 3
+        ), "Events should be restorable from their payload"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_journal_filters(tmp_path):
+    world, forest, bird = build_world()
+    path = tmp_path / "events.journal"
+    world.enable_journal(path)
+    forest.emit_event(WhisperEvent())
+    for _ in range(4):
+        await world.step()
+    world.disable_journal()
+
+    with JournalReader(path) as reader:
+        assert [entry.tick for entry in reader.entries(start_tick=2)] == [
+            2,
+            3,
+        ], "start_tick should skip earlier ticks"
+        assert [entry.tick for entry in reader.entries(end_tick=1)] == [
+            0,
+            0,
+        ], "end_tick should stop before the tick"
+        assert [
+            entry.event.count for entry in reader.entries(event_type=ChirpEvent)
+        ] == [1, 2, 3, 4], "Events should filter by class"
+        assert (
+            len(list(reader.entries(source_id=forest.id))) == 1
+        ), "Events should filter by source"
+        assert [tick for tick, _ in reader.iter_ticks()] == [
+            0,
+            1,
+            2,
+            3,
+        ], "Events should group by tick"
+        assert (
+            reader.tick_offsets()[0] < reader.tick_offsets()[1]
+        ), "Ticks should be indexed by offset"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_journal_appends_across_sessions(tmp_path):
+    world, _, _ = build_world()
+    path = tmp_path / "events.journal"
+    world.enable_journal(path)
+    await world.step()
+    world.enable_journal(path)
+    await world.step()
+    world.disable_journal()
+
+    with JournalReader(path) as reader:
+        assert [entry.tick for entry in reader.entries()] == [
+            0,
+            1,
+        ], "Reopening a journal should append to it"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_journal_filters_ticks_written_after_a_rewind(tmp_path):
+    world, _, _ = build_world()
+    path = tmp_path / "events.journal"
+    world.enable_journal(path)
+    for _ in range(3):
+        await world.step()
+    world.previous_iterations = 1
+    for _ in range(2):
+        await world.step()
+    world.disable_journal()
+
+    with JournalReader(path) as reader:
+        assert [entry.tick for entry in reader.entries()] == [
+            0,
+            1,
+            2,
+            1,
+            2,
+        ], "Rewound ticks should be appended"
+        assert [entry.tick for entry in reader.entries(end_tick=2)] == [
+            0,
+            1,
+            1,
+        ], "end_tick should not stop at a later tick"
+        assert [entry.tick for entry in reader.entries(start_tick=1, end_tick=2)] == [
+            1,
+            1,
+        ], "Both bounds should filter"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_replay_delivers_journaled_events(tmp_path):
+    world, _, _ = build_world()
+    path = tmp_path / "events.journal"
+    world.enable_journal(path)
+    for _ in range(3):
+        await world.step()
+    world.disable_journal()
+
+    target = RelativeWorld(tick_duration=timedelta(minutes=1))
+    counter = Counter(name="counter")
+    target.add_entity(counter)
+    with JournalReader(path) as reader:
+        await replay(target, reader, start_tick=1)
+    assert counter.heard == 2, "Replay should deliver the events of the requested ticks"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_replay_keeps_events_inside_private_locations(tmp_path):
+    world = RelativeWorld()
+    nest, burrow = Location(name="nest"), Location(name="burrow")
+    world.add_location(nest)
+    world.add_location(burrow)
+    nest.add_entity(Bird(name="bird"))
+    nearby, elsewhere = Counter(name="nearby"), Counter(name="elsewhere")
+    nest.add_entity(nearby)
+    burrow.add_entity(elsewhere)
+    path = tmp_path / "events.journal"
+    world.enable_journal(path)
+    for _ in range(2):
+        await world.step()
+    world.disable_journal()
+    live = (nearby.heard, elsewhere.heard)
+    assert live == (2, 0), "Private locations should keep their events"
+
+    nearby.heard = elsewhere.heard = 0
+    with JournalReader(path) as reader:
+        assert [entry.scope_id for entry in reader.entries(delivered=True)] == [
+            nest.id,
+            nest.id,
+        ], "Deliveries should record their scope"
+        await replay(world, reader)
+    assert (
+        nearby.heard,
+        elsewhere.heard,
+    ) == live, "Replay should deliver events where they were delivered live"
@@ -1,4 +1,5 @@
 import pytest
+from relative_world.actor import Actor
 from relative_world.entity import Entity
 from relative_world.event import Event
 from relative_world.location import Location
@@ -33,4 +34,13 @@ async def test_propagate_event_not_private():
 
     event = Event(type="SAY_ALOUD", context={})
     result = parent.should_propagate_event(bound_event=(parent, event))
-    assert result, "Event should propagate because location is not private"
\ No newline at end of file
+    assert result, "Event should propagate because location is not private"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_add_actor_adds_once():
+    location = Location()
+    actor = Actor()
+    location.add_actor(actor)
+    assert location.children == [actor], "add_actor should add the actor exactly once"
+    assert actor.location_id == location.id, "add_actor should set the actor's location"
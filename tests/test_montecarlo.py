@@ -0,0 +1,162 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.event import Event
+from relative_world.location import Location
+from relative_world.montecarlo import MonteCarloRunner, RunResult, event_counts
+from relative_world.world import RelativeWorld
+
+
+class CoinEvent(Event):
+    type: str = "COIN"
+
+
+class Flipper(Actor):
+    async def act(self):
+        if random.random() < 0.5:
+            yield CoinEvent()
+
+
+class Sleeper(Actor):
+    async def act(self):
+        await asyncio.sleep(5)
+        yield CoinEvent()
+
+
+class Blocker(Actor):
+    async def act(self):
+        time.sleep(3)
+        yield CoinEvent()
+
+
+def flipping_world(seed: int) -> RelativeWorld:
+    if seed < 0:
+        raise ValueError("Negative seeds are not allowed")
+    world = RelativeWorld()
+    table = Location(name="table", private=False)
+    world.add_location(table)
+    for index in range(random.randint(1, 5)):
+        table.add_entity(Flipper(name=f"flipper-{index}"))
+    return world
+
+
+def sleeping_world(seed: int) -> RelativeWorld:
+    world = RelativeWorld()
+    bed = Location(name="bed", private=False)
+    world.add_location(bed)
+    bed.add_entity(Sleeper())
+    return world
+
+
+def blocking_world(seed: int) -> RelativeWorld:
+    if seed == 0:
+        time.sleep(30)
+    world = RelativeWorld()
+    world.add_entity(Blocker())
+    return world
+
+
+def total_coins(world: RelativeWorld, summaries: list[dict[str, int]]) -> int:
+    return sum(summary.get("COIN", 0) for summary in summaries)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_runs_stream_back_reproducible_summaries():
+    progress = []
+    runner = MonteCarloRunner(
+        flipping_world,
+        ticks=4,
+        max_workers=2,
+        on_result=lambda result, done, total: progress.append((done, total)),
+    )
+    results = {result.seed: result async for result in runner.run(range(4))}
+    assert sorted(results) == [0, 1, 2, 3], "Every seed should produce a result"
+    assert all(result.ok and result.ticks == 4 for result in results.values())
+    assert all(
+        len(result.value) == 4 for result in results.values()
+    ), "Each tick should be summarized"
+    assert progress == [
+        (1, 4),
+        (2, 4),
+        (3, 4),
+        (4, 4),
+    ], "Progress should be reported for every result"
+
+    reduced = MonteCarloRunner(
+        flipping_world, ticks=4, reduce=total_coins, max_workers=2
+    )
+    totals = {result.seed: result.value async for result in reduced.run(range(4))}
+    assert totals == {
+        seed: total_coins(None, result.value) for seed, result in results.items()
+    }, "Runs with the same seed should reproduce the same events"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_failures_and_timeouts_are_reported():
+    failing = [
+        result
+        async for result in MonteCarloRunner(
+            flipping_world, ticks=1, max_workers=1
+        ).run([-1])
+    ]
+    assert (
+        "Negative seeds are not allowed" in failing[0].error
+    ), "Errors should carry the worker's traceback"
+    assert not failing[0].ok
+
+    slow = [
+        result
+        async for result in MonteCarloRunner(
+            sleeping_world, ticks=3, max_workers=1, timeout=0.2
+        ).run([0])
+    ]
+    assert (
+        slow[0].timed_out and slow[0].ticks == 0 and slow[0].value is None
+    ), "Runs over the timeout should stop"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_blocked_runs_are_stopped_by_the_runner():
+    runner = MonteCarloRunner(blocking_world, ticks=3, max_workers=1, timeout=0.2)
+    start = time.monotonic()
+    results = [result async for result in runner.run([0, 1])]
+    assert (
+        time.monotonic() - start < 2.5
+    ), "Blocked runs should not outlive their timeout by much"
+    assert [result.seed for result in results] == [
+        0,
+        1,
+    ], "A killed worker should be replaced for the next run"
+    assert all(
+        result.timed_out and result.ticks == 0 for result in results
+    ), "Hung factories and blocking ticks should time out"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_cancel_skips_remaining_runs():
+    runner = MonteCarloRunner(flipping_world, ticks=2, max_workers=1)
+    results: list[RunResult] = []
+    async for result in runner.run(range(10)):
+        results.append(result)
+        runner.cancel()
+    assert len(results) == 10, "Every seed should be accounted for"
+    assert results[0].ok, "The first run should finish"
+    assert all(
+        result.cancelled for result in results[3:]
+    ), "Runs that never started should be cancelled"
+    assert runner.completed == runner.total == 10
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_event_counts():
+    source = Actor()
+    assert event_counts(
+        None, [(source, CoinEvent()), (source, CoinEvent()), (source, Event(type="X"))]
+    ) == {
+        "COIN": 2,
+        "X": 1,
+    }
@@ -0,0 +1,153 @@
+import pickle
+
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.entity import Entity
+from relative_world.event import CoalesceRule, Event
+from relative_world.location import Location
+from relative_world.queues import QueueLimit
+from relative_world.world import RelativeWorld
+
+
+class ChirpEvent(Event):
+    type: str = "CHIRP"
+    number: int
+
+
+class AlarmEvent(ChirpEvent):
+    type: str = "ALARM"
+    propagation_priority = 1
+
+
+class EchoEvent(Event):
+    type: str = "ECHO"
+    count: int = 1
+    coalesce = CoalesceRule(key=lambda event: event.type, count_field="count")
+
+
+class Chatterbox(Actor):
+    async def act(self):
+        for number in range(10):
+            yield ChirpEvent(number=number)
+
+
+async def pop_numbers(entity: Entity) -> list[int]:
+    return [event.number async for _, event in entity.pop_event_batch_iterator()]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_drop_policies_keep_priorities():
+    entity = Entity()
+    limit = entity.limit_queue(3)
+    for number in range(5):
+        entity.emit_event(ChirpEvent(number=number))
+    entity.emit_event(AlarmEvent(number=99))
+    assert await pop_numbers(entity) == [
+        99,
+        3,
+        4,
+    ], "drop_oldest should keep high priority and the newest events"
+    assert limit.dropped == 3, "Dropped events should be counted"
+
+    limit = entity.limit_queue(3, overflow="drop_newest")
+    for number in range(5):
+        entity.emit_event(ChirpEvent(number=number))
+    assert await pop_numbers(entity) == [
+        0,
+        1,
+        2,
+    ], "drop_newest should keep the oldest events"
+    assert limit.dropped == 2
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_queue_never_grows_past_twice_its_capacity():
+    entity = Entity()
+    entity.limit_queue(4)
+    for number in range(100):
+        entity.emit_event(ChirpEvent(number=number))
+        assert (
+            len(entity._propagation_queue) < 8
+        ), "Queues should be trimmed as they grow"
+    assert await pop_numbers(entity) == [96, 97, 98, 99]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_coalesce_policy_collapses_before_dropping():
+    entity = Entity()
+    limit = entity.limit_queue(2, overflow="coalesce")
+    for _ in range(3):
+        entity.emit_event(EchoEvent())
+    entity.emit_event(ChirpEvent(number=1))
+    popped = [event async for _, event in entity.pop_event_batch_iterator()]
+    assert [(event.type, getattr(event, "count", None)) for event in popped] == [
+        ("ECHO", 3),
+        ("CHIRP", None),
+    ]
+    assert (limit.coalesced, limit.dropped) == (
+        2,
+        0,
+    ), "Coalesced events should not count as dropped"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_spilled_events_return_in_later_ticks(tmp_path):
+    entity = Entity()
+    limit = entity.limit_queue(4, overflow="spill", directory=tmp_path)
+    for number in range(10):
+        entity.emit_event(ChirpEvent(number=number))
+    assert await pop_numbers(entity) == [
+        0,
+        1,
+        2,
+        3,
+    ], "Spilling should keep the oldest events in memory"
+    assert (limit.spilled, limit.pending, limit.dropped) == (6, 2, 0)
+    assert (
+        not entity._is_idle()
+    ), "Entities with spilled events should keep being updated"
+
+    restored = pickle.loads(pickle.dumps(entity))
+    assert await pop_numbers(restored) == [
+        4,
+        5,
+        6,
+        7,
+    ], "Spilled events should survive pickling"
+
+    assert await pop_numbers(entity) == [
+        4,
+        5,
+        6,
+        7,
+    ], "Spilled events should come back oldest first"
+    entity.emit_event(ChirpEvent(number=10))
+    entity.limit_queue(None)
+    assert await pop_numbers(entity) == [
+        8,
+        9,
+        10,
+    ], "Removing the limit should release spilled events"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_location_limit_bounds_what_reaches_the_world():
+    world = RelativeWorld()
+    world.enable_instrumentation()
+    square = Location(name="square", private=False)
+    world.add_location(square)
+    square.add_entity(Chatterbox(name="loud"))
+    limit = square.limit_queue(3)
+
+    events = await world.step()
+    assert [event.number for _, event in events] == [
+        7,
+        8,
+        9,
+    ], "Only the location's capacity should propagate"
+    assert limit.dropped == 7
+    assert (
+        world.get_instrumentation().get_stats(square.id).events_dropped == 7
+    ), "Drops should be instrumented"
+    assert isinstance(limit, QueueLimit)
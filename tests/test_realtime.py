@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.realtime import RealtimeRunner
+from relative_world.world import RelativeWorld
+
+
+class Busy(Actor):
+    priority: int = 10
+    delays: list[float] = []
+    acted: int = 0
+
+    async def act(self):
+        delay = self.delays[self.acted] if self.acted < len(self.delays) else 0.0
+        self.acted += 1
+        time.sleep(delay)
+        for _ in range(0):
+            yield
+
+
+class Idler(Actor):
+    acted: int = 0
+
+    async def act(self):
+        self.acted += 1
+        for _ in range(0):
+            yield
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_runner_keeps_a_steady_rate():
+    world = RelativeWorld()
+    reports = []
+    runner = RealtimeRunner(world, tick_rate=200, on_tick=reports.append)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await runner.run(ticks=5)
+    assert world.previous_iterations == 5, "The runner should run the requested ticks"
+    assert loop.time() - started >= 0.018, "Ticks should start one interval apart"
+    assert [report.tick for report in reports] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ], "Every tick should be reported"
+    assert (
+        runner.stats.ticks == 5 and runner.stats.overruns == 0
+    ), "Fast ticks should not overrun"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_runner_catches_up_and_drops_ticks():
+    world = RelativeWorld()
+    world.add_entity(Busy(delays=[0.065]))
+    runner = RealtimeRunner(world, tick_rate=100, max_catch_up=2)
+    await runner.run(ticks=5)
+    stats = runner.stats
+    assert stats.overruns >= 1, "A slow tick should be reported as an overrun"
+    assert stats.dropped_ticks >= 1, "Ticks beyond the catch-up limit should be dropped"
+    assert (
+        1 <= stats.catch_up_ticks <= 4
+    ), "Lost time should be made up with a bounded number of ticks"
+    assert stats.max_jitter >= 0.01, "Late ticks should be reported as jitter"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_runner_defers_low_priority_actors_when_over_budget():
+    world = RelativeWorld()
+    world.add_entity(Busy(delays=[0.015] * 3))
+    idler = Idler()
+    world.add_entity(idler)
+    runner = RealtimeRunner(world, tick_rate=100, max_catch_up=0, defer_below=1)
+    await runner.run(ticks=4)
+    assert (
+        idler.acted == 1
+    ), "Low-priority actors should skip acting while ticks overrun"
+    await runner.run(ticks=2)
+    assert idler.acted == 3, "Deferred actors should resume once ticks fit the budget"
+    assert (
+        world.deferred_priority is None
+    ), "Deferral should be lifted when the run ends"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_runner_keeps_deferral_set_before_the_run():
+    world = RelativeWorld()
+    idler = Idler()
+    world.add_entity(idler)
+    world.defer_actors(1)
+    runner = RealtimeRunner(world, tick_rate=100, defer_below=1)
+    await runner.run(ticks=2)
+    assert idler.acted == 0, "A deferral set before the run should stay in effect"
+    assert (
+        world.deferred_priority == 1
+    ), "The previous deferral should be restored when the run ends"
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.location import Location
+from relative_world.scheduler import DEFAULT_SCHEDULER, TickScheduler
+from relative_world.world import RelativeWorld
+
+
+class TrackingActor(Actor):
+    async def act(self):
+        tracker = self.world.tracker
+        tracker["active"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["active"])
+        tracker["order"].append(self.name)
+        await asyncio.sleep(0)
+        tracker["active"] -= 1
+        for _ in range(0):
+            yield
+
+
+class TrackedWorld(RelativeWorld):
+    tracker: dict = {}
+
+
+def build_world(locations: int, actors_per_location: int) -> TrackedWorld:
+    world = TrackedWorld(tracker={"active": 0, "peak": 0, "order": []})
+    for location_index in range(locations):
+        location = Location()
+        world.add_location(location)
+        for actor_index in range(actors_per_location):
+            location.add_entity(TrackingActor(name=f"{location_index}-{actor_index}"))
+    return world
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_default_scheduler_is_unbounded():
+    world = RelativeWorld()
+    assert (
+        world.get_scheduler() is DEFAULT_SCHEDULER
+    ), "Worlds should use the default scheduler"
+    assert (
+        not DEFAULT_SCHEDULER.bounded
+    ), "The default scheduler should not limit concurrency"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_global_limit_bounds_concurrent_leaves():
+    world = build_world(locations=4, actors_per_location=5)
+    world.set_scheduler(TickScheduler(max_concurrency=3))
+    await world.step()
+    assert (
+        world.tracker["peak"] == 3
+    ), "At most max_concurrency actors should act at once"
+    assert len(world.tracker["order"]) == 20, "Every actor should still act"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_per_location_limit():
+    world = build_world(locations=3, actors_per_location=4)
+    world.set_scheduler(TickScheduler(per_location_limit=1))
+    await world.step()
+    assert world.tracker["peak"] == 3, "Each location should update one actor at a time"
+    for location_index in range(3):
+        names = [
+            name
+            for name in world.tracker["order"]
+            if name.startswith(f"{location_index}-")
+        ]
+        assert names == [
+            f"{location_index}-{i}" for i in range(4)
+        ], "Children should start in order"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_invalid_limit():
+    with pytest.raises(ValueError):
+        TickScheduler(max_concurrency=0)
@@ -0,0 +1,198 @@
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.event import CoalesceRule, Event
+from relative_world.journal import JournalReader
+from relative_world.location import Location
+from relative_world.sharding import ShardError, partition_locations
+from relative_world.world import RelativeWorld
+
+
+class PingEvent(Event):
+    type: str = "PING"
+    sender: str
+
+
+class Pinger(Actor):
+    pings: int = 0
+
+    async def act(self):
+        self.pings += 1
+        yield PingEvent(sender=self.name)
+
+
+class Listener(Actor):
+    heard: list[str] = []
+    handled_event_types = (PingEvent,)
+
+    async def handle_event(self, entity, event):
+        self.heard.append(event.sender)
+
+
+class TallyEvent(Event):
+    type: str = "TALLY"
+    coalesce = CoalesceRule(key=lambda event: event.type, count_field="count")
+    count: int = 1
+
+
+class Tallier(Actor):
+    async def act(self):
+        yield TallyEvent()
+
+
+class TallyWorld(RelativeWorld):
+    tallies: list[int] = []
+
+    def should_propagate_event(self, bound_event):
+        return False
+
+    async def handle_event(self, entity, event):
+        if isinstance(event, TallyEvent):
+            self.tallies.append(event.count)
+
+
+class Drone(Actor):
+    @classmethod
+    async def act_batch(cls, actors):
+        return [(actor, PingEvent(sender=actor.name)) for actor in actors]
+
+
+def build_world() -> RelativeWorld:
+    world = RelativeWorld()
+    for index in range(4):
+        location = Location(name=f"location-{index}", private=False)
+        world.add_location(location)
+        location.add_entity(Pinger(name=f"pinger-{index}"))
+        location.add_entity(Listener(name=f"listener-{index}"))
+    return world
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_partition_keeps_connected_locations_together():
+    world = RelativeWorld()
+    locations = [Location() for _ in range(6)]
+    for location in locations:
+        world.add_location(location)
+    for left, right in [(0, 1), (1, 2), (3, 4)]:
+        world.connect_locations(locations[left].id, locations[right].id)
+
+    shards = partition_locations(world, 2)
+    assert sorted(len(shard) for shard in shards) == [
+        3,
+        3,
+    ], "Components should be packed whole"
+    by_location = {
+        location_id: index
+        for index, shard in enumerate(shards)
+        for location_id in shard
+    }
+    assert (
+        by_location[locations[0].id]
+        == by_location[locations[1].id]
+        == by_location[locations[2].id]
+    )
+    assert by_location[locations[3].id] == by_location[locations[4].id]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_partition_splits_oversized_components():
+    world = RelativeWorld()
+    locations = [Location() for _ in range(4)]
+    for location in locations:
+        world.add_location(location)
+    for left, right in zip(locations, locations[1:]):
+        world.connect_locations(left.id, right.id)
+
+    shards = partition_locations(world, 2)
+    assert shards == [
+        [locations[0].id, locations[1].id],
+        [locations[2].id, locations[3].id],
+    ]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_sharded_step_matches_local_delivery():
+    world = build_world()
+    world.start_sharding(shard_count=2)
+    try:
+        await world.step()
+        await world.step()
+    finally:
+        await world.stop_sharding()
+
+    assert world._executor is None, "Stopping should detach the executor"
+    for location in world.iter_locations():
+        pinger, listener = location.children
+        assert pinger.pings == 2, "Worker state should be collected back into the world"
+        assert sorted(listener.heard) == sorted(
+            [f"pinger-{index}" for index in range(4)] * 2
+        ), "Events should cross shards"
+        assert pinger.world is world, "Collected actors should be bound to the world"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_sharded_step_journals_and_coalesces_like_local_step(tmp_path):
+    world = TallyWorld()
+    for index in range(2):
+        location = Location(name=f"location-{index}", private=False)
+        world.add_location(location)
+        location.add_entity(Pinger(name=f"pinger-{index}"))
+    world.add_entity(Tallier())
+    world.add_entity(Tallier())
+    path = tmp_path / "events.journal"
+    world.enable_journal(path)
+    world.start_sharding(shard_count=2)
+    try:
+        await world.step()
+    finally:
+        await world.stop_sharding()
+        world.disable_journal()
+
+    assert world.tallies == [2], "Events handled by a sharded world should be coalesced"
+    with JournalReader(path) as reader:
+        names = sorted(
+            entry.event_type.rsplit(".", 1)[-1] for entry in reader.entries()
+        )
+    assert names == [
+        "PingEvent",
+        "PingEvent",
+        "TallyEvent",
+        "TallyEvent",
+    ], "Sharded ticks should be journaled"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_sharded_world_propagates_batch_actors_in_the_world():
+    world = build_world()
+    drones = [Drone(name=f"drone-{index}") for index in range(2)]
+    for drone in drones:
+        world.add_entity(drone)
+    world.start_sharding(shard_count=2)
+    try:
+        events = await world.step()
+    finally:
+        await world.stop_sharding()
+
+    senders = sorted(event.sender for _, event in events)
+    assert senders[:2] == [
+        "drone-0",
+        "drone-1",
+    ], "Batch actors placed in the world should produce under sharding"
+    assert not world._child_events, "Batched events should not be left behind"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_sharded_step_reports_a_dead_worker():
+    world = build_world()
+    executor = world.start_sharding(shard_count=1)
+    try:
+        process = executor._shards[0].process
+        process.kill()
+        process.join()
+        with pytest.raises(ShardError):
+            await world.step()
+    finally:
+        with pytest.raises(ShardError):
+            await world.stop_sharding(collect=False)
+
+    assert world._executor is None, "A failed stop should still detach the executor"
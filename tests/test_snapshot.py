@@ -0,0 +1,149 @@
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from relative_world.actor import Actor
+from relative_world.entity import Entity
+from relative_world.event import Event
+from relative_world.location import Location
+from relative_world.snapshot import SnapshotError, read_snapshot, write_snapshot
+from relative_world.world import RelativeWorld
+
+
+class NoteEvent(Event):
+    type: str = "NOTE"
+    text: str
+
+
+class Diarist(Actor):
+    notes: list[str] = []
+
+    async def act(self):
+        yield NoteEvent(text=f"{self.name} was here")
+
+
+async def remember(entity, event):
+    pass
+
+
+def build_world() -> tuple[RelativeWorld, Location, Location, Diarist]:
+    world = RelativeWorld(
+        name="World",
+        simulation_start_time=datetime(2000, 1, 1, tzinfo=timezone.utc),
+        tick_duration=timedelta(hours=1),
+    )
+    home = Location(name="home", private=False)
+    work = Location(name="work", private=False)
+    world.add_location(home)
+    world.add_location(work)
+    world.connect_locations(home.id, work.id)
+    diarist = Diarist(name="diarist", notes=["first"])
+    diarist.location = home
+    work.set_event_handler(NoteEvent, remember)
+    return world, home, work, diarist
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_snapshot_round_trip():
+    world, home, work, diarist = build_world()
+    await world.step()
+    diarist._propagation_queue.append((diarist, NoteEvent(text="queued")))
+    work.schedule_event(1, NoteEvent(text="scheduled"))
+
+    buffer = io.BytesIO()
+    world.save_snapshot(buffer)
+    buffer.seek(0)
+    restored = RelativeWorld.load_snapshot(buffer)
+
+    assert (
+        restored is not world and restored.id == world.id
+    ), "The world should be restored with its id"
+    assert (
+        restored.previous_iterations == 1 and restored.now == world.now
+    ), "The clock should be restored"
+    restored_home = restored.get_location(home.id)
+    restored_work = restored.get_location(work.id)
+    assert [location.id for location in restored.get_connected_locations(home.id)] == [
+        work.id
+    ], "Connections should be restored"
+    restored_diarist = await restored.find_by_id(diarist.id)
+    assert (
+        restored_diarist._parent is restored_home
+    ), "Children should be relinked to their parents"
+    assert (
+        restored_diarist.location is restored_home
+        and restored_diarist.world is restored
+    ), "Actors should resolve their location and world"
+    assert restored_diarist.notes == ["first"], "Fields should be restored"
+    source, event = restored_diarist._propagation_queue[0]
+    assert (
+        source is restored_diarist and event.text == "queued"
+    ), "Queued events should reference restored entities"
+    assert (
+        restored_work._event_handlers[NoteEvent] is remember
+    ), "Event handlers should be restored"
+    assert restored.is_subscribed(NoteEvent), "Subscriptions should be restored"
+
+    assert len(restored._timers) == 1, "Pending timers should be restored"
+    await restored.step()
+    assert restored.previous_iterations == 2, "A restored world should keep running"
+    await restored.step()
+    assert len(restored._timers) == 0, "Restored timers should fire on their tick"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_snapshot_stores_removed_entities_inline():
+    world, home, work, diarist = build_world()
+    diarist.schedule_event(1, NoteEvent(text="scheduled"))
+    home.remove_entity(diarist)
+
+    buffer = io.BytesIO()
+    world.save_snapshot(buffer)
+    buffer.seek(0)
+    restored = RelativeWorld.load_snapshot(buffer)
+
+    assert (
+        await restored.find_by_id(diarist.id) is None
+    ), "Removed entities should stay out of the tree"
+    [timer] = restored._timers.advance(restored.previous_iterations + 1)
+    removed = timer.callback.__self__
+    assert (
+        removed.id == diarist.id and removed._parent is None
+    ), "Removed entities should be restored detached"
+    timer.callback(*timer.args)
+    assert [event.text for _, event in removed._propagation_queue] == [
+        "scheduled"
+    ], "Their timers should still fire"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_snapshot_to_path(tmp_path):
+    world, *_ = build_world()
+    path = tmp_path / "world.snapshot"
+    write_snapshot(world, path)
+    restored = read_snapshot(path)
+    assert isinstance(restored, RelativeWorld), "The root should keep its class"
+    assert {location.id for location in restored.iter_locations()} == {
+        location.id for location in world.iter_locations()
+    }, "Every location should be restored"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_snapshot_spans_several_chunks():
+    root = Entity(
+        name="root", children=[Entity(name=f"entity-{index}") for index in range(3000)]
+    )
+    buffer = io.BytesIO()
+    write_snapshot(root, buffer)
+    buffer.seek(0)
+    restored = read_snapshot(buffer)
+    assert [child.name for child in restored.children] == [
+        child.name for child in root.children
+    ], "Children should keep their order"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_snapshot_rejects_other_files():
+    with pytest.raises(SnapshotError):
+        read_snapshot(io.BytesIO(b"not a snapshot"))
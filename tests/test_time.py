@@ -1,14 +1,22 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 from parameterized import parameterized
-from relative_world.time import time_as_relative_string, utcnow
+from relative_world.time import (
+    now,
+    simulation_time,
+    time_as_relative_string,
+    times_as_relative_strings,
+    utcnow,
+)
 
 
 @pytest.mark.asyncio(scope="session")
 async def test_utcnow_is_aware():
     """Test that utcnow returns an aware datetime object."""
     now = utcnow()
-    assert now.tzinfo is not None and now.tzinfo.utcoffset(now) is not None, "utcnow should return an aware datetime object"
+    assert (
+        now.tzinfo is not None and now.tzinfo.utcoffset(now) is not None
+    ), "utcnow should return an aware datetime object"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -33,19 +41,95 @@ async def test_utcnow_is_utc():
         (datetime.now() - timedelta(days=365), datetime.now(), "a year ago"),
         (datetime.now() - timedelta(days=365 * 5), datetime.now(), "5 years ago"),
         (datetime.now() + timedelta(seconds=10), datetime.now(), "in a few seconds"),
-        (datetime.now() + timedelta(minutes=1, seconds=1), datetime.now(), "in a minute"),
-        (datetime.now() + timedelta(minutes=5, seconds=1), datetime.now(), "in 5 minutes"),
+        (
+            datetime.now() + timedelta(minutes=1, seconds=1),
+            datetime.now(),
+            "in a minute",
+        ),
+        (
+            datetime.now() + timedelta(minutes=5, seconds=1),
+            datetime.now(),
+            "in 5 minutes",
+        ),
         (datetime.now() + timedelta(hours=1, seconds=1), datetime.now(), "in an hour"),
         (datetime.now() + timedelta(hours=5, seconds=1), datetime.now(), "in 5 hours"),
         (datetime.now() + timedelta(days=1, seconds=1), datetime.now(), "tomorrow"),
         (datetime.now() + timedelta(days=3, seconds=1), datetime.now(), "in 3 days"),
         (datetime.now() + timedelta(weeks=1, seconds=1), datetime.now(), "next week"),
-        (datetime.now() + timedelta(days=200, seconds=1), datetime.now(), "later this year"),
+        (
+            datetime.now() + timedelta(days=200, seconds=1),
+            datetime.now(),
+            "later this year",
+        ),
         (datetime.now() + timedelta(days=365, seconds=1), datetime.now(), "next year"),
-        (datetime.now() + timedelta(days=365 * 5, seconds=1), datetime.now(), "in 5 years"),
-    ]
+        (
+            datetime.now() + timedelta(days=365 * 5, seconds=1),
+            datetime.now(),
+            "in 5 years",
+        ),
+    ],
 )
 @pytest.mark.asyncio(scope="session")
 async def test_time_as_relative_string(start, end, expected):
     result = time_as_relative_string(start, end)
     assert result == expected, f"Expected '{expected}', but got '{result}'"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_now_uses_simulation_time():
+    moment = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    with simulation_time(moment):
+        assert now() == moment, "now should report the simulation time inside a tick"
+        assert (
+            time_as_relative_string(moment - timedelta(days=3)) == "3 days ago"
+        ), "Relative times should use the simulation time"
+    assert now() > moment, "now should fall back to the wall clock outside a tick"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_times_as_relative_strings_matches_scalar():
+    np = pytest.importorskip("numpy")
+    end = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    offsets = [
+        0,
+        59,
+        60,
+        119,
+        120,
+        3599,
+        3600,
+        7199,
+        7200,
+        86399,
+        86400,
+        172799,
+        172800,
+        604800,
+        2592000,
+        31536000,
+        63072000,
+        10**9,
+    ]
+    starts = [end - timedelta(seconds=offset) for offset in offsets] + [
+        end + timedelta(seconds=offset, microseconds=1) for offset in offsets
+    ]
+    expected = [time_as_relative_string(start, end) for start in starts]
+
+    assert (
+        times_as_relative_strings(starts, end) == expected
+    ), "Batches should format like the scalar function"
+    epochs = np.array([start.timestamp() for start in starts])
+    assert (
+        times_as_relative_strings(epochs, end.timestamp()) == expected
+    ), "Epoch seconds should be accepted"
+    naive = np.array(
+        [start.replace(tzinfo=None) for start in starts], dtype="datetime64[us]"
+    )
+    assert (
+        times_as_relative_strings(naive, [end.replace(tzinfo=None)] * len(starts))
+        == expected
+    ), "datetime64 arrays should be accepted"
+    with simulation_time(end):
+        assert (
+            times_as_relative_strings(starts[:3]) == expected[:3]
+        ), "End times should default to now"
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from relative_world.timers import SLOTS, TimerWheel
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_timers_fire_on_their_tick():
+    wheel = TimerWheel()
+    rng = random.Random(0)
+    dues = [
+        rng.choice(
+            [rng.randrange(SLOTS), rng.randrange(SLOTS**2), rng.randrange(SLOTS**2 * 8)]
+        )
+        for _ in range(2000)
+    ]
+    for index, due in enumerate(dues):
+        wheel.schedule(due, None, index)
+
+    fired = {}
+    tick = 0
+    while len(wheel):
+        last = tick + rng.choice([0, 0, 6, 300, 5000])
+        for timer in wheel.advance(last):
+            fired[timer.args[0]] = tick if timer.due <= tick else timer.due
+            assert (
+                tick <= timer.due <= last
+            ), "Timers should fire within the advanced range"
+        tick = last + 1
+    assert sorted(fired) == list(
+        range(len(dues))
+    ), "Every timer should fire exactly once"
+    assert all(
+        fired[index] == due for index, due in enumerate(dues)
+    ), "Timers should fire on their due tick"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_cancelled_timers_do_not_fire():
+    wheel = TimerWheel()
+    kept = wheel.schedule(5, None, "kept")
+    dropped = wheel.schedule(5, None, "dropped")
+    far = wheel.schedule(SLOTS**4 + 3, None, "far")
+    dropped.cancel()
+    dropped.cancel()
+    far.cancel()
+    assert (
+        len(wheel) == 1 and not dropped.pending and kept.pending
+    ), "Cancelling should remove timers once"
+    assert [timer.args[0] for timer in wheel.advance(10)] == [
+        "kept"
+    ], "Cancelled timers should not fire"
+    assert not kept.pending, "Fired timers should no longer be pending"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_timers_fire_in_scheduling_order():
+    wheel = TimerWheel()
+    wheel.schedule(SLOTS + 1, None, "cascaded")
+    wheel.advance(2)
+    wheel.schedule(SLOTS + 1, None, "direct")
+    wheel.schedule(1, None, "late")
+    assert [timer.args[0] for timer in wheel.advance(3)] == [
+        "late"
+    ], "Past ticks should fire on the next tick"
+    assert [timer.args[0] for timer in wheel.advance(SLOTS + 1)] == [
+        "cascaded",
+        "direct",
+    ], "Timers due together should fire in scheduling order"
@@ -1,4 +1,10 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from relative_world.actor import Actor
+from relative_world.event import Event
 from relative_world.world import RelativeWorld
 from relative_world.location import Location
 
@@ -6,7 +12,9 @@ from relative_world.location import Location
 @pytest.mark.asyncio(scope="session")
 async def test_initial_time_step():
     relative_world = RelativeWorld()
-    assert relative_world.previous_iterations == 0, "Initial previous_iterations should be 0"
+    assert (
+        relative_world.previous_iterations == 0
+    ), "Initial previous_iterations should be 0"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -14,7 +22,9 @@ async def test_update():
     relative_world = RelativeWorld()
     relative_world.previous_iterations = 0
     await relative_world.step()
-    assert relative_world.previous_iterations == 1, "Update should advance the simulation by one iteration"
+    assert (
+        relative_world.previous_iterations == 1
+    ), "Update should advance the simulation by one iteration"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -23,7 +33,9 @@ async def test_update_with_zero_time_step():
     relative_world.previous_iterations = 1
     async for _ in relative_world.update():
         pass
-    assert relative_world.previous_iterations == 2, "Update should still advance the simulation"
+    assert (
+        relative_world.previous_iterations == 2
+    ), "Update should still advance the simulation"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -31,7 +43,9 @@ async def test_update_with_negative_time_step():
     relative_world = RelativeWorld()
     async for _ in relative_world.update():
         pass
-    assert relative_world.previous_iterations == 1, "Update should still advance the simulation"
+    assert (
+        relative_world.previous_iterations == 1
+    ), "Update should still advance the simulation"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -39,7 +53,9 @@ async def test_add_location():
     relative_world = RelativeWorld()
     location = Location()
     relative_world.add_location(location)
-    assert location.id in relative_world._locations, "Location should be added to the world"
+    assert (
+        location.id in relative_world._locations
+    ), "Location should be added to the world"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -48,7 +64,9 @@ async def test_remove_location():
     location = Location()
     relative_world.add_location(location)
     relative_world.remove_location(location)
-    assert location.id not in relative_world._locations, "Location should be removed from the world"
+    assert (
+        location.id not in relative_world._locations
+    ), "Location should be removed from the world"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -59,8 +77,12 @@ async def test_connect_locations():
     relative_world.add_location(location_a)
     relative_world.add_location(location_b)
     relative_world.connect_locations(location_a.id, location_b.id)
-    assert location_b.id in relative_world._connections[location_a.id], "Locations should be connected"
-    assert location_a.id in relative_world._connections[location_b.id], "Locations should be connected"
+    assert (
+        location_b.id in relative_world._connections[location_a.id]
+    ), "Locations should be connected"
+    assert (
+        location_a.id in relative_world._connections[location_b.id]
+    ), "Locations should be connected"
 
 
 @pytest.mark.asyncio(scope="session")
@@ -82,3 +104,356 @@ async def test_iter_locations():
     relative_world.add_location(location)
     locations = [loc async for loc in relative_world.aiter_locations()]
     assert location in locations, "Should iterate over all locations in the world"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_find_by_id_uses_index_for_nested_entities():
+    relative_world = RelativeWorld()
+    location = Location()
+    relative_world.add_location(location)
+    room = Location()
+    location.add_entity(room)
+    actor = Actor()
+    room.add_entity(actor)
+    assert (
+        await relative_world.find_by_id(actor.id) is actor
+    ), "Nested entities should be indexed"
+    assert (
+        relative_world.get_location(room.id) is room
+    ), "Nested locations should be resolvable"
+    assert actor.world is relative_world, "Indexed actors should learn their world"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_remove_location_unindexes_subtree():
+    relative_world = RelativeWorld()
+    location = Location()
+    relative_world.add_location(location)
+    actor = Actor()
+    location.add_entity(actor)
+    relative_world.remove_location(location)
+    assert (
+        await relative_world.find_by_id(location.id) is None
+    ), "Removed location should be unindexed"
+    assert (
+        await relative_world.find_by_id(actor.id) is None
+    ), "Children of removed location should be unindexed"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_actor_move_keeps_single_parent():
+    relative_world = RelativeWorld()
+    location_a = Location()
+    location_b = Location()
+    relative_world.add_location(location_a)
+    relative_world.add_location(location_b)
+    actor = Actor()
+    location_a.add_actor(actor)
+    actor.location = location_b
+    assert actor not in location_a.children, "Actor should leave its previous location"
+    assert location_b.children == [
+        actor
+    ], "Actor should be added once to its new location"
+    assert (
+        await relative_world.find_by_id(actor.id) is actor
+    ), "Moved actor should remain indexed"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_find_many():
+    relative_world = RelativeWorld()
+    location = Location()
+    relative_world.add_location(location)
+    missing = uuid.uuid4()
+    found = await relative_world.find_many([location.id, missing, relative_world.id])
+    assert found == [
+        location,
+        None,
+        relative_world,
+    ], "find_many should resolve ids in order"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_reachable_locations_cache_invalidation():
+    relative_world = RelativeWorld()
+    a, b, c = Location(), Location(), Location()
+    for location in (a, b, c):
+        relative_world.add_location(location)
+    relative_world.connect_locations(a.id, b.id)
+    assert relative_world.get_reachable_locations(a.id, 2) == (a.id, b.id)
+
+    relative_world.connect_locations(b.id, c.id)
+    assert relative_world.get_reachable_locations(a.id, 2) == (
+        a.id,
+        b.id,
+        c.id,
+    ), "Connecting should invalidate the cache"
+
+    relative_world.remove_location(b)
+    assert relative_world.get_reachable_locations(a.id, 2) == (
+        a.id,
+    ), "Removing should invalidate the cache"
+    assert a.id not in relative_world._connections[c.id]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_interest_radius_limits_delivery():
+    class Shout(Event):
+        type: str = "SHOUT"
+        interest_radius: int | None = 1
+
+    class Shouter(Actor):
+        async def act(self):
+            yield Shout()
+
+    relative_world = RelativeWorld()
+    chain = [Location(private=False) for _ in range(4)]
+    for location in chain:
+        relative_world.add_location(location)
+    for left, right in zip(chain, chain[1:]):
+        relative_world.connect_locations(left.id, right.id)
+
+    heard = []
+    for location in chain:
+        listener = Actor()
+        location.add_entity(listener)
+
+        async def handler(entity, event, where=location):
+            heard.append(where)
+
+        listener.set_event_handler(Shout, handler)
+
+    overseer = Actor()
+    relative_world.add_entity(overseer)
+
+    async def oversee(entity, event):
+        heard.append(overseer)
+
+    overseer.set_event_handler(Shout, oversee)
+
+    chain[0].add_entity(Shouter())
+    await relative_world.step()
+    assert (
+        heard[:2] == chain[:2]
+    ), "Events should only reach locations within their interest radius"
+    assert heard[2:] == [
+        overseer
+    ], "Entities placed directly in the world should hear every radius"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_step_advances_simulation_clock():
+    class Ticker(Actor):
+        async def act(self):
+            yield Event(type="TICK")
+
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    world = RelativeWorld(simulation_start_time=start, tick_duration=timedelta(days=1))
+    ticker = Ticker()
+    world.add_entity(ticker)
+    stamps = []
+
+    async def record(source, event):
+        stamps.append(event.created_at)
+
+    world.set_event_handler(Event, record)
+
+    for _ in range(3):
+        await world.step()
+
+    assert world.previous_iterations == 3, "Each step should count one iteration"
+    assert world.now == start + timedelta(
+        days=3
+    ), "The clock should advance by one tick duration per step"
+    assert stamps == [
+        start,
+        start + timedelta(days=1),
+        start + timedelta(days=2),
+    ], "Events should be stamped with the tick's simulation time"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_time_scale_paces_steps():
+    world = RelativeWorld(tick_duration=timedelta(seconds=1), time_scale=50)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        await world.step()
+    assert (
+        loop.time() - started >= 0.035
+    ), "Paced steps should wait for the scaled tick duration"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_sleep_until_simulation_deadline():
+    class Clockwatcher(Actor):
+        acted: int = 0
+
+        async def act(self):
+            self.acted += 1
+            for _ in range(0):
+                yield
+
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    world = RelativeWorld(simulation_start_time=start, tick_duration=timedelta(hours=1))
+    watcher = Clockwatcher()
+    world.add_entity(watcher)
+    watcher.sleep(until=start + timedelta(hours=3))
+
+    for _ in range(3):
+        await world.step()
+    assert (
+        watcher.dormant and watcher.acted == 0
+    ), "Entities should sleep until their deadline"
+    await world.step()
+    assert (
+        not watcher.dormant and watcher.acted == 1
+    ), "Entities should wake on the tick of their deadline"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_scheduled_events_fire_on_their_tick():
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    world = RelativeWorld(simulation_start_time=start, tick_duration=timedelta(hours=1))
+    location = Location(private=False)
+    world.add_location(location)
+    received = []
+
+    async def record(source, event):
+        received.append((world.previous_iterations, event.type, event.created_at))
+
+    world.set_event_handler(Event, record)
+    location.schedule_event(timedelta(hours=3), Event(type="LATER"))
+    cancelled = location.schedule_event(2, Event(type="CANCELLED"))
+    calls = []
+    world.call_at(start + timedelta(minutes=90), calls.append, "called")
+    cancelled.cancel()
+
+    for _ in range(5):
+        await world.step()
+    assert calls == ["called"], "Callbacks should run once their time is reached"
+    assert [(tick, kind) for tick, kind, _ in received] == [
+        (3, "LATER")
+    ], "Scheduled events should propagate in their due tick only"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_location_graph_queries():
+    world = RelativeWorld()
+    a, b, c, d = Location(), Location(), Location(), Location()
+    for location in (a, b, c, d):
+        world.add_location(location)
+    world.connect_locations(a.id, b.id)
+    world.connect_locations(b.id, c.id)
+
+    assert world.get_shortest_path(a.id, c.id) == [
+        a.id,
+        b.id,
+        c.id,
+    ], "Shortest paths should follow connections"
+    assert (
+        world.get_distance(a.id, d.id) is None
+    ), "Unconnected locations should have no distance"
+    assert sorted(map(len, world.get_connected_components())) == [1, 3]
+    assert world.get_connected_locations(b.id) == [a, c]
+
+    world.connect_locations(c.id, d.id)
+    assert world.get_distance(a.id, d.id) == 3, "Connecting should update path queries"
+    assert world.get_connected_locations(c.id) == [
+        b,
+        d,
+    ], "Connecting should update neighbour lists"
+    world.remove_location(b)
+    assert (
+        world.get_shortest_path(a.id, c.id) is None
+    ), "Removing should update path queries"
+    assert (
+        world.get_connected_locations(a.id) == []
+    ), "Removing should update neighbour lists"
+
+
+class Metronome(Actor):
+    async def act(self):
+        yield Event(type="BEAT")
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_run_streams_top_level_events():
+    world = RelativeWorld()
+    metronome = Metronome()
+    world.add_entity(metronome)
+
+    events = [bound_event async for bound_event in world.run(ticks=3)]
+    assert [(source, event.type) for source, event in events] == [
+        (metronome, "BEAT")
+    ] * 3, "Every tick's events should be yielded"
+    assert (
+        world.previous_iterations == 3
+    ), "The run should stop after the requested ticks"
+
+    batches = [
+        (tick, len(batch))
+        async for tick, batch in world.run(
+            until=lambda w: w.previous_iterations == 5, batch=True
+        )
+    ]
+    assert batches == [
+        (3, 1),
+        (4, 1),
+    ], "Batches should pair each tick with its events until the stop condition holds"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_run_applies_backpressure():
+    world = RelativeWorld()
+    world.add_entity(Metronome())
+    stream = world.run(max_pending_ticks=2)
+    await anext(stream)
+    await asyncio.sleep(0.01)
+    assert (
+        world.previous_iterations <= 4
+    ), "The simulation should not run far ahead of a paused consumer"
+    await stream.aclose()
+    stopped_at = world.previous_iterations
+    await asyncio.sleep(0.01)
+    assert (
+        world.previous_iterations == stopped_at
+    ), "Closing the stream should stop the simulation"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_run_reraises_step_errors():
+    class Faulty(Actor):
+        async def act(self):
+            raise RuntimeError("broken")
+            yield
+
+    world = RelativeWorld()
+    world.add_entity(Faulty())
+    with pytest.raises(RuntimeError, match="broken"):
+        async for _ in world.run():
+            pass
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_children_appended_directly_act_every_tick():
+    world = RelativeWorld()
+    square = Location(name="square", private=False)
+    world.add_location(square)
+    metronome = Metronome()
+    square.children.append(metronome)
+    assert (
+        metronome._parent is square and world._entity_index[metronome.id] is metronome
+    ), "Appending to children should link the child into the world"
+
+    first, second = await world.step(), await world.step()
+    assert [source for source, _ in first + second] == [
+        metronome,
+        metronome,
+    ], "Appended actors should act every tick"
+
+    square.children.remove(metronome)
+    assert (
+        metronome._parent is None and metronome.id not in world._entity_index
+    ), "Removing should unlink the child"
+    assert await world.step() == [], "Removed actors should stop acting"